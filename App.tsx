@@ -7,6 +7,9 @@ import { Dashboard } from './pages/Dashboard';
 import { Login } from './pages/Login';
 import { AuthState, UserProfile, Product, CartItem } from './types';
 import { supabase, isSupabaseConfigured } from './services/supabaseClient';
+import { markOnce } from './services/perf';
+import { clearCachedProducts } from './services/productCache';
+import { fetchProfileRole } from './services/dataService';
 
 // --- Auth Context ---
 interface AuthContextType extends AuthState {
@@ -64,14 +67,8 @@ const AuthProvider = ({ children }: { children?: React.ReactNode }) => {
         if (session) {
           console.log("AuthProvider: Session found, fetching profile for:", session.user.id);
 
-          const { data: profile, error: profileError } = await supabase
-            .from('profiles')
-            .select('role')
-            .eq('id', session.user.id)
-            .maybeSingle();
-
-          if (profileError) console.error("AuthProvider: Profile fetch error:", profileError);
-          console.log("AuthProvider: Profile loaded:", profile);
+          const role = await fetchProfileRole(session.user.id);
+          console.log("AuthProvider: Profile loaded:", role);
 
           if (mounted) {
             console.log("AuthProvider: Setting authenticated state.");
@@ -79,7 +76,7 @@ const AuthProvider = ({ children }: { children?: React.ReactNode }) => {
               user: {
                 id: session.user.id,
                 email: session.user.email!,
-                role: profile?.role || 'employee'
+                role: role || 'employee'
               },
               isAuthenticated: true,
               loading: false
@@ -101,11 +98,11 @@ const AuthProvider = ({ children }: { children?: React.ReactNode }) => {
       if (!mounted) return;
 
       if (session) {
-        // We might need to refetch profile on sign in
-        const { data } = await supabase.from('profiles').select('role').eq('id', session.user.id).maybeSingle();
+        // We might need to refetch profile on sign in; shares the request with initializeAuth
+        const role = await fetchProfileRole(session.user.id);
 
         setState({
-          user: { id: session.user.id, email: session.user.email!, role: data?.role || 'employee' },
+          user: { id: session.user.id, email: session.user.email!, role: role || 'employee' },
           isAuthenticated: true,
           loading: false
         });
@@ -120,6 +117,10 @@ const AuthProvider = ({ children }: { children?: React.ReactNode }) => {
     };
   }, []);
 
+  useEffect(() => {
+    if (!state.loading) markOnce('auth:ready');
+  }, [state.loading]);
+
   // Mock Login Function for Demo purposes if no Supabase
   const signIn = async (role: 'admin' | 'employee') => {
     if (isSupabaseConfigured()) {
@@ -136,7 +137,7 @@ const AuthProvider = ({ children }: { children?: React.ReactNode }) => {
 
   const signOut = async () => {
     if (isSupabaseConfigured()) await supabase.auth.signOut();
-    sessionStorage.removeItem('products_cache'); // Clear cache on logout
+    await clearCachedProducts(); // Clear cache on logout
     setState({ user: null, isAuthenticated: false, loading: false });
   };
 
@@ -31,8 +31,7 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
         customer_name: customerInfo.name,
         customer_phone: customerInfo.phone,
         address: customerInfo.address,
-        items,
-        total
+        items
       });
       setStep('success');
       clearCart();
@@ -46,9 +45,9 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
   if (!isOpen) return null;
 
   return (
-    <div className="fixed inset-0 overflow-hidden z-50">
+    <div data-testid="cart-panel" data-step={step} className="fixed inset-0 overflow-hidden z-50">
       <div className="absolute inset-0 overflow-hidden">
-        <div className="absolute inset-0 bg-black/10 backdrop-blur-sm transition-opacity" onClick={onClose} />
+        <div data-testid="cart-backdrop" className="absolute inset-0 bg-black/10 backdrop-blur-sm transition-opacity" onClick={onClose} />
         <div className="fixed inset-y-0 right-0 pl-10 max-w-full flex">
           <div className="w-screen max-w-md">
             <div className="h-full flex flex-col bg-white shadow-xl overflow-y-scroll">
@@ -60,7 +59,7 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                     {step === 'cart' ? 'Carrito de Compras' : step === 'details' ? 'Datos del Pedido' : 'Pedido Confirmado'}
                   </h2>
                   <div className="ml-3 h-7 flex items-center">
-                    <button onClick={onClose} className="bg-white rounded-md text-gray-400 hover:text-gray-500">
+                    <button data-testid="cart-close" onClick={onClose} className="bg-white rounded-md text-gray-400 hover:text-gray-500">
                       <X className="h-6 w-6" />
                     </button>
                   </div>
@@ -69,7 +68,7 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                 {/* Content */}
                 <div className="mt-8">
                   {step === 'success' ? (
-                    <div className="text-center py-10">
+                    <div data-testid="order-success" className="text-center py-10">
                       <div className="mx-auto flex items-center justify-center h-12 w-12 rounded-full bg-green-100 mb-4">
                         <svg className="h-6 w-6 text-green-600" fill="none" viewBox="0 0 24 24" stroke="currentColor">
                           <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M5 13l4 4L19 7" />
@@ -78,6 +77,7 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                       <h3 className="text-lg font-medium text-gray-900">¡Pedido Enviado!</h3>
                       <p className="mt-2 text-sm text-gray-500">Gracias por tu compra. Empezaremos a prepararlo de inmediato.</p>
                       <button
+                        data-testid="order-success-close"
                         onClick={() => { setStep('cart'); onClose(); }}
                         className="mt-6 w-full flex justify-center py-2 px-4 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-orange-600 hover:bg-orange-700"
                       >
@@ -91,7 +91,7 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                       <div className="flow-root">
                         <ul className="-my-6 divide-y divide-gray-200">
                           {items.map((item) => (
-                            <li key={item.id} className="py-6 flex">
+                            <li key={item.id} data-testid="cart-item" data-product-id={item.id} data-product-name={item.name} className="py-6 flex">
                               <div className="flex-shrink-0 w-20 h-20 border border-gray-200 rounded-md overflow-hidden">
                                 <img src={item.image_url} alt={item.name} className="w-full h-full object-center object-cover" />
                               </div>
@@ -104,9 +104,9 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                                 </div>
                                 <div className="flex-1 flex items-end justify-between text-sm">
                                   <div className="flex items-center border border-gray-300 rounded-md">
-                                    <button onClick={() => updateQuantity(item.id, -1)} className="p-1 hover:bg-gray-100"><Minus className="w-4 h-4" /></button>
-                                    <span className="px-2">{item.quantity}</span>
-                                    <button onClick={() => updateQuantity(item.id, 1)} className="p-1 hover:bg-gray-100"><Plus className="w-4 h-4" /></button>
+                                    <button data-testid="cart-decrement" onClick={() => updateQuantity(item.id, -1)} className="p-1 hover:bg-gray-100"><Minus className="w-4 h-4" /></button>
+                                    <span data-testid="cart-quantity" className="px-2">{item.quantity}</span>
+                                    <button data-testid="cart-increment" onClick={() => updateQuantity(item.id, 1)} className="p-1 hover:bg-gray-100"><Plus className="w-4 h-4" /></button>
                                   </div>
                                 </div>
                               </div>
@@ -119,15 +119,15 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                     <form id="checkout-form" onSubmit={handleSubmit} className="space-y-4">
                       <div>
                         <label className="block text-sm font-medium text-gray-700">Nombre</label>
-                        <input required type="text" className="mt-1 block w-full border-gray-300 rounded-md shadow-sm p-2 border focus:ring-orange-500 focus:border-orange-500" value={customerInfo.name} onChange={e => setCustomerInfo({ ...customerInfo, name: e.target.value })} />
+                        <input required type="text" data-testid="checkout-name" className="mt-1 block w-full border-gray-300 rounded-md shadow-sm p-2 border focus:ring-orange-500 focus:border-orange-500" value={customerInfo.name} onChange={e => setCustomerInfo({ ...customerInfo, name: e.target.value })} />
                       </div>
                       <div>
                         <label className="block text-sm font-medium text-gray-700">Teléfono</label>
-                        <input required type="tel" className="mt-1 block w-full border-gray-300 rounded-md shadow-sm p-2 border focus:ring-orange-500 focus:border-orange-500" value={customerInfo.phone} onChange={e => setCustomerInfo({ ...customerInfo, phone: e.target.value })} />
+                        <input required type="tel" data-testid="checkout-phone" className="mt-1 block w-full border-gray-300 rounded-md shadow-sm p-2 border focus:ring-orange-500 focus:border-orange-500" value={customerInfo.phone} onChange={e => setCustomerInfo({ ...customerInfo, phone: e.target.value })} />
                       </div>
                       <div>
                         <label className="block text-sm font-medium text-gray-700">Dirección (Opcional)</label>
-                        <textarea rows={3} className="mt-1 block w-full border-gray-300 rounded-md shadow-sm p-2 border focus:ring-orange-500 focus:border-orange-500" value={customerInfo.address} onChange={e => setCustomerInfo({ ...customerInfo, address: e.target.value })} />
+                        <textarea rows={3} data-testid="checkout-address" className="mt-1 block w-full border-gray-300 rounded-md shadow-sm p-2 border focus:ring-orange-500 focus:border-orange-500" value={customerInfo.address} onChange={e => setCustomerInfo({ ...customerInfo, address: e.target.value })} />
                       </div>
                     </form>
                   )}
@@ -139,7 +139,7 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                 <div className="border-t border-gray-200 py-6 px-4 sm:px-6">
                   <div className="flex justify-between text-base font-medium text-gray-900">
                     <p>Subtotal</p>
-                    <p>{formatCurrency(total)}</p>
+                    <p data-testid="cart-subtotal">{formatCurrency(total)}</p>
                   </div>
                   <p className="mt-0.5 text-sm text-gray-500">Envío e impuestos calculados al finalizar.</p>
                   <div className="mt-6">
@@ -153,6 +153,7 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                         </div>
                       ) : (
                         <button
+                          data-testid="cart-checkout"
                           onClick={() => setStep('details')}
                           className="w-full flex justify-center items-center px-6 py-3 border border-transparent rounded-md shadow-sm text-base font-medium text-white bg-orange-600 hover:bg-orange-700"
                         >
@@ -163,6 +164,7 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                       <button
                         type="submit"
                         form="checkout-form"
+                        data-testid="checkout-submit"
                         disabled={isSubmitting}
                         className="w-full flex justify-center items-center px-6 py-3 border border-transparent rounded-md shadow-sm text-base font-medium text-white bg-green-600 hover:bg-green-700 disabled:opacity-50"
                       >
@@ -173,7 +175,7 @@ export const Cart: React.FC<CartProps> = ({ isOpen, onClose, items, updateQuanti
                   </div>
                   {step === 'details' && (
                     <div className="mt-2 text-center">
-                      <button onClick={() => setStep('cart')} className="text-sm text-orange-600 hover:text-orange-500">Volver al Carrito</button>
+                      <button data-testid="checkout-back" onClick={() => setStep('cart')} className="text-sm text-orange-600 hover:text-orange-500">Volver al Carrito</button>
                     </div>
                   )}
                 </div>
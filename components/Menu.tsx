@@ -1,8 +1,10 @@
 import React, { useEffect, useState } from 'react';
-import { Product, CartItem } from '../types';
-import { fetchProducts } from '../services/dataService';
+import { Product, CartItem, PublishedMenu } from '../types';
+import { fetchMenu } from '../services/dataService';
 import { Plus } from 'lucide-react';
 import { formatCurrency } from '../services/formatters';
+import { markOnce } from '../services/perf';
+import { onProductsChanged } from '../services/productCache';
 
 interface MenuProps {
   addToCart: (product: Product) => void;
@@ -15,13 +17,19 @@ export const Menu: React.FC<MenuProps> = ({ addToCart }) => {
   const [activeCategory, setActiveCategory] = useState<string>('Todos');
   const [error, setError] = useState<string | null>(null);
 
+  // El documento ya viene agrupado y ordenado por categoría
+  const showMenu = (menu: PublishedMenu) => {
+    setProducts(menu.categories.flatMap(c => c.products));
+    setCategories(['Todos', ...menu.categories.map(c => c.name)]);
+  };
+
   useEffect(() => {
+    markOnce('menu:mount');
     const loadData = async () => {
       try {
-        const data = await fetchProducts();
-        setProducts(data);
-        const cats = Array.from(new Set(data.map(p => p.category)));
-        setCategories(['Todos', ...cats]);
+        // Un solo GET cacheable del menú publicado; el navegador lo revalida con su ETag.
+        // Si se armó desde la copia local de productos, showMenu recibe también la revalidada
+        showMenu(await fetchMenu(showMenu));
       } catch (err: any) {
         console.error("Failed to load products:", err);
         setError(err.message || JSON.stringify(err));
@@ -30,8 +38,15 @@ export const Menu: React.FC<MenuProps> = ({ addToCart }) => {
       }
     };
     loadData();
+
+    // Un admin editó productos en otra pestaña y ya republicó el menú: se vuelve a pedir
+    return onProductsChanged(loadData);
   }, []);
 
+  useEffect(() => {
+    if (!loading && products.length > 0) markOnce('menu:products');
+  }, [loading, products]);
+
   const filteredProducts = activeCategory === 'Todos'
     ? products
     : products.filter(p => p.category === activeCategory);
@@ -66,6 +81,8 @@ export const Menu: React.FC<MenuProps> = ({ addToCart }) => {
           {categories.map(cat => (
             <button
               key={cat}
+              data-testid="menu-category"
+              data-category={cat}
               onClick={() => setActiveCategory(cat)}
               className={`px-4 py-2 rounded-full text-sm font-medium whitespace-nowrap transition-colors ${activeCategory === cat
                 ? 'bg-orange-600 text-white'
@@ -81,7 +98,12 @@ export const Menu: React.FC<MenuProps> = ({ addToCart }) => {
       {/* Product Grid */}
       <div className="grid grid-cols-1 gap-y-10 gap-x-6 sm:grid-cols-2 lg:grid-cols-3 xl:gap-x-8">
         {filteredProducts.map((product) => (
-          <div key={product.id} className="group relative bg-white border border-gray-200 rounded-2xl overflow-hidden shadow-sm hover:shadow-md transition-shadow">
+          <div
+            key={product.id}
+            data-testid="product-card"
+            data-product-id={product.id}
+            data-product-name={product.name}
+            className="group relative bg-white border border-gray-200 rounded-2xl overflow-hidden shadow-sm hover:shadow-md transition-shadow">
             <div className="aspect-w-3 aspect-h-2 bg-gray-200 group-hover:opacity-75 relative h-48 w-full overflow-hidden">
               <img
                 src={product.image_url || `https://picsum.photos/400/300?seed=${product.id}`}
@@ -103,6 +125,7 @@ export const Menu: React.FC<MenuProps> = ({ addToCart }) => {
               </div>
               <div className="mt-6">
                 <button
+                  data-testid="add-to-cart"
                   onClick={() => addToCart(product)}
                   className="w-full flex items-center justify-center px-4 py-2 border border-transparent rounded-md shadow-sm text-sm font-medium text-white bg-gray-900 hover:bg-gray-800 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-gray-900"
                 >
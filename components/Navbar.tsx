@@ -16,7 +16,7 @@ export const Navbar: React.FC<NavbarProps> = ({ toggleCart, cartCount = 0 }) =>
       <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
         <div className="flex justify-between h-16">
           <div className="flex items-center">
-            <Link to="/" className="flex-shrink-0 flex items-center gap-2">
+            <Link to="/" data-testid="nav-home" className="flex-shrink-0 flex items-center gap-2">
               <div className="bg-orange-500 p-1.5 rounded-lg">
                 <Coffee className="h-6 w-6 text-white" />
               </div>
@@ -29,7 +29,7 @@ export const Navbar: React.FC<NavbarProps> = ({ toggleCart, cartCount = 0 }) =>
                 </Link>
               )}
               {user && (
-                <Link to="/dashboard" className="border-transparent text-gray-500 hover:border-gray-300 hover:text-gray-700 inline-flex items-center px-1 pt-1 border-b-2 text-sm font-medium">
+                <Link to="/dashboard" data-testid="nav-dashboard" className="border-transparent text-gray-500 hover:border-gray-300 hover:text-gray-700 inline-flex items-center px-1 pt-1 border-b-2 text-sm font-medium">
                   Panel de Control
                 </Link>
               )}
@@ -38,12 +38,13 @@ export const Navbar: React.FC<NavbarProps> = ({ toggleCart, cartCount = 0 }) =>
           <div className="flex items-center gap-4">
             {!user && toggleCart && (
               <button
+                data-testid="nav-cart"
                 onClick={toggleCart}
                 className="relative p-2 text-gray-400 hover:text-gray-500"
               >
                 <ShoppingBag className="h-6 w-6" />
                 {cartCount > 0 && (
-                  <span className="absolute top-0 right-0 inline-flex items-center justify-center px-2 py-1 text-xs font-bold leading-none text-white transform translate-x-1/4 -translate-y-1/4 bg-orange-600 rounded-full">
+                  <span data-testid="nav-cart-count" className="absolute top-0 right-0 inline-flex items-center justify-center px-2 py-1 text-xs font-bold leading-none text-white transform translate-x-1/4 -translate-y-1/4 bg-orange-600 rounded-full">
                     {cartCount}
                   </span>
                 )}
@@ -57,6 +58,7 @@ export const Navbar: React.FC<NavbarProps> = ({ toggleCart, cartCount = 0 }) =>
             ) : (
               <Link
                 to="/login"
+                data-testid="nav-login"
                 className="inline-flex items-center px-4 py-2 border border-transparent text-sm font-medium rounded-md text-white bg-orange-600 hover:bg-orange-700 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-orange-500"
               >
                 Acceso Personal
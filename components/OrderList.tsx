@@ -1,19 +1,167 @@
-import React, { useEffect, useState } from 'react';
-import { Order, OrderStatus } from '../types';
-import { fetchOrders, updateOrderStatus } from '../services/dataService';
+import React, { memo, useCallback, useEffect, useMemo, useRef, useState } from 'react';
+import { Order, OrderCursor, OrderRow, OrderStatus, OrderSummary } from '../types';
+import { fetchOrderChanges, fetchOrderDetails, fetchOrderSummaries, fetchOrders, noteOrdersSeen, updateOrderStatus, updateOrdersStatus } from '../services/dataService';
+import { OrderState, emptyOrderState, fromOrders, selectStatusIds, countActive, applyOrderChanges, appendOrders, createBatcher } from '../services/orderStore';
 import { supabase } from '../services/supabaseClient';
-import { Clock, CheckCircle, Truck, Package, RefreshCw } from 'lucide-react';
+import { RealtimePostgresChangesPayload } from '@supabase/supabase-js';
+import { Clock, CheckCircle, Truck, Package, RefreshCw, ChevronDown, ChevronUp } from 'lucide-react';
 import { formatCurrency } from '../services/formatters';
+import { markOnce } from '../services/perf';
+import { useWindowedRows } from './useWindowedRows';
+
+type OrderChange = RealtimePostgresChangesPayload<{ [key: string]: any }>;
+
+const NEW_ORDER_SOUND = 'https://assets.mixkit.co/active_storage/sfx/2869/2869-preview.mp3';
+
+const STATUS_LABELS: Record<OrderStatus, string> = {
+  pending: 'PENDIENTE',
+  preparing: 'PREPARANDO',
+  ready: 'LISTO',
+  delivered: 'ENTREGADO'
+};
+
+const STATUS_COLORS: Record<OrderStatus, string> = {
+  pending: 'bg-yellow-100 text-yellow-800',
+  preparing: 'bg-blue-100 text-blue-800',
+  ready: 'bg-purple-100 text-purple-800',
+  delivered: 'bg-green-100 text-green-800'
+};
+
+// Secciones del tablero en el orden en que avanza un pedido; los entregados al final
+const SECTIONS: { status: OrderStatus; title: string }[] = [
+  { status: 'pending', title: 'Pendientes' },
+  { status: 'preparing', title: 'En preparación' },
+  { status: 'ready', title: 'Listos' },
+  { status: 'delivered', title: 'Entregados' }
+];
+
+// El tablero se virtualiza como una sola lista: encabezados de sección y pedidos
+type BoardItem =
+  | { kind: 'header'; key: string; status: OrderStatus; title: string; count: number }
+  | { kind: 'order'; key: string };
+
+// Alto aproximado de una tarjeta antes de medirla
+const ORDER_ROW_ESTIMATE = 190;
+
+// Tiempo máximo que se retiene el lote Realtime esperando el eco de un cambio en bloque
+const BULK_ECHO_WAIT_MS = 1500;
+
+// Siguiente paso de cada estado y el botón que lo dispara
+const NEXT_STEP: Partial<Record<OrderStatus, { status: OrderStatus; label: string; icon: React.ElementType; className: string }>> = {
+  pending: { status: 'preparing', label: 'Empezar Prep', icon: Package, className: 'bg-blue-600 hover:bg-blue-700' },
+  preparing: { status: 'ready', label: 'Marcar Listo', icon: CheckCircle, className: 'bg-purple-600 hover:bg-purple-700' },
+  ready: { status: 'delivered', label: 'Entregado', icon: Truck, className: 'bg-green-600 hover:bg-green-700' }
+};
+
+interface OrderRowProps {
+  order: OrderSummary;
+  detail?: Order;
+  expanded: boolean;
+  selected: boolean;
+  onAdvance: (id: string, status: OrderStatus) => void;
+  onToggleDetails: (id: string) => void;
+  onToggleSelect: (id: string) => void;
+}
+
+// Memoizada: una fila se vuelve a renderizar solo cuando cambia su propio pedido
+const OrderRow = memo(({ order, detail, expanded, selected, onAdvance, onToggleDetails, onToggleSelect }: OrderRowProps) => {
+  const next = NEXT_STEP[order.status];
+  return (
+    <div data-testid="order-row" data-order-id={order.id} data-status={order.status} data-selected={selected} className={`border rounded-lg p-4 hover:shadow-sm transition-shadow ${selected ? 'border-orange-400 bg-orange-50' : 'border-gray-200'}`}>
+      <div className="flex flex-col sm:flex-row justify-between sm:items-center gap-4">
+        <div>
+          <div className="flex items-center gap-2">
+            {next && (
+              <input
+                type="checkbox"
+                data-testid="order-select"
+                checked={selected}
+                onChange={() => onToggleSelect(order.id)}
+                aria-label={`Seleccionar pedido ${order.id.slice(0, 8)}`}
+                className="h-4 w-4 rounded border-gray-300 text-orange-600 focus:ring-orange-500"
+              />
+            )}
+            <span className="font-bold text-lg">#{order.id.slice(0, 8)}</span>
+            <span data-testid="order-status" className={`px-2.5 py-0.5 rounded-full text-xs font-medium ${STATUS_COLORS[order.status] || 'bg-gray-100 text-gray-800'} uppercase`}>
+              {STATUS_LABELS[order.status]}
+            </span>
+            <span className="text-xs text-gray-500">{new Date(order.created_at).toLocaleTimeString()}</span>
+          </div>
+          <div className="mt-1 text-sm text-gray-900 font-medium">{order.customer_name} ({order.customer_phone})</div>
+          {order.address && <div className="text-sm text-gray-500">{order.address}</div>}
+        </div>
+
+        <div className="flex items-center gap-2">
+          {next && (
+            <button data-testid="order-advance" data-next-status={next.status} onClick={() => onAdvance(order.id, next.status)} className={`flex items-center px-3 py-1.5 text-white text-xs font-medium rounded ${next.className}`}>
+              <next.icon className="w-3 h-3 mr-1" /> {next.label}
+            </button>
+          )}
+        </div>
+      </div>
+
+      <div className="mt-4 pt-4 border-t border-gray-100">
+        {expanded && detail ? (
+          <ul data-testid="order-details" className="text-sm text-gray-600 space-y-1">
+            {detail.items.map((item, idx) => (
+              <li key={idx} className="flex justify-between">
+                <span>{item.quantity}x {item.name}</span>
+                <span>{formatCurrency(item.price * item.quantity)}</span>
+              </li>
+            ))}
+          </ul>
+        ) : (
+          <ul className="text-sm text-gray-600 space-y-1">
+            {order.items.map((item, idx) => (
+              <li key={idx}>{item.quantity}x {item.name}</li>
+            ))}
+          </ul>
+        )}
+        <div className="mt-2 flex justify-between items-center">
+          <button data-testid="order-toggle-details" onClick={() => onToggleDetails(order.id)} className="flex items-center text-xs text-gray-500 hover:text-gray-700">
+            {expanded ? <ChevronUp className="w-3 h-3 mr-1" /> : <ChevronDown className="w-3 h-3 mr-1" />}
+            {expanded ? 'Ocultar detalle' : 'Ver detalle'}
+          </button>
+          <div className="font-bold text-gray-900">Total: {formatCurrency(order.total)}</div>
+        </div>
+      </div>
+    </div>
+  );
+});
 
 export const OrderList: React.FC = () => {
-  const [orders, setOrders] = useState<Order[]>([]);
+  const [orderState, setOrderState] = useState<OrderState>(emptyOrderState);
+  const orderStateRef = useRef(orderState);
+  orderStateRef.current = orderState;
+  // Detalle completo de los pedidos expandidos, cargado a demanda
+  const [details, setDetails] = useState<Record<string, Order>>({});
+  const detailsRef = useRef(details);
+  detailsRef.current = details;
+  const [expandedId, setExpandedId] = useState<string | null>(null);
   const [loading, setLoading] = useState(true);
+  // "Cargar anteriores" completa primero los activos y después pagina el historial de entregados
+  const [activeCursor, setActiveCursor] = useState<OrderCursor | null>(null);
+  const [historyCursor, setHistoryCursor] = useState<OrderCursor | null>(null);
+  const [historyStarted, setHistoryStarted] = useState(false);
+  const [loadingOlder, setLoadingOlder] = useState(false);
+  const syncing = useRef(false);
+  // Selección múltiple para avanzar varios pedidos con una sola petición
+  const [selected, setSelected] = useState<Set<string>>(() => new Set());
+  const [advancing, setAdvancing] = useState(false);
+  const batcherRef = useRef<ReturnType<typeof createBatcher<OrderChange>> | null>(null);
+  // Ids de un cambio en bloque cuyo UPDATE todavía no llegó por Realtime
+  const awaitingEcho = useRef(new Set<string>());
+
+  const hasOlder = activeCursor !== null || !historyStarted || historyCursor !== null;
 
   const loadOrders = async () => {
     setLoading(true);
     try {
-      const data = await fetchOrders();
-      setOrders(data);
+      const page = await fetchOrders();
+      setOrderState(fromOrders(page.orders));
+      setActiveCursor(page.nextCursor);
+      setHistoryCursor(null);
+      setHistoryStarted(false);
     } catch (e) {
       console.error(e);
     } finally {
@@ -21,11 +169,106 @@ export const OrderList: React.FC = () => {
     }
   };
 
+  const loadOlder = async () => {
+    setLoadingOlder(true);
+    try {
+      if (activeCursor) {
+        const page = await fetchOrders({ after: activeCursor });
+        setActiveCursor(page.nextCursor);
+        setOrderState(prev => appendOrders(prev, page.orders));
+      } else {
+        const page = await fetchOrders({ statuses: ['delivered'], after: historyCursor });
+        setHistoryStarted(true);
+        setHistoryCursor(page.nextCursor);
+        setOrderState(prev => appendOrders(prev, page.orders));
+      }
+    } catch (e) {
+      console.error(e);
+    } finally {
+      setLoadingOlder(false);
+    }
+  };
+
+  // Tras una reconexión o al volver a la pestaña: solo los pedidos que cambiaron
+  const resync = async () => {
+    if (syncing.current) return;
+    syncing.current = true;
+    try {
+      const changes = await fetchOrderChanges();
+      if (changes === null) {
+        await loadOrders();
+      } else {
+        setOrderState(prev => applyOrderChanges(prev, changes));
+      }
+    } finally {
+      syncing.current = false;
+    }
+  };
+
   useEffect(() => {
+    markOnce('orders:mount');
     loadOrders();
 
     // --- SUPABASE REALTIME ---
-    // Listen for changes in the 'orders' table
+    // Los eventos se acumulan y se aplican juntos: una ráfaga es un solo render
+    const batcher = createBatcher<OrderChange>((changes) => {
+      // Si se entrega el lote, la espera del eco terminó (llegó completo o venció)
+      awaitingEcho.current.clear();
+      const rows: OrderRow[] = [];
+      const removed: string[] = [];
+      let inserted = false;
+
+      for (const payload of changes) {
+        if (payload.eventType === 'DELETE') {
+          if (payload.old.id) removed.push(payload.old.id);
+          continue;
+        }
+        if (payload.eventType === 'INSERT') inserted = true;
+        rows.push(payload.new as OrderRow);
+      }
+
+      // El evento trae solo la fila de orders: los pedidos conocidos conservan
+      // sus líneas y los nuevos se piden juntos a order_items
+      noteOrdersSeen(rows);
+      const known = orderStateRef.current.byId;
+      const unknownIds = rows.filter(r => !known[r.id] && r.status !== 'delivered').map(r => r.id);
+      setOrderState(prev => applyOrderChanges(
+        prev,
+        rows.filter(r => prev.byId[r.id]).map(r => ({ ...r, items: prev.byId[r.id].items })),
+        removed
+      ));
+      if (unknownIds.length > 0) {
+        fetchOrderSummaries(unknownIds).then(fresh => {
+          // Si mientras tanto llegó una versión más nueva por Realtime, se queda esa
+          setOrderState(prev => applyOrderChanges(
+            prev,
+            fresh.filter(o => !prev.byId[o.id] || (o.updated_at ?? '') >= (prev.byId[o.id].updated_at ?? ''))
+          ));
+        });
+      }
+      // Los pedidos expandidos guardan el detalle completo: se refresca con la última versión
+      setDetails(prev => {
+        const stale = rows.filter(r => prev[r.id]);
+        if (stale.length === 0) return prev;
+        const next = { ...prev };
+        stale.forEach(r => { next[r.id] = { ...prev[r.id], ...r }; });
+        return next;
+      });
+
+      if (inserted) {
+        // Un solo aviso por lote, aunque hayan entrado varios pedidos
+        try {
+          const audio = new Audio(NEW_ORDER_SOUND);
+          audio.volume = 0.5;
+          audio.play().catch(e => console.warn("Audio autoplay blocked by browser:", e));
+        } catch (err) {
+          console.error("Audio error:", err);
+        }
+      }
+    });
+    batcherRef.current = batcher;
+
+    let subscribedOnce = false;
     const channel = supabase
       .channel('schema-db-changes')
       .on(
@@ -36,117 +279,210 @@ export const OrderList: React.FC = () => {
           table: 'orders'
         },
         (payload) => {
-          console.log('Realtime change received!', payload);
-
-          if (payload.eventType === 'INSERT') {
-            // New order! Add to top of list
-            const newOrder = payload.new as Order;
-            setOrders(prev => [newOrder, ...prev]);
-
-            // Play notification sound (optional/browser-safe)
-            try {
-              const audio = new Audio('https://assets.mixkit.co/active_storage/sfx/2869/2869-preview.mp3');
-              audio.volume = 0.5;
-              audio.play().catch(e => console.warn("Audio autoplay blocked by browser:", e));
-            } catch (err) {
-              console.error("Audio error:", err);
-            }
-          } else if (payload.eventType === 'UPDATE') {
-            // Update existing order status in state
-            const updatedOrder = payload.new as Order;
-            setOrders(prev => prev.map(o => o.id === updatedOrder.id ? updatedOrder : o));
-          } else if (payload.eventType === 'DELETE') {
-            // Remove deleted order
-            setOrders(prev => prev.filter(o => o.id !== payload.old.id));
-          }
+          batcher.push(payload);
+          // El eco de un cambio en bloque se aplica junto, cuando llegó el último
+          const id = (payload.new as Partial<Order>).id;
+          if (id && awaitingEcho.current.delete(id) && awaitingEcho.current.size === 0) batcher.release();
         }
       )
-      .subscribe();
+      .subscribe((status) => {
+        if (status !== 'SUBSCRIBED') return;
+        // realtime-js vuelve a unirse al canal después de un corte; lo perdido se recupera por delta
+        if (subscribedOnce) resync();
+        subscribedOnce = true;
+      });
+
+    const handleVisibility = () => {
+      if (document.visibilityState === 'visible') resync();
+    };
+    document.addEventListener('visibilitychange', handleVisibility);
+    window.addEventListener('online', resync);
 
     return () => {
+      batcher.cancel();
+      batcherRef.current = null;
       supabase.removeChannel(channel);
+      document.removeEventListener('visibilitychange', handleVisibility);
+      window.removeEventListener('online', resync);
     };
   }, []);
 
-  const handleStatusChange = async (id: string, newStatus: OrderStatus) => {
+  useEffect(() => {
+    if (!loading) markOnce('orders:ready');
+  }, [loading]);
+
+  // Callbacks estables para que las filas memoizadas no se rendericen de nuevo
+  const handleStatusChange = useCallback(async (id: string, newStatus: OrderStatus) => {
     // Note: No need for optimistic update here because Realtime will sync back the DB change!
     // But we'll keep it for snappy UI.
-    setOrders(prev => prev.map(o => o.id === id ? { ...o, status: newStatus } : o));
-    await updateOrderStatus(id, newStatus);
+    const from = orderStateRef.current.byId[id]?.status;
+    setOrderState(prev => prev.byId[id] ? applyOrderChanges(prev, [{ ...prev.byId[id], status: newStatus }]) : prev);
+    try {
+      await updateOrderStatus(id, newStatus);
+    } catch {
+      // El servidor lo rechazó: el pedido vuelve a su estado anterior
+      if (from) setOrderState(prev => prev.byId[id] ? applyOrderChanges(prev, [{ ...prev.byId[id], status: from }]) : prev);
+      alert('No se pudo actualizar el pedido. Intenta de nuevo.');
+    }
+  }, []);
+
+  const toggleDetails = useCallback(async (id: string) => {
+    setExpandedId(prev => prev === id ? null : id);
+    if (!detailsRef.current[id]) {
+      const order = await fetchOrderDetails(id);
+      if (order) setDetails(prev => ({ ...prev, [id]: order }));
+    }
+  }, []);
+
+  const toggleSelect = useCallback((id: string) => {
+    setSelected(prev => {
+      const next = new Set(prev);
+      if (!next.delete(id)) next.add(id);
+      return next;
+    });
+  }, []);
+
+  const toggleSection = (status: OrderStatus) => {
+    const ids = selectStatusIds(orderState, status);
+    setSelected(prev => {
+      const next = new Set(prev);
+      if (ids.every(id => prev.has(id))) ids.forEach(id => next.delete(id));
+      else ids.forEach(id => next.add(id));
+      return next;
+    });
   };
 
-  const getStatusColor = (status: OrderStatus) => {
-    switch (status) {
-      case 'pending': return 'bg-yellow-100 text-yellow-800';
-      case 'preparing': return 'bg-blue-100 text-blue-800';
-      case 'ready': return 'bg-purple-100 text-purple-800';
-      case 'delivered': return 'bg-green-100 text-green-800';
-      default: return 'bg-gray-100 text-gray-800';
+  // Solo cuentan los seleccionados que siguen en la lista y tienen un paso siguiente
+  const selectedOrders = useMemo(
+    () => Array.from(selected).map(id => orderState.byId[id]).filter((o): o is OrderSummary => Boolean(o && NEXT_STEP[o.status])),
+    [selected, orderState.byId]
+  );
+
+  const advanceSelected = async () => {
+    // Una petición por estado de origen (a lo sumo tres), cada una con in('id', ids)
+    const groups = new Map<OrderStatus, string[]>();
+    selectedOrders.forEach(o => groups.set(o.status, [...(groups.get(o.status) || []), o.id]));
+    const ids = selectedOrders.map(o => o.id);
+    setSelected(new Set());
+    setAdvancing(true);
+
+    setOrderState(prev => applyOrderChanges(
+      prev,
+      Array.from(groups).flatMap(([from, groupIds]) =>
+        groupIds.filter(id => prev.byId[id]).map(id => ({ ...prev.byId[id], status: NEXT_STEP[from]!.status }))
+      )
+    ));
+
+    const batcher = batcherRef.current;
+    ids.forEach(id => awaitingEcho.current.add(id));
+    batcher?.hold(BULK_ECHO_WAIT_MS);
+    try {
+      const entries = Array.from(groups);
+      const results = await Promise.allSettled(
+        entries.map(([from, groupIds]) => updateOrdersStatus(groupIds, from, NEXT_STEP[from]!.status))
+      );
+      const changed = new Set(results.flatMap(r => (r.status === 'fulfilled' ? r.value : [])));
+      ids.forEach(id => { if (!changed.has(id)) awaitingEcho.current.delete(id); });
+      if (awaitingEcho.current.size === 0) batcher?.release();
+
+      // Los grupos que el servidor rechazó vuelven a su estado anterior
+      const failed = entries.filter((_, i) => results[i].status === 'rejected');
+      if (failed.length > 0) {
+        setOrderState(prev => applyOrderChanges(
+          prev,
+          failed.flatMap(([from, groupIds]) =>
+            groupIds.filter(id => prev.byId[id]).map(id => ({ ...prev.byId[id], status: from }))
+          )
+        ));
+        const count = failed.reduce((sum, [, groupIds]) => sum + groupIds.length, 0);
+        alert(`No se pudieron actualizar ${count} pedido(s). Intenta de nuevo.`);
+      }
+      // Otro empleado movió alguno antes: se trae su estado real
+      else if (changed.size < ids.length) resync();
+    } finally {
+      setAdvancing(false);
     }
   };
 
-  if (loading && orders.length === 0) return <div className="p-8 text-center text-gray-500">Cargando pedidos...</div>;
+  const board = useMemo(() => {
+    const items: BoardItem[] = [];
+    for (const { status, title } of SECTIONS) {
+      const ids = selectStatusIds(orderState, status);
+      if (ids.length === 0) continue;
+      items.push({ kind: 'header', key: `section-${status}`, status, title, count: ids.length });
+      ids.forEach(id => items.push({ kind: 'order', key: id }));
+    }
+    return items;
+  }, [orderState.byStatus]);
+  const boardKeys = useMemo(() => board.map(item => item.key), [board]);
+  const { containerRef, start, end, padTop, padBottom } = useWindowedRows<HTMLDivElement>(boardKeys, ORDER_ROW_ESTIMATE);
+
+  if (loading && orderState.ids.length === 0) return <div className="p-8 text-center text-gray-500">Cargando pedidos...</div>;
 
   return (
     <div className="p-6">
       <div className="flex justify-between items-center mb-6">
         <h2 className="text-lg font-medium text-gray-900">Pedidos Entrantes</h2>
-        <button onClick={loadOrders} className="p-2 text-gray-400 hover:text-gray-600">
+        <button data-testid="orders-refresh" onClick={loadOrders} className="p-2 text-gray-400 hover:text-gray-600">
           <RefreshCw className="w-5 h-5" />
         </button>
       </div>
 
-      <div className="space-y-4">
-        {orders.length === 0 ? <p className="text-gray-500">No hay pedidos activos.</p> : orders.map((order) => (
-          <div key={order.id} className="border border-gray-200 rounded-lg p-4 hover:shadow-sm transition-shadow">
-            <div className="flex flex-col sm:flex-row justify-between sm:items-center gap-4">
-              <div>
-                <div className="flex items-center gap-2">
-                  <span className="font-bold text-lg">#{order.id.slice(0, 8)}</span>
-                  <span className={`px-2.5 py-0.5 rounded-full text-xs font-medium ${getStatusColor(order.status)} uppercase`}>
-                    {order.status === 'pending' ? 'PENDIENTE' :
-                      order.status === 'preparing' ? 'PREPARANDO' :
-                        order.status === 'ready' ? 'LISTO' : 'ENTREGADO'}
-                  </span>
-                  <span className="text-xs text-gray-500">{new Date(order.created_at).toLocaleTimeString()}</span>
-                </div>
-                <div className="mt-1 text-sm text-gray-900 font-medium">{order.customer_name} ({order.customer_phone})</div>
-                {order.address && <div className="text-sm text-gray-500">{order.address}</div>}
-              </div>
-
-              <div className="flex items-center gap-2">
-                {order.status === 'pending' && (
-                  <button onClick={() => handleStatusChange(order.id, 'preparing')} className="flex items-center px-3 py-1.5 bg-blue-600 text-white text-xs font-medium rounded hover:bg-blue-700">
-                    <Package className="w-3 h-3 mr-1" /> Empezar Prep
-                  </button>
-                )}
-                {order.status === 'preparing' && (
-                  <button onClick={() => handleStatusChange(order.id, 'ready')} className="flex items-center px-3 py-1.5 bg-purple-600 text-white text-xs font-medium rounded hover:bg-purple-700">
-                    <CheckCircle className="w-3 h-3 mr-1" /> Marcar Listo
-                  </button>
-                )}
-                {order.status === 'ready' && (
-                  <button onClick={() => handleStatusChange(order.id, 'delivered')} className="flex items-center px-3 py-1.5 bg-green-600 text-white text-xs font-medium rounded hover:bg-green-700">
-                    <Truck className="w-3 h-3 mr-1" /> Entregado
-                  </button>
-                )}
-              </div>
-            </div>
-
-            <div className="mt-4 pt-4 border-t border-gray-100">
-              <ul className="text-sm text-gray-600 space-y-1">
-                {order.items.map((item, idx) => (
-                  <li key={idx} className="flex justify-between">
-                    <span>{item.quantity}x {item.name}</span>
-                    <span>{formatCurrency(item.price * item.quantity)}</span>
-                  </li>
-                ))}
-              </ul>
-              <div className="mt-2 text-right font-bold text-gray-900">Total: {formatCurrency(order.total)}</div>
-            </div>
+      {countActive(orderState) === 0 && <p className="text-gray-500">No hay pedidos activos.</p>}
+
+      {/* El anclaje de scroll lo maneja useWindowedRows; el del navegador competiría con él */}
+      <div ref={containerRef} style={{ overflowAnchor: 'none' }}>
+        <div style={{ height: padTop }} />
+        {board.slice(start, end).map(item => item.kind === 'header' ? (
+          <h3 key={item.key} data-row-key={item.key} data-testid="orders-section" data-status={item.status} className="pt-4 pb-4 flex items-center gap-2 text-sm font-medium text-gray-500 uppercase">
+            {NEXT_STEP[item.status] && (
+              <input
+                type="checkbox"
+                data-testid="orders-select-section"
+                data-status={item.status}
+                checked={selectStatusIds(orderState, item.status).every(id => selected.has(id))}
+                onChange={() => toggleSection(item.status)}
+                aria-label={`Seleccionar todos: ${item.title}`}
+                className="h-4 w-4 rounded border-gray-300 text-orange-600 focus:ring-orange-500"
+              />
+            )}
+            {item.title} ({item.count})
+          </h3>
+        ) : (
+          <div key={item.key} data-row-key={item.key} className="pb-4">
+            <OrderRow
+              order={orderState.byId[item.key]}
+              detail={details[item.key]}
+              expanded={expandedId === item.key}
+              selected={selected.has(item.key)}
+              onAdvance={handleStatusChange}
+              onToggleDetails={toggleDetails}
+              onToggleSelect={toggleSelect}
+            />
           </div>
         ))}
+        <div style={{ height: padBottom }} />
       </div>
+
+      {hasOlder && (
+        <div className="mt-6 text-center">
+          <button data-testid="orders-load-older" onClick={loadOlder} disabled={loadingOlder} className="px-4 py-2 text-sm font-medium text-gray-600 border border-gray-300 rounded-md hover:bg-gray-50 disabled:opacity-50">
+            {loadingOlder ? 'Cargando...' : activeCursor ? 'Cargar más pedidos activos' : 'Cargar pedidos anteriores'}
+          </button>
+        </div>
+      )}
+
+      {selectedOrders.length > 0 && (
+        <div data-testid="orders-bulk-bar" className="fixed bottom-6 left-1/2 -translate-x-1/2 z-20 flex items-center gap-4 rounded-lg bg-gray-900 px-4 py-3 text-white shadow-lg">
+          <span data-testid="orders-bulk-count" className="text-sm">{selectedOrders.length} seleccionados</span>
+          <button data-testid="orders-bulk-clear" onClick={() => setSelected(new Set())} className="px-3 py-1.5 text-xs font-medium rounded border border-gray-600 hover:bg-gray-800">
+            Quitar selección
+          </button>
+          <button data-testid="orders-bulk-advance" onClick={advanceSelected} disabled={advancing} className="px-3 py-1.5 text-xs font-medium rounded bg-orange-600 hover:bg-orange-700 disabled:opacity-50">
+            Avanzar al siguiente estado
+          </button>
+        </div>
+      )}
     </div>
   );
 };
\ No newline at end of file
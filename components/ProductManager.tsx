@@ -1,11 +1,15 @@
-import React, { useEffect, useState, useRef } from 'react';
-import { Product } from '../types';
-import { fetchProducts, createProduct, deleteProduct, updateProduct, uploadProductImage } from '../services/dataService';
+import React, { useEffect, useMemo, useState, useRef } from 'react';
+import { ProductSummary } from '../types';
+import { fetchProductSummaries, fetchProduct, createProduct, deleteProduct, updateProduct, uploadProductImage, ensureMenuPublished, MenuPublishError } from '../services/dataService';
 import { Trash2, Plus, Loader2, Edit, Upload, X } from 'lucide-react';
 import { formatCurrency } from '../services/formatters';
+import { useWindowedRows } from './useWindowedRows';
+
+// Alto de una fila de la tabla (miniatura de 40px más el padding)
+const PRODUCT_ROW_HEIGHT = 73;
 
 export const ProductManager: React.FC = () => {
-  const [productos, setProducts] = useState<Product[]>([]);
+  const [productos, setProducts] = useState<ProductSummary[]>([]);
   const [isEditing, setIsEditing] = useState(false);
   const [editingId, setEditingId] = useState<string | null>(null);
   const [loading, setLoading] = useState(false);
@@ -16,11 +20,17 @@ export const ProductManager: React.FC = () => {
   const [formData, setFormData] = useState(initialFormState);
 
   const loadProducts = async () => {
-    const data = await fetchProducts();
+    const data = await fetchProductSummaries();
     setProducts(data);
   };
 
-  useEffect(() => { loadProducts(); }, []);
+  useEffect(() => {
+    loadProducts();
+    ensureMenuPublished(); // Republica el menú si quedó viejo (p. ej. cambios hechos fuera de la app)
+  }, []);
+
+  const productKeys = useMemo(() => productos.map(p => p.id), [productos]);
+  const { containerRef, start, end, padTop, padBottom } = useWindowedRows<HTMLTableSectionElement>(productKeys, PRODUCT_ROW_HEIGHT);
 
 
   const handleImageUpload = async (e: React.ChangeEvent<HTMLInputElement>) => {
@@ -38,7 +48,13 @@ export const ProductManager: React.FC = () => {
     setUploadingImage(false);
   };
 
-  const handleEditClick = (product: Product) => {
+  // La lista no trae la descripción: se pide el producto completo al editar
+  const handleEditClick = async (id: string) => {
+    const product = await fetchProduct(id);
+    if (!product) {
+      alert('No se pudo cargar el producto.');
+      return;
+    }
     setFormData({
       name: product.name,
       description: product.description,
@@ -46,7 +62,7 @@ export const ProductManager: React.FC = () => {
       category: product.category,
       image_url: product.image_url || ''
     });
-    setEditingId(product.id);
+    setEditingId(id);
     setIsEditing(true);
   };
 
@@ -77,7 +93,14 @@ export const ProductManager: React.FC = () => {
       await loadProducts();
     } catch (err) {
       console.error(err);
-      alert("Failed to save product.");
+      if (err instanceof MenuPublishError) {
+        // El producto sí se guardó: se cierra el formulario y se avisa que falta publicar
+        handleCancel();
+        await loadProducts();
+        alert(err.message);
+      } else {
+        alert("Failed to save product.");
+      }
     } finally {
       setLoading(false);
     }
@@ -85,7 +108,12 @@ export const ProductManager: React.FC = () => {
 
   const handleDelete = async (id: string) => {
     if (confirm('Are you sure you want to delete this product?')) {
-      await deleteProduct(id);
+      try {
+        await deleteProduct(id);
+      } catch (err) {
+        console.error(err);
+        alert(err instanceof MenuPublishError ? err.message : 'No se pudo eliminar el producto.');
+      }
       loadProducts();
     }
   }
@@ -182,14 +210,15 @@ export const ProductManager: React.FC = () => {
               <th className="px-6 py-3 text-right text-xs font-medium text-gray-500 uppercase tracking-wider">Acciones</th>
             </tr>
           </thead>
-          <tbody className="bg-white divide-y divide-gray-200">
-            {productos.map((product) => (
-              <tr key={product.id}>
+          <tbody ref={containerRef} className="bg-white divide-y divide-gray-200" style={{ overflowAnchor: 'none' }}>
+            {padTop > 0 && <tr aria-hidden="true" style={{ height: padTop }}><td colSpan={4} /></tr>}
+            {productos.slice(start, end).map((product) => (
+              <tr key={product.id} data-row-key={product.id}>
                 <td className="px-6 py-4 whitespace-nowrap">
                   <div className="flex items-center">
                     <div className="h-10 w-10 flex-shrink-0">
                       {product.image_url ? (
-                        <img className="h-10 w-10 rounded-full object-cover" src={product.image_url} alt="" />
+                        <img className="h-10 w-10 rounded-full object-cover" src={product.image_url} alt="" loading="lazy" decoding="async" />
                       ) : (
                         <div className="h-10 w-10 rounded-full bg-gray-100 flex items-center justify-center text-gray-400">
                           <span className="text-xs">Sin Foto</span>
@@ -204,7 +233,7 @@ export const ProductManager: React.FC = () => {
                 <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{product.category}</td>
                 <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">{formatCurrency(product.price)}</td>
                 <td className="px-6 py-4 whitespace-nowrap text-right text-sm font-medium">
-                  <button onClick={() => handleEditClick(product)} className="text-blue-600 hover:text-blue-900 mr-4" title="Editar">
+                  <button onClick={() => handleEditClick(product.id)} className="text-blue-600 hover:text-blue-900 mr-4" title="Editar">
                     <Edit className="w-4 h-4" />
                   </button>
                   <button onClick={() => handleDelete(product.id)} className="text-red-600 hover:text-red-900" title="Eliminar">
@@ -213,6 +242,7 @@ export const ProductManager: React.FC = () => {
                 </td>
               </tr>
             ))}
+            {padBottom > 0 && <tr aria-hidden="true" style={{ height: padBottom }}><td colSpan={4} /></tr>}
           </tbody>
         </table>
       </div>
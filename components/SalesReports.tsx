@@ -0,0 +1,186 @@
+import React, { useEffect, useMemo, useState } from 'react';
+import { DailySales, SalesReport } from '../types';
+import { fetchSalesReport } from '../services/dataService';
+import { BarChart3, Clock, Loader2, Receipt, TrendingUp } from 'lucide-react';
+import { formatCurrency } from '../services/formatters';
+
+const RANGES = [
+  { days: 7, label: '7 días' },
+  { days: 30, label: '30 días' },
+  { days: 90, label: '90 días' },
+  { days: 365, label: '1 año' }
+];
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// El reporte trae solo los días con ventas; el gráfico muestra también los vacíos
+const fillDays = (report: SalesReport) => {
+  const byDay = new Map(report.daily.map(d => [d.day, d]));
+  const days: DailySales[] = [];
+  for (let t = Date.parse(report.from); t <= Date.parse(report.to); t += DAY_MS) {
+    const day = new Date(t).toISOString().slice(0, 10);
+    days.push(byDay.get(day) || { day, orders: 0, revenue: 0 });
+  }
+  return days;
+};
+
+const fillHours = (report: SalesReport) => {
+  const byHour = new Map(report.hourly.map(h => [h.hour, h]));
+  return Array.from({ length: 24 }, (_, hour) => byHour.get(hour) || { hour, orders: 0, revenue: 0 });
+};
+
+// Alto (o ancho) de una barra en % del máximo; lo que no es cero siempre se ve
+const barSize = (value: number, max: number) => `${max > 0 ? Math.max((value / max) * 100, value > 0 ? 2 : 0) : 0}%`;
+
+export const SalesReports: React.FC = () => {
+  const [days, setDays] = useState(30);
+  const [report, setReport] = useState<SalesReport | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [failed, setFailed] = useState(false);
+
+  useEffect(() => {
+    let cancelled = false; // Evita que una respuesta lenta pise la del rango elegido después
+    setLoading(true);
+    fetchSalesReport(days).then(data => {
+      if (cancelled) return;
+      setReport(data);
+      setFailed(data === null);
+      setLoading(false);
+    });
+    return () => { cancelled = true; };
+  }, [days]);
+
+  const daily = useMemo(() => (report ? fillDays(report) : []), [report]);
+  const hourly = useMemo(() => (report ? fillHours(report) : []), [report]);
+
+  const revenue = daily.reduce((sum, d) => sum + d.revenue, 0);
+  const orders = daily.reduce((sum, d) => sum + d.orders, 0);
+  const maxDayRevenue = Math.max(0, ...daily.map(d => d.revenue));
+  const maxHourOrders = Math.max(0, ...hourly.map(h => h.orders));
+  const maxUnits = Math.max(0, ...(report?.products || []).map(p => p.units));
+
+  return (
+    <div className="p-6">
+      <div className="flex flex-wrap justify-between items-center gap-4 mb-6">
+        <h2 className="text-lg font-medium text-gray-900">Reportes de Ventas</h2>
+        <div className="flex rounded-md border border-gray-200 overflow-hidden">
+          {RANGES.map(range => (
+            <button
+              key={range.days}
+              data-testid="reports-range"
+              data-days={range.days}
+              data-active={range.days === days}
+              onClick={() => setDays(range.days)}
+              className={`px-3 py-1.5 text-sm font-medium transition ${range.days === days ? 'bg-orange-600 text-white' : 'bg-white text-gray-600 hover:bg-gray-50'}`}
+            >
+              {range.label}
+            </button>
+          ))}
+        </div>
+      </div>
+
+      {loading && !report ? (
+        <div className="py-20 text-center text-gray-500">
+          <Loader2 className="w-6 h-6 animate-spin mx-auto mb-2" />
+          Cargando reportes...
+        </div>
+      ) : failed || !report ? (
+        <div className="py-20 text-center text-gray-500">No se pudieron cargar los reportes.</div>
+      ) : (
+        <div className={`space-y-8 transition-opacity ${loading ? 'opacity-50' : ''}`}>
+          <div className="grid grid-cols-1 sm:grid-cols-3 gap-4">
+            <div className="p-4 rounded-lg border border-gray-100 bg-gray-50">
+              <div className="text-sm text-gray-500 flex items-center gap-2"><TrendingUp className="w-4 h-4" /> Ingresos</div>
+              <div data-testid="reports-revenue" className="mt-1 text-2xl font-bold text-gray-900">{formatCurrency(revenue)}</div>
+            </div>
+            <div className="p-4 rounded-lg border border-gray-100 bg-gray-50">
+              <div className="text-sm text-gray-500 flex items-center gap-2"><Receipt className="w-4 h-4" /> Pedidos</div>
+              <div data-testid="reports-orders" className="mt-1 text-2xl font-bold text-gray-900">{orders}</div>
+            </div>
+            <div className="p-4 rounded-lg border border-gray-100 bg-gray-50">
+              <div className="text-sm text-gray-500 flex items-center gap-2"><BarChart3 className="w-4 h-4" /> Ticket promedio</div>
+              <div data-testid="reports-average" className="mt-1 text-2xl font-bold text-gray-900">
+                {formatCurrency(orders > 0 ? revenue / orders : 0)}
+              </div>
+            </div>
+          </div>
+
+          <section>
+            <h3 className="text-sm font-semibold text-gray-700 mb-3">Ingresos por día</h3>
+            <div data-testid="reports-daily" className="h-40 flex items-end gap-px border-b border-gray-200">
+              {daily.map(d => (
+                <div
+                  key={d.day}
+                  data-testid="reports-day"
+                  data-day={d.day}
+                  className="flex-1 min-w-0 bg-orange-400 hover:bg-orange-600 rounded-t-sm"
+                  style={{ height: barSize(d.revenue, maxDayRevenue) }}
+                  title={`${d.day}: ${formatCurrency(d.revenue)} (${d.orders} pedidos)`}
+                />
+              ))}
+            </div>
+            <div className="flex justify-between text-xs text-gray-400 mt-1">
+              <span>{report.from}</span>
+              <span>{report.to}</span>
+            </div>
+          </section>
+
+          <section>
+            <h3 className="text-sm font-semibold text-gray-700 mb-3 flex items-center gap-2">
+              <Clock className="w-4 h-4" /> Pedidos por hora
+              <span data-testid="reports-timezone" className="font-normal text-gray-400">({report.timezone})</span>
+            </h3>
+            <div data-testid="reports-hourly" className="h-32 flex items-end gap-1 border-b border-gray-200">
+              {hourly.map(h => (
+                <div
+                  key={h.hour}
+                  data-testid="reports-hour"
+                  data-hour={h.hour}
+                  className="flex-1 bg-gray-700 hover:bg-gray-900 rounded-t-sm"
+                  style={{ height: barSize(h.orders, maxHourOrders) }}
+                  title={`${String(h.hour).padStart(2, '0')}:00 - ${h.orders} pedidos, ${formatCurrency(h.revenue)}`}
+                />
+              ))}
+            </div>
+            <div className="flex justify-between text-xs text-gray-400 mt-1">
+              <span>00 h</span>
+              <span>12 h</span>
+              <span>23 h</span>
+            </div>
+          </section>
+
+          <section>
+            <h3 className="text-sm font-semibold text-gray-700 mb-3">Productos más vendidos</h3>
+            {report.products.length === 0 ? (
+              <div className="py-6 text-center text-gray-500 text-sm">No hay ventas en este período.</div>
+            ) : (
+              <table data-testid="reports-products" className="min-w-full divide-y divide-gray-200">
+                <thead className="bg-gray-50">
+                  <tr>
+                    <th className="px-4 py-2 text-left text-xs font-medium text-gray-500 uppercase tracking-wider">Producto</th>
+                    <th className="px-4 py-2 text-left text-xs font-medium text-gray-500 uppercase tracking-wider w-1/3">Unidades</th>
+                    <th className="px-4 py-2 text-right text-xs font-medium text-gray-500 uppercase tracking-wider">Ingresos</th>
+                  </tr>
+                </thead>
+                <tbody className="bg-white divide-y divide-gray-200">
+                  {report.products.map(p => (
+                    <tr key={p.name} data-testid="reports-product" data-product-name={p.name}>
+                      <td className="px-4 py-2 text-sm font-medium text-gray-900">{p.name}</td>
+                      <td className="px-4 py-2 text-sm text-gray-700">
+                        <div className="flex items-center gap-2">
+                          <div className="h-2 bg-orange-400 rounded" style={{ width: barSize(p.units, maxUnits) }} />
+                          <span>{p.units}</span>
+                        </div>
+                      </td>
+                      <td className="px-4 py-2 text-sm text-gray-700 text-right">{formatCurrency(p.revenue)}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            )}
+          </section>
+        </div>
+      )}
+    </div>
+  );
+};
@@ -0,0 +1,118 @@
+import { useCallback, useEffect, useLayoutEffect, useRef, useState } from 'react';
+
+/**
+ * Renderizado por ventana para listas que se desplazan con la página.
+ * Solo se montan las filas cercanas al viewport; las demás se reemplazan por
+ * dos espaciadores (`padTop` / `padBottom`) con la altura que ocuparían.
+ *
+ * Cada fila renderizada debe llevar `data-row-key={key}`: se mide después de
+ * cada render y la altura queda guardada por clave, así una inserción no
+ * invalida las medidas del resto. Si el usuario está desplazado dentro de la
+ * lista, la fila que tenía arriba de todo se mantiene en el mismo lugar cuando
+ * entran filas nuevas por encima (p. ej. pedidos por Realtime).
+ */
+export const useWindowedRows = <E extends HTMLElement>(keys: string[], estimateHeight: number, overscanPx = 800) => {
+  const containerRef = useRef<E>(null);
+  const heights = useRef(new Map<string, number>());
+  const anchor = useRef<{ key: string; top: number } | null>(null);
+  const [viewport, setViewport] = useState({ top: 0, height: typeof window === 'undefined' ? 800 : window.innerHeight });
+  const [, setMeasured] = useState(0);
+
+  // Primera fila visible y su posición en pantalla, para anclar el scroll
+  const recordAnchor = useCallback(() => {
+    const container = containerRef.current;
+    if (!container || container.getBoundingClientRect().top >= 0) {
+      anchor.current = null;
+      return;
+    }
+    const rows = container.querySelectorAll<HTMLElement>('[data-row-key]');
+    for (const row of Array.from(rows)) {
+      const rect = row.getBoundingClientRect();
+      if (rect.bottom > 0) {
+        anchor.current = { key: row.dataset.rowKey!, top: rect.top };
+        return;
+      }
+    }
+    anchor.current = null;
+  }, []);
+
+  useEffect(() => {
+    let frame: number | null = null;
+    const update = () => {
+      frame = null;
+      const container = containerRef.current;
+      if (!container) return;
+      setViewport({ top: -container.getBoundingClientRect().top, height: window.innerHeight });
+      recordAnchor();
+    };
+    const schedule = () => {
+      if (frame === null) frame = requestAnimationFrame(update);
+    };
+    update();
+    window.addEventListener('scroll', schedule, { passive: true });
+    window.addEventListener('resize', schedule);
+    return () => {
+      if (frame !== null) cancelAnimationFrame(frame);
+      window.removeEventListener('scroll', schedule);
+      window.removeEventListener('resize', schedule);
+    };
+  }, [recordAnchor]);
+
+  // Desplazamiento acumulado de cada fila según las alturas conocidas
+  const offsets = new Array<number>(keys.length + 1);
+  offsets[0] = 0;
+  for (let i = 0; i < keys.length; i++) {
+    offsets[i + 1] = offsets[i] + (heights.current.get(keys[i]) ?? estimateHeight);
+  }
+  const total = offsets[keys.length];
+
+  // Búsqueda binaria: primer índice cuyo borde inferior (o superior) supera `y`
+  const firstEndingAfter = (y: number) => {
+    let lo = 0, hi = keys.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (offsets[mid + 1] > y) hi = mid; else lo = mid + 1;
+    }
+    return lo;
+  };
+  const firstStartingAfter = (y: number) => {
+    let lo = 0, hi = keys.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (offsets[mid] >= y) hi = mid; else lo = mid + 1;
+    }
+    return lo;
+  };
+
+  const start = firstEndingAfter(viewport.top - overscanPx);
+  const end = Math.max(start, firstStartingAfter(viewport.top + viewport.height + overscanPx));
+
+  useLayoutEffect(() => {
+    const container = containerRef.current;
+    if (!container) return;
+
+    let changed = false;
+    container.querySelectorAll<HTMLElement>('[data-row-key]').forEach(row => {
+      const key = row.dataset.rowKey!;
+      const height = row.offsetHeight;
+      if (heights.current.get(key) !== height) {
+        heights.current.set(key, height);
+        changed = true;
+      }
+    });
+
+    const pinned = anchor.current;
+    if (pinned) {
+      const row = container.querySelector<HTMLElement>(`[data-row-key="${CSS.escape(pinned.key)}"]`);
+      if (row) {
+        const delta = row.getBoundingClientRect().top - pinned.top;
+        if (Math.abs(delta) >= 1) window.scrollBy(0, delta);
+      }
+    }
+
+    // Las alturas reales cambian los espaciadores: otro render con las medidas nuevas
+    if (changed) setMeasured(n => n + 1);
+  });
+
+  return { containerRef, start, end, padTop: offsets[start], padBottom: total - offsets[end] };
+};
@@ -3,13 +3,14 @@ import { useAuth } from '../App';
 import { OrderList } from '../components/OrderList';
 import { ProductManager } from '../components/ProductManager';
 import { EmployeeManager } from '../components/EmployeeManager';
-import { LayoutDashboard, ShoppingBag, UtensilsCrossed, Users, LogOut } from 'lucide-react';
+import { SalesReports } from '../components/SalesReports';
+import { LayoutDashboard, ShoppingBag, UtensilsCrossed, Users, BarChart3, LogOut } from 'lucide-react';
 import { useNavigate } from 'react-router-dom';
 
 export const Dashboard: React.FC = () => {
   const { user, signOut } = useAuth();
   const navigate = useNavigate();
-  const [activeTab, setActiveTab] = useState<'orders' | 'products' | 'employees'>('orders');
+  const [activeTab, setActiveTab] = useState<'orders' | 'products' | 'employees' | 'reports'>('orders');
 
   const handleSignOut = async () => {
     await signOut();
@@ -30,13 +31,14 @@ export const Dashboard: React.FC = () => {
               </h1>
             </div>
             <div className="flex items-center gap-4">
-              <span className="text-sm text-gray-500">
+              <span data-testid="dashboard-role" className="text-sm text-gray-500">
                 {user.role === 'admin' ? 'Administrador' : 'Empleado'}
               </span>
               <div className="h-8 w-8 bg-orange-100 rounded-full flex items-center justify-center text-orange-700 font-bold">
                 {user.email[0].toUpperCase()}
               </div>
               <button
+                data-testid="dashboard-sign-out"
                 onClick={handleSignOut}
                 className="p-2 rounded-md text-gray-400 hover:text-gray-500 hover:bg-gray-100 transition-colors"
                 title="Cerrar Sesión"
@@ -49,6 +51,8 @@ export const Dashboard: React.FC = () => {
           {/* Tabs Navigation */}
           <div className="flex space-x-8 -mb-px overflow-x-auto">
             <button
+              data-testid="dashboard-tab"
+              data-tab="orders"
               onClick={() => setActiveTab('orders')}
               className={`${activeTab === 'orders'
                 ? 'border-orange-500 text-orange-600'
@@ -62,6 +66,8 @@ export const Dashboard: React.FC = () => {
             {user.role === 'admin' && (
               <>
                 <button
+                  data-testid="dashboard-tab"
+                  data-tab="products"
                   onClick={() => setActiveTab('products')}
                   className={`${activeTab === 'products'
                     ? 'border-orange-500 text-orange-600'
@@ -73,6 +79,8 @@ export const Dashboard: React.FC = () => {
                 </button>
 
                 <button
+                  data-testid="dashboard-tab"
+                  data-tab="employees"
                   onClick={() => setActiveTab('employees')}
                   className={`${activeTab === 'employees'
                     ? 'border-orange-500 text-orange-600'
@@ -82,6 +90,19 @@ export const Dashboard: React.FC = () => {
                   <Users className="w-4 h-4" />
                   Gestión de Empleados
                 </button>
+
+                <button
+                  data-testid="dashboard-tab"
+                  data-tab="reports"
+                  onClick={() => setActiveTab('reports')}
+                  className={`${activeTab === 'reports'
+                    ? 'border-orange-500 text-orange-600'
+                    : 'border-transparent text-gray-500 hover:text-gray-700 hover:border-gray-300'
+                    } whitespace-nowrap py-4 px-1 border-b-2 font-medium text-sm flex items-center gap-2 transition-colors`}
+                >
+                  <BarChart3 className="w-4 h-4" />
+                  Reportes
+                </button>
               </>
             )}
           </div>
@@ -95,8 +116,10 @@ export const Dashboard: React.FC = () => {
             <OrderList />
           ) : activeTab === 'products' ? (
             user.role === 'admin' ? <ProductManager /> : <div className="p-12 text-center text-gray-500">No tienes permisos.</div>
-          ) : (
+          ) : activeTab === 'employees' ? (
             user.role === 'admin' ? <EmployeeManager /> : <div className="p-12 text-center text-gray-500">No tienes permisos.</div>
+          ) : (
+            user.role === 'admin' ? <SalesReports /> : <div className="p-12 text-center text-gray-500">No tienes permisos.</div>
           )}
         </div>
       </div>
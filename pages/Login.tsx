@@ -26,7 +26,8 @@ export const Login: React.FC = () => {
           <p className="mt-2 text-sm text-gray-500">Inicia sesión para gestionar los pedidos</p>
         </div>
 
-        <div className="mt-8">
+        {/* Auth UI no acepta data-testid: el contenedor marca el formulario para los tests. */}
+        <div className="mt-8" data-testid="login-form">
           <Auth
             supabaseClient={supabase}
             appearance={{
@@ -1,7 +1,8 @@
 import { supabase, isSupabaseConfigured, SUPABASE_URL, SUPABASE_ANON_KEY } from './supabaseClient';
-import { Product, Order, OrderStatus, UserProfile } from '../types';
+import { Product, ProductSummary, PublishedMenu, Order, OrderSummary, OrderStatus, OrderCursor, OrderPage, NewOrder, PlacedOrder, Role, UserProfile, SalesReport } from '../types';
 import { createClient } from '@supabase/supabase-js';
 import { MOCK_PRODUCTS, MOCK_ORDERS } from './mockData';
+import { readCachedProducts, writeCachedProducts, clearCachedProducts, broadcastProductsChanged } from './productCache';
 
 // Simple in-memory store for the session (Mock Mode fallback)
 let mockOrdersStore = [...MOCK_ORDERS];
@@ -23,52 +24,253 @@ const logError = (context: string, error: any) => {
   }
 };
 
+// --- Request Coalescing ---
+
+const inFlight = new Map<string, Promise<unknown>>();
+const recent = new Map<string, { value: unknown; expires: number }>();
+
+/**
+ * Comparte una petición entre todas las llamadas con la misma clave mientras
+ * está en curso (Menu, ProductManager y AuthProvider piden lo mismo a la vez
+ * al iniciar). Con `ttlMs` el resultado además se reutiliza ese tiempo. Los
+ * errores no se guardan, ni los rechazos ni las respuestas `{ data, error }`
+ * de supabase-js con `error`: la próxima llamada vuelve a intentar.
+ * El resultado es compartido; quien lo recibe no debe mutarlo.
+ */
+export const dedupe = <T>(key: string, run: () => PromiseLike<T>, ttlMs = 0): Promise<T> => {
+  const hit = recent.get(key);
+  if (hit) {
+    if (hit.expires > Date.now()) return Promise.resolve(hit.value as T);
+    recent.delete(key); // Vencido: no queda ocupando memoria
+  }
+
+  const pending = inFlight.get(key);
+  if (pending) return pending as Promise<T>;
+
+  const promise = Promise.resolve(run())
+    .then(value => {
+      const failed = (value as { error?: unknown } | null)?.error != null;
+      if (ttlMs > 0 && !failed) {
+        const now = Date.now();
+        // Las claves que no se vuelven a pedir (p. ej. el perfil de otro usuario) se barren aquí
+        for (const [other, entry] of recent) if (entry.expires <= now) recent.delete(other);
+        recent.set(key, { value, expires: now + ttlMs });
+      }
+      return value;
+    })
+    .finally(() => inFlight.delete(key));
+  inFlight.set(key, promise);
+  return promise;
+};
+
 // --- Products ---
 
-const CACHE_KEY = 'products_cache';
-const CACHE_DURATION = 5 * 60 * 1000; // 5 minutes
+// 12s Timeout race
+const withTimeout = <T>(promise: PromiseLike<T>, ms = 12000): Promise<T> => {
+  const timeoutPromise = new Promise<never>((_, reject) => setTimeout(() => reject(new Error('Request timed out')), ms));
+  return Promise.race([Promise.resolve(promise), timeoutPromise]);
+};
+
+// Versión del catálogo: un entero que un trigger incrementa con cada cambio en products
+const fetchCatalogVersion = async (): Promise<number | null> => {
+  const { data, error } = await dedupe('catalog_version', () =>
+    supabase.from('catalog_versions').select('version').eq('name', 'products').maybeSingle()
+  );
+  if (error) throw error;
+  return data ? Number(data.version) : null;
+};
 
-export const fetchProducts = async (): Promise<Product[]> => {
-  // Check Cache
-  const cached = sessionStorage.getItem(CACHE_KEY);
+const fetchAndCacheProducts = (): Promise<Product[]> => dedupe('products:active', async () => {
+  // La versión se lee antes que los productos: si cambian en el medio, la próxima revalidación lo detecta
+  const version = await fetchCatalogVersion().catch(() => null);
+  const { data, error } = await withTimeout(
+    supabase.from('products').select('*').eq('active', true).order('category').order('name')
+  );
+  if (error) throw error;
+  const products = (data || []) as Product[];
+  await writeCachedProducts(products, version);
+  return products;
+});
+
+// Revalida en segundo plano; devuelve los productos nuevos solo si cambió la versión
+const revalidateProducts = async (cachedVersion: number | null): Promise<Product[] | null> => {
+  try {
+    const version = await fetchCatalogVersion();
+    if (version !== null && version === cachedVersion) return null;
+    return await fetchAndCacheProducts();
+  } catch (err) {
+    logError('Supabase revalidateProducts', err);
+    return null;
+  }
+};
+
+/**
+ * Stale-while-revalidate: si hay una copia en IndexedDB se devuelve al
+ * instante y se compara la versión del catálogo en segundo plano; cuando
+ * cambió, `onUpdate` recibe la lista nueva. Sin copia, espera a la red.
+ */
+export const fetchProducts = async (onUpdate?: (products: Product[]) => void): Promise<Product[]> => {
+  if (!isSupabaseConfigured()) return mockProductsStore;
+
+  const cached = await readCachedProducts();
   if (cached) {
-    const { data, timestamp } = JSON.parse(cached);
-    if (Date.now() - timestamp < CACHE_DURATION) {
-      console.log('Serving products from cache');
-      return data;
-    }
+    console.log('Serving products from cache');
+    revalidateProducts(cached.version).then(fresh => {
+      if (fresh && onUpdate) onUpdate(fresh);
+    });
+    return cached.products;
   }
 
-  if (isSupabaseConfigured()) {
-    try {
-      // 12s Timeout race
-      const timeoutPromise = new Promise((_, reject) => setTimeout(() => reject(new Error('Request timed out')), 12000));
-      const dataPromise = supabase.from('products').select('*').eq('active', true);
+  try {
+    return await fetchAndCacheProducts();
+  } catch (err) {
+    logError('Supabase fetchProducts', err);
+    return []; // NEVER fall back to mock if Supabase is active
+  }
+};
 
-      const result = await Promise.race([dataPromise, timeoutPromise]) as any;
-      const { data, error } = result;
+// --- Published Menu ---
 
-      if (error) throw error;
+const MENU_BUCKET = 'menu';
+const MENU_PATH = 'menu.json';
+
+// Misma forma que menu_document: categorías por nombre y productos por nombre dentro de cada una
+const groupMenu = (products: Product[], version: number | null): PublishedMenu => {
+  const byCategory = new Map<string, Product[]>();
+  for (const product of products.filter(p => p.active)) {
+    byCategory.set(product.category, [...(byCategory.get(product.category) || []), product]);
+  }
+  return {
+    version,
+    published_at: new Date().toISOString(),
+    categories: [...byCategory.keys()].sort().map(name => ({
+      name,
+      products: byCategory.get(name)!.sort((a, b) => a.name.localeCompare(b.name))
+    }))
+  };
+};
+
+/**
+ * Publica el menú como un único JSON en el bucket público `menu`. Lo arma
+ * menu_document en la base y se sube con max-age=0: el navegador guarda la
+ * copia pero la revalida con su ETag en cada visita (304 si no cambió).
+ */
+export const publishMenu = async (): Promise<void> => {
+  const { data, error } = await supabase.rpc('menu_document');
+  if (error) throw error;
+  const { error: uploadError } = await supabase.storage
+    .from(MENU_BUCKET)
+    .upload(MENU_PATH, new Blob([JSON.stringify(data)], { type: 'application/json' }), {
+      upsert: true,
+      contentType: 'application/json',
+      cacheControl: '0'
+    });
+  if (uploadError) throw uploadError;
+};
+
+// El documento publicado, o null si todavía no hay ninguno
+const fetchPublishedMenu = (): Promise<PublishedMenu | null> => dedupe('menu', async () => {
+  const { publicUrl } = supabase.storage.from(MENU_BUCKET).getPublicUrl(MENU_PATH).data;
+  // no-cache: usa la copia del navegador solo después de revalidarla (If-None-Match)
+  const response = await withTimeout(fetch(publicUrl, { cache: 'no-cache' }));
+  if (response.status === 400 || response.status === 404) return null; // Storage responde 400 a veces para "not found"
+  if (!response.ok) throw new Error(`Menu document: HTTP ${response.status}`);
+  return (await response.json()) as PublishedMenu;
+});
+
+/**
+ * Menú público: un solo GET del documento publicado, sin consultar la base.
+ * Si todavía no se publicó (o Storage falla) se arma desde products; si eso
+ * salió de la copia en IndexedDB, `onUpdate` recibe el menú revalidado.
+ */
+export const fetchMenu = async (onUpdate?: (menu: PublishedMenu) => void): Promise<PublishedMenu> => {
+  if (!isSupabaseConfigured()) return groupMenu(mockProductsStore, null);
+  try {
+    const menu = await fetchPublishedMenu();
+    if (menu) return menu;
+  } catch (err) {
+    logError('Supabase fetchMenu', err);
+  }
+  return groupMenu(await fetchProducts(onUpdate && (products => onUpdate(groupMenu(products, null)))), null);
+};
+
+/**
+ * Vuelve a publicar si el documento no corresponde a la versión actual del
+ * catálogo, p. ej. tras cambios hechos fuera de la app. Lo llama la gestión de
+ * productos al abrirse, así que basta con que un admin entre.
+ */
+export const ensureMenuPublished = async (): Promise<void> => {
+  if (!isSupabaseConfigured()) return;
+  try {
+    const [version, published] = await Promise.all([fetchCatalogVersion(), fetchPublishedMenu()]);
+    if (published && published.version === version) return;
+    await publishMenu();
+  } catch (err) {
+    logError('Supabase ensureMenuPublished', err);
+  }
+};
 
-      // Update Cache
-      sessionStorage.setItem(CACHE_KEY, JSON.stringify({
-        data: data || [],
-        timestamp: Date.now()
-      }));
+// El cambio en products quedó guardado, pero el menú publicado sigue siendo el anterior
+export class MenuPublishError extends Error {
+  constructor() {
+    super('El producto se guardó, pero no se pudo publicar el menú: los clientes siguen viendo el anterior. Recarga la página para reintentarlo.');
+    this.name = 'MenuPublishError';
+  }
+}
 
-      return (data || []) as Product[];
+/**
+ * Tras un cambio de un admin: se borra la copia local, se publica el menú
+ * (con un reintento) y recién entonces se avisa a las otras pestañas. Si no
+ * se pudo publicar no se avisa, porque releerían el menú viejo, y el error
+ * llega al admin.
+ */
+const invalidateProductCache = async () => {
+  await clearCachedProducts();
+  try {
+    await publishMenu().catch(() => publishMenu());
+  } catch (err) {
+    logError('Supabase publishMenu', err);
+    throw new MenuPublishError();
+  }
+  broadcastProductsChanged();
+};
+
+const PRODUCT_SUMMARY_COLUMNS = 'id, name, price, category, image_url';
+
+// Tabla de administración: solo lo que muestra cada fila
+export const fetchProductSummaries = async (): Promise<ProductSummary[]> => {
+  if (isSupabaseConfigured()) {
+    try {
+      const { data, error } = await dedupe('products:summary', () =>
+        supabase.from('products').select(PRODUCT_SUMMARY_COLUMNS).eq('active', true).order('category').order('name')
+      );
+      if (error) throw error;
+      return (data || []) as ProductSummary[];
     } catch (err) {
-      logError('Supabase fetchProducts', err);
-      // Fallback to cache if available even if expired, but NEVER to mock if Supabase is active
-      if (cached) return JSON.parse(cached).data;
+      logError('Supabase fetchProductSummaries', err);
       return [];
     }
   }
-  return mockProductsStore;
+  return mockProductsStore.map(({ id, name, price, category, image_url }) => ({ id, name, price, category, image_url }));
+};
+
+export const fetchProduct = async (id: string): Promise<Product | null> => {
+  if (isSupabaseConfigured()) {
+    try {
+      const { data, error } = await dedupe(`product:${id}`, () =>
+        supabase.from('products').select('*').eq('id', id).single()
+      );
+      if (error) throw error;
+      return data as Product;
+    } catch (err) {
+      logError('Supabase fetchProduct', err);
+      return null;
+    }
+  }
+  return mockProductsStore.find(p => p.id === id) || null;
 };
 
 export const createProduct = async (product: Omit<Product, 'id'>): Promise<Product | null> => {
-  sessionStorage.removeItem(CACHE_KEY); // Invalidate cache
   const createMock = () => {
     const newProduct = { ...product, id: Math.random().toString(36).substr(2, 9) };
     mockProductsStore.push(newProduct);
@@ -79,6 +281,7 @@ export const createProduct = async (product: Omit<Product, 'id'>): Promise<Produ
     try {
       const { data, error } = await supabase.from('products').insert([product]).select().single();
       if (error) throw error;
+      await invalidateProductCache();
       return data as Product;
     } catch (err) {
       logError('Supabase createProduct', err);
@@ -89,7 +292,6 @@ export const createProduct = async (product: Omit<Product, 'id'>): Promise<Produ
 };
 
 export const updateProduct = async (id: string, updates: Partial<Product>): Promise<Product | null> => {
-  sessionStorage.removeItem(CACHE_KEY); // Invalidate cache
   const updateMock = () => {
     const index = mockProductsStore.findIndex(p => p.id === id);
     if (index !== -1) {
@@ -103,6 +305,7 @@ export const updateProduct = async (id: string, updates: Partial<Product>): Prom
     try {
       const { data, error } = await supabase.from('products').update(updates).eq('id', id).select().single();
       if (error) throw error;
+      await invalidateProductCache();
       return data as Product;
     } catch (err) {
       logError('Supabase updateProduct', err);
@@ -114,14 +317,31 @@ export const updateProduct = async (id: string, updates: Partial<Product>): Prom
 
 // --- Employee Management ---
 
+// initializeAuth y onAuthStateChange piden el mismo perfil casi juntos al iniciar sesión
+const PROFILE_TTL_MS = 5000;
+
+export const fetchProfileRole = async (userId: string): Promise<Role | null> => {
+  const { data, error } = await dedupe(`profile:${userId}`, () =>
+    supabase.from('profiles').select('role').eq('id', userId).maybeSingle(),
+    PROFILE_TTL_MS
+  );
+  if (error) {
+    logError('Supabase fetchProfileRole', error);
+    return null;
+  }
+  return (data?.role as Role) || null;
+};
+
 export const fetchProfiles = async (): Promise<UserProfile[]> => {
   if (!isSupabaseConfigured()) return [];
 
   try {
-    const { data, error } = await supabase
-      .from('profiles')
-      .select('*')
-      .order('created_at', { ascending: false });
+    const { data, error } = await dedupe('profiles', () =>
+      supabase
+        .from('profiles')
+        .select('*')
+        .order('created_at', { ascending: false })
+    );
 
     if (error) throw error;
     return (data || []) as UserProfile[];
@@ -161,7 +381,6 @@ export const createEmployee = async (email: string, password: string): Promise<v
 };
 
 export const deleteProduct = async (id: string): Promise<void> => {
-  sessionStorage.removeItem(CACHE_KEY); // Invalidate cache
   const deleteMock = () => {
     mockProductsStore = mockProductsStore.filter(p => p.id !== id);
   };
@@ -170,6 +389,7 @@ export const deleteProduct = async (id: string): Promise<void> => {
     try {
       const { error } = await supabase.from('products').delete().eq('id', id);
       if (error) throw error;
+      await invalidateProductCache();
       return;
     } catch (err) {
       logError('Supabase deleteProduct', err);
@@ -207,25 +427,51 @@ export const uploadProductImage = async (file: File): Promise<string | null> =>
 
 // --- Orders ---
 
-export const createOrder = async (orderData: Omit<Order, 'id' | 'status' | 'created_at'>): Promise<Order | null> => {
-  const newOrderData = {
-    ...orderData,
-    status: 'pending' as OrderStatus,
-    created_at: new Date().toISOString(),
-    total: orderData.items.reduce((sum, item) => sum + (item.price * item.quantity), 0)
-  };
-
-  const createMock = () => {
-    const newOrder = { ...newOrderData, id: Math.random().toString(36).substr(2, 9) } as Order;
+/**
+ * Checkout: el navegador manda solo ids y cantidades. place_order (ver
+ * supabase/migrations) valida que los productos sigan activos, toma los
+ * precios vigentes y calcula el total en una sola transacción; devuelve
+ * solo el id y el total en lugar de la fila completa.
+ */
+export const createOrder = async (order: NewOrder): Promise<PlacedOrder | null> => {
+  const lines = order.items.map(item => ({ product_id: item.id, quantity: item.quantity }));
+
+  // Misma lógica que place_order sobre el catálogo en memoria
+  const createMock = (): PlacedOrder => {
+    const items = lines.map(line => {
+      const product = mockProductsStore.find(p => p.id === line.product_id && p.active);
+      if (!product || line.quantity <= 0) throw new Error('Algún producto ya no está disponible');
+      return { product_id: product.id, name: product.name, price: product.price, quantity: line.quantity };
+    });
+    const created_at = new Date().toISOString();
+    const newOrder: Order = {
+      id: Math.random().toString(36).substr(2, 9),
+      customer_name: order.customer_name,
+      customer_phone: order.customer_phone,
+      address: order.address,
+      items,
+      total: items.reduce((sum, item) => sum + (item.price * item.quantity), 0),
+      status: 'pending',
+      created_at,
+      updated_at: created_at
+    };
     mockOrdersStore = [newOrder, ...mockOrdersStore];
-    return newOrder;
+    return { id: newOrder.id, total: newOrder.total };
   };
 
   if (isSupabaseConfigured()) {
     try {
-      const { data, error } = await supabase.from('orders').insert([newOrderData]).select().single();
+      const { data, error } = await supabase
+        .rpc('place_order', {
+          p_customer_name: order.customer_name,
+          p_customer_phone: order.customer_phone,
+          p_address: order.address,
+          p_items: lines
+        })
+        .single();
       if (error) throw error;
-      return data as Order;
+      const placed = data as { id: string; total: number | string };
+      return { id: placed.id, total: Number(placed.total) };
     } catch (err) {
       logError('Supabase createOrder', err);
       throw err;
@@ -235,23 +481,153 @@ export const createOrder = async (orderData: Omit<Order, 'id' | 'status' | 'crea
   return createMock();
 };
 
-export const fetchOrders = async (): Promise<Order[]> => {
+// Las líneas se leen de order_items por embedding de PostgREST (ver supabase/migrations)
+const ORDER_COLUMNS = 'id, customer_name, customer_phone, address, status, total, created_at, updated_at';
+const ORDER_SUMMARY_COLUMNS = `${ORDER_COLUMNS}, order_items(name, quantity)`;
+const ORDER_DETAIL_COLUMNS = `${ORDER_COLUMNS}, order_items(product_id, name, price, quantity)`;
+
+// La relación embebida llega como order_items; la app la usa como items
+const withItems = <T extends { items: unknown[] }>({ order_items, ...order }: any): T =>
+  ({ ...order, items: order_items || [] });
+
+// Para los pedidos completos que llegan por Realtime o del modo mock
+export const toOrderSummary = (order: Order): OrderSummary => ({
+  ...order,
+  items: (order.items || []).map(({ name, quantity }) => ({ name, quantity }))
+});
+
+export const ACTIVE_ORDER_STATUSES: OrderStatus[] = ['pending', 'preparing', 'ready'];
+export const ORDER_PAGE_SIZE = 50;
+
+// orders tiene solo los pedidos recientes; los entregados antiguos pasan a
+// orders_archive y order_history lee ambas (ver supabase/migrations)
+const ORDER_HISTORY_SOURCE = 'order_history';
+
+interface FetchOrdersOptions {
+  statuses?: OrderStatus[];
+  after?: OrderCursor | null; // Continúa a partir de la última fila de la página anterior
+  limit?: number;
+}
+
+// Orden del feed: más nuevos primero, con el id como desempate
+const compareOrders = (a: OrderSummary, b: OrderSummary) =>
+  b.created_at.localeCompare(a.created_at) || b.id.localeCompare(a.id);
+
+const isBefore = (order: OrderSummary, cursor: OrderCursor) =>
+  compareOrders(order, cursor as OrderSummary) > 0;
+
+const toPage = (rows: OrderSummary[], limit: number): OrderPage => {
+  const orders = rows.slice(0, limit);
+  const last = orders[orders.length - 1];
+  return {
+    orders,
+    nextCursor: rows.length > limit && last ? { created_at: last.created_at, id: last.id } : null
+  };
+};
+
+/**
+ * Pagina los pedidos por cursor (created_at, id) en vez de por offset, así
+ * cada página cuesta lo mismo sin importar cuántos pedidos haya detrás.
+ * El estado se filtra en el servidor: por defecto solo los activos.
+ */
+export const fetchOrders = async ({
+  statuses = ACTIVE_ORDER_STATUSES,
+  after = null,
+  limit = ORDER_PAGE_SIZE
+}: FetchOrdersOptions = {}): Promise<OrderPage> => {
   if (isSupabaseConfigured()) {
     try {
-      const { data, error } = await supabase.from('orders').select('*').order('created_at', { ascending: false });
+      // Solo el historial de entregados necesita el archivo; los activos siempre están en orders
+      let query = supabase
+        .from(statuses.includes('delivered') ? ORDER_HISTORY_SOURCE : 'orders')
+        .select(ORDER_SUMMARY_COLUMNS)
+        .order('created_at', { ascending: false })
+        .order('id', { ascending: false })
+        .order('line_no', { referencedTable: 'order_items' })
+        .limit(limit + 1); // Una fila extra indica si hay otra página
+
+      // Un solo estado va como eq: así el índice (status, created_at, id) entrega el orden sin ordenar aparte
+      query = statuses.length === 1 ? query.eq('status', statuses[0]) : query.in('status', statuses);
+
+      if (after) {
+        const at = `"${after.created_at}"`;
+        query = query.or(`created_at.lt.${at},and(created_at.eq.${at},id.lt.${after.id})`);
+      }
+
+      const key = `orders:${statuses.join(',')}:${after ? `${after.created_at}/${after.id}` : ''}:${limit}`;
+      const { data, error } = await dedupe(key, () => query);
       if (error) throw error;
-      return (data || []) as Order[];
+      const rows: OrderSummary[] = (data || []).map(row => withItems<OrderSummary>(row));
+      noteOrdersSeen(rows);
+      return toPage(rows, limit);
     } catch (err) {
       logError('Supabase fetchOrders', err);
-      return []; // Return empty instead of mocks to avoid confusion
+      return { orders: [], nextCursor: null }; // Return empty instead of mocks to avoid confusion
+    }
+  }
+
+  const rows = mockOrdersStore
+    .filter(o => statuses.includes(o.status) && (!after || isBefore(o, after)))
+    .map(toOrderSummary)
+    .sort(compareOrders);
+  noteOrdersSeen(rows);
+  return new Promise((resolve) => setTimeout(() => resolve(toPage(rows, limit)), 500));
+};
+
+// Detalle completo (precios por ítem) al expandir un pedido de la lista
+export const fetchOrderDetails = async (id: string): Promise<Order | null> => {
+  if (isSupabaseConfigured()) {
+    try {
+      const { data, error } = await dedupe(`order:${id}`, () =>
+        supabase
+          .from(ORDER_HISTORY_SOURCE) // El pedido expandido puede estar ya archivado
+          .select(ORDER_DETAIL_COLUMNS)
+          .eq('id', id)
+          .order('line_no', { referencedTable: 'order_items' })
+          .single()
+      );
+      if (error) throw error;
+      return withItems<Order>(data);
+    } catch (err) {
+      logError('Supabase fetchOrderDetails', err);
+      return null;
+    }
+  }
+  return mockOrdersStore.find(o => o.id === id) || null;
+};
+
+/**
+ * Pedidos nuevos que llegan por Realtime: el evento trae solo la fila de
+ * orders, así que sus líneas se piden en una consulta por lote.
+ */
+export const fetchOrderSummaries = async (ids: string[]): Promise<OrderSummary[]> => {
+  if (ids.length === 0) return [];
+  if (isSupabaseConfigured()) {
+    try {
+      const { data, error } = await dedupe(`order_summaries:${ids.join(',')}`, () =>
+        supabase
+          .from('orders')
+          .select(ORDER_SUMMARY_COLUMNS)
+          .in('id', ids)
+          .order('line_no', { referencedTable: 'order_items' })
+      );
+      if (error) throw error;
+      const rows: OrderSummary[] = (data || []).map(row => withItems<OrderSummary>(row));
+      noteOrdersSeen(rows);
+      return rows;
+    } catch (err) {
+      logError('Supabase fetchOrderSummaries', err);
+      return [];
     }
   }
-  return new Promise((resolve) => setTimeout(() => resolve(mockOrdersStore), 500));
+  const wanted = new Set(ids);
+  return mockOrdersStore.filter(o => wanted.has(o.id)).map(toOrderSummary);
 };
 
 export const updateOrderStatus = async (id: string, status: OrderStatus): Promise<void> => {
   const updateMock = () => {
-    mockOrdersStore = mockOrdersStore.map(o => o.id === id ? { ...o, status } : o);
+    const updated_at = new Date().toISOString();
+    mockOrdersStore = mockOrdersStore.map(o => o.id === id ? { ...o, status, updated_at } : o);
   };
 
   if (isSupabaseConfigured()) {
@@ -260,10 +636,183 @@ export const updateOrderStatus = async (id: string, status: OrderStatus): Promis
       if (error) throw error;
       return;
     } catch (err) {
+      // Igual que updateOrdersStatus: el tablero ya lo movió y tiene que saber que no se guardó
       logError('Supabase updateOrderStatus', err);
-      updateMock();
-      return;
+      throw err;
     }
   }
   updateMock();
-};
\ No newline at end of file
+};
+
+/**
+ * Cambio de estado en bloque: una sola petición `in('id', ids)` para todos los
+ * pedidos que siguen en `from`. El filtro por estado evita adelantar dos veces
+ * un pedido que otro empleado ya movió. Devuelve los ids que cambiaron.
+ */
+export const updateOrdersStatus = async (ids: string[], from: OrderStatus, to: OrderStatus): Promise<string[]> => {
+  if (ids.length === 0) return [];
+
+  const updateMock = () => {
+    const updated_at = new Date().toISOString();
+    const wanted = new Set(ids);
+    const changed: string[] = [];
+    mockOrdersStore = mockOrdersStore.map(o => {
+      if (!wanted.has(o.id) || o.status !== from) return o;
+      changed.push(o.id);
+      return { ...o, status: to, updated_at };
+    });
+    return changed;
+  };
+
+  if (isSupabaseConfigured()) {
+    try {
+      const { data, error } = await supabase
+        .from('orders')
+        .update({ status: to })
+        .in('id', ids)
+        .eq('status', from)
+        .select('id');
+      if (error) throw error;
+      return (data || []).map(row => row.id as string);
+    } catch (err) {
+      // El tablero ya los movió de forma optimista: tiene que saber que no se guardaron
+      logError('Supabase updateOrdersStatus', err);
+      throw err;
+    }
+  }
+  return updateMock();
+};
+
+// --- Incremental Sync ---
+
+// Marca de agua: el updated_at más reciente visto, por consultas o por Realtime
+let ordersHighWater: number | null = null;
+// Una transacción lenta puede confirmar con un updated_at anterior a la marca;
+// releer unos segundos de más es barato porque la fusión es idempotente
+const RESYNC_OVERLAP_MS = 5000;
+
+export const noteOrdersSeen = (rows: { updated_at?: string }[]) => {
+  for (const row of rows) {
+    const time = row.updated_at ? Date.parse(row.updated_at) : NaN;
+    if (!isNaN(time) && (ordersHighWater === null || time > ordersHighWater)) ordersHighWater = time;
+  }
+};
+
+/**
+ * Pedidos que cambiaron desde la marca de agua, para resincronizar tras una
+ * reconexión sin volver a descargar la tabla. Devuelve null si todavía no hay
+ * marca (o la consulta falla) y corresponde una recarga completa.
+ * Los pedidos borrados no aparecen en el delta; la app no los borra.
+ */
+export const fetchOrderChanges = async (): Promise<OrderSummary[] | null> => {
+  if (ordersHighWater === null) return null;
+  const since = new Date(ordersHighWater - RESYNC_OVERLAP_MS).toISOString();
+
+  if (isSupabaseConfigured()) {
+    try {
+      const { data, error } = await dedupe(`order_changes:${since}`, () =>
+        supabase
+          .from('orders')
+          .select(ORDER_SUMMARY_COLUMNS)
+          .gt('updated_at', since)
+          .order('updated_at', { ascending: true })
+          .order('line_no', { referencedTable: 'order_items' })
+      );
+      if (error) throw error;
+      const rows: OrderSummary[] = (data || []).map(row => withItems<OrderSummary>(row));
+      noteOrdersSeen(rows);
+      return rows;
+    } catch (err) {
+      logError('Supabase fetchOrderChanges', err);
+      return null;
+    }
+  }
+
+  const rows = mockOrdersStore.filter(o => o.updated_at && o.updated_at > since).map(toOrderSummary);
+  noteOrdersSeen(rows);
+  return rows;
+};
+
+// --- Reports ---
+
+const REPORT_TOP_PRODUCTS = 10;
+
+// Día (YYYY-MM-DD) y hora en `timeZone`, como los agrupa public.sales_local_time()
+const salesClock = (timeZone: string) => {
+  const format = new Intl.DateTimeFormat('en-CA', {
+    timeZone,
+    year: 'numeric',
+    month: '2-digit',
+    day: '2-digit',
+    hour: '2-digit',
+    hourCycle: 'h23'
+  });
+  return (date: Date) => {
+    const parts = Object.fromEntries(format.formatToParts(date).map(part => [part.type, part.value]));
+    return { day: `${parts.year}-${parts.month}-${parts.day}`, hour: Number(parts.hour) };
+  };
+};
+
+/**
+ * Mismo cálculo que sales_report sobre los pedidos en memoria. La zona del
+ * local solo la conoce la base (public.sales_timezone()); sin Supabase se usa
+ * la del navegador y se informa en el reporte igual que lo hace el servidor.
+ */
+const buildMockReport = (days: number): SalesReport => {
+  const timezone = Intl.DateTimeFormat().resolvedOptions().timeZone;
+  const salesTime = salesClock(timezone);
+  const to = salesTime(new Date()).day;
+  const from = new Date(Date.parse(to) - (days - 1) * 24 * 60 * 60 * 1000).toISOString().slice(0, 10);
+  const daily = new Map<string, { day: string; orders: number; revenue: number }>();
+  const hourly = new Map<number, { hour: number; orders: number; revenue: number }>();
+  const products = new Map<string, { name: string; units: number; revenue: number }>();
+
+  for (const order of mockOrdersStore) {
+    const { day, hour } = salesTime(new Date(order.created_at));
+    if (day < from) continue;
+    const dayBucket = daily.get(day) || { day, orders: 0, revenue: 0 };
+    daily.set(day, { ...dayBucket, orders: dayBucket.orders + 1, revenue: dayBucket.revenue + order.total });
+    const hourBucket = hourly.get(hour) || { hour, orders: 0, revenue: 0 };
+    hourly.set(hour, { ...hourBucket, orders: hourBucket.orders + 1, revenue: hourBucket.revenue + order.total });
+    for (const item of order.items) {
+      const product = products.get(item.name) || { name: item.name, units: 0, revenue: 0 };
+      products.set(item.name, {
+        ...product,
+        units: product.units + item.quantity,
+        revenue: product.revenue + item.price * item.quantity
+      });
+    }
+  }
+
+  return {
+    from,
+    to,
+    timezone,
+    daily: [...daily.values()].sort((a, b) => a.day.localeCompare(b.day)),
+    hourly: [...hourly.values()].sort((a, b) => a.hour - b.hour),
+    products: [...products.values()]
+      .sort((a, b) => b.units - a.units || b.revenue - a.revenue || a.name.localeCompare(b.name))
+      .slice(0, REPORT_TOP_PRODUCTS)
+  };
+};
+
+/**
+ * Ventas de los últimos `days` días (hoy incluido) para la pestaña Reportes.
+ * Los triggers mantienen las tablas resumen al confirmar cada pedido, así que
+ * la consulta lee unos cientos de filas aunque haya años de pedidos.
+ */
+export const fetchSalesReport = async (days: number): Promise<SalesReport | null> => {
+  if (isSupabaseConfigured()) {
+    try {
+      const { data, error } = await dedupe(`sales_report:${days}`, () =>
+        supabase.rpc('sales_report', { p_days: days, p_top: REPORT_TOP_PRODUCTS })
+      );
+      if (error) throw error;
+      return data as SalesReport;
+    } catch (err) {
+      logError('Supabase fetchSalesReport', err);
+      return null;
+    }
+  }
+  return buildMockReport(days);
+};
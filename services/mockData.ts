@@ -1,4 +1,4 @@
-import { Product, Order } from '../types';
+import { Product, Order, OrderItem } from '../types';
 
 export const MOCK_PRODUCTS: Product[] = [
   {
@@ -39,13 +39,20 @@ export const MOCK_PRODUCTS: Product[] = [
   }
 ];
 
+const line = (product: Product, quantity: number): OrderItem => ({
+  product_id: product.id,
+  name: product.name,
+  price: product.price,
+  quantity
+});
+
 export const MOCK_ORDERS: Order[] = [
   {
     id: '101',
     customer_name: 'Alice Johnson',
     customer_phone: '555-0101',
     address: '123 Main St, Apt 4B',
-    items: [{ ...MOCK_PRODUCTS[0], quantity: 2 }, { ...MOCK_PRODUCTS[1], quantity: 1 }],
+    items: [line(MOCK_PRODUCTS[0], 2), line(MOCK_PRODUCTS[1], 1)],
     total: 32.48,
     status: 'pending',
     created_at: new Date(Date.now() - 1000 * 60 * 5).toISOString() // 5 mins ago
@@ -55,7 +62,7 @@ export const MOCK_ORDERS: Order[] = [
     customer_name: 'Bob Smith',
     customer_phone: '555-0102',
     address: '456 Oak Ave',
-    items: [{ ...MOCK_PRODUCTS[2], quantity: 1 }],
+    items: [line(MOCK_PRODUCTS[2], 1)],
     total: 15.00,
     status: 'preparing',
     created_at: new Date(Date.now() - 1000 * 60 * 25).toISOString() // 25 mins ago
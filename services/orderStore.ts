@@ -0,0 +1,172 @@
+import { OrderStatus, OrderSummary } from '../types';
+
+export const ORDER_STATUSES: OrderStatus[] = ['pending', 'preparing', 'ready', 'delivered'];
+
+/**
+ * Estado de la lista de pedidos indexado por id. `ids` mantiene el orden del
+ * feed (más nuevos primero) y `byStatus` los mismos ids separados por estado.
+ * Un cambio reemplaza solo su registro y reconstruye solo los buckets de los
+ * estados que tocó; el resto conserva la misma referencia.
+ */
+export interface OrderState {
+  byId: Record<string, OrderSummary>;
+  ids: string[];
+  byStatus: Record<OrderStatus, string[]>;
+}
+
+const emptyBuckets = (): Record<OrderStatus, string[]> => ({ pending: [], preparing: [], ready: [], delivered: [] });
+
+export const emptyOrderState: OrderState = { byId: {}, ids: [], byStatus: emptyBuckets() };
+
+const rebuildBuckets = (
+  byId: Record<string, OrderSummary>,
+  ids: string[],
+  previous: Record<OrderStatus, string[]>,
+  dirty: Set<OrderStatus>
+): Record<OrderStatus, string[]> => {
+  if (dirty.size === 0) return previous;
+  const next = { ...previous };
+  dirty.forEach(status => { next[status] = ids.filter(id => byId[id].status === status); });
+  return next;
+};
+
+// Mismo orden que fetchOrders: created_at desc, id desc
+const isNewer = (a: OrderSummary, b: OrderSummary) =>
+  (b.created_at.localeCompare(a.created_at) || b.id.localeCompare(a.id)) < 0;
+
+const withNewIds = (byId: Record<string, OrderSummary>, ids: string[], added: string[]): string[] => {
+  if (added.length === 0) return ids;
+  const sorted = [...added].sort((a, b) => (isNewer(byId[a], byId[b]) ? -1 : 1));
+  // Lo habitual: pedidos recién creados, todos más nuevos que la cabeza de la lista
+  if (ids.length === 0 || isNewer(byId[sorted[sorted.length - 1]], byId[ids[0]])) {
+    return [...sorted, ...ids];
+  }
+  return [...sorted, ...ids].sort((a, b) => (isNewer(byId[a], byId[b]) ? -1 : 1));
+};
+
+export const fromOrders = (orders: OrderSummary[]): OrderState => {
+  const byId = Object.fromEntries(orders.map(o => [o.id, o]));
+  const ids = orders.map(o => o.id);
+  return { byId, ids, byStatus: rebuildBuckets(byId, ids, emptyBuckets(), new Set(ORDER_STATUSES)) };
+};
+
+// --- Selectores ---
+
+export const selectOrders = (state: OrderState): OrderSummary[] => state.ids.map(id => state.byId[id]);
+
+export const selectOrder = (state: OrderState, id: string): OrderSummary | undefined => state.byId[id];
+
+export const selectStatusIds = (state: OrderState, status: OrderStatus): string[] => state.byStatus[status];
+
+export const countActive = (state: OrderState): number =>
+  state.byStatus.pending.length + state.byStatus.preparing.length + state.byStatus.ready.length;
+
+/**
+ * Cambios en vivo (Realtime, resincronización, actualizaciones optimistas):
+ * reemplaza los pedidos conocidos y agrega los desconocidos salvo que ya estén
+ * entregados, que pertenecen al historial. Si un id aparece varias veces, gana
+ * la última versión; `removed` se aplica al final.
+ */
+export const applyOrderChanges = (
+  state: OrderState,
+  upserts: OrderSummary[],
+  removed: string[] = []
+): OrderState => {
+  if (upserts.length === 0 && removed.length === 0) return state;
+  const byId = { ...state.byId };
+  const added: string[] = [];
+  const dirty = new Set<OrderStatus>();
+  for (const order of upserts) {
+    const previous = byId[order.id];
+    if (!previous) {
+      if (order.status === 'delivered') continue;
+      added.push(order.id);
+    } else if (previous.status !== order.status) {
+      dirty.add(previous.status);
+    }
+    if (!previous || previous.status !== order.status) dirty.add(order.status);
+    byId[order.id] = order;
+  }
+  let ids = withNewIds(byId, state.ids, added);
+  if (removed.length > 0) {
+    const gone = new Set(removed.filter(id => byId[id]));
+    gone.forEach(id => {
+      dirty.add(byId[id].status);
+      delete byId[id];
+    });
+    ids = ids.filter(id => !gone.has(id));
+  }
+  return { byId, ids, byStatus: rebuildBuckets(byId, ids, state.byStatus, dirty) };
+};
+
+// Páginas anteriores: solo agrega; la versión que ya trajo Realtime es más reciente
+export const appendOrders = (state: OrderState, older: OrderSummary[]): OrderState => {
+  const fresh = older.filter(o => !state.byId[o.id]);
+  if (fresh.length === 0) return state;
+  const byId = { ...state.byId, ...Object.fromEntries(fresh.map(o => [o.id, o])) };
+  const ids = [...state.ids, ...fresh.map(o => o.id)];
+  return { byId, ids, byStatus: rebuildBuckets(byId, ids, state.byStatus, new Set(fresh.map(o => o.status))) };
+};
+
+/**
+ * Junta elementos y los entrega en un solo llamado: el primero abre una
+ * ventana corta y el lote se aplica en el frame siguiente. Una ráfaga de
+ * eventos Realtime produce así un único render. Con la pestaña oculta
+ * requestAnimationFrame no corre, y alcanza con la ventana.
+ *
+ * `hold(maxMs)` retiene las entregas hasta `release()` (o hasta que pase
+ * `maxMs`): sirve para juntar el eco de una operación en bloque, que puede
+ * llegar repartido en más de una ventana.
+ */
+export const createBatcher = <T>(flush: (items: T[]) => void, windowMs = 50) => {
+  let pending: T[] = [];
+  let timer: ReturnType<typeof setTimeout> | null = null;
+  let frame: number | null = null;
+  let held: ReturnType<typeof setTimeout> | null = null;
+
+  const run = () => {
+    timer = null;
+    frame = null;
+    if (held !== null) return;
+    const items = pending;
+    pending = [];
+    if (items.length > 0) flush(items);
+  };
+
+  const schedule = () => {
+    if (held !== null || pending.length === 0 || timer !== null || frame !== null) return;
+    timer = setTimeout(() => {
+      timer = null;
+      if (document.visibilityState === 'visible') frame = requestAnimationFrame(run);
+      else run();
+    }, windowMs);
+  };
+
+  const release = () => {
+    if (held === null) return;
+    clearTimeout(held);
+    held = null;
+    schedule();
+  };
+
+  return {
+    push(item: T) {
+      pending.push(item);
+      schedule();
+    },
+    hold(maxMs: number) {
+      if (held !== null) clearTimeout(held);
+      held = setTimeout(release, maxMs);
+    },
+    release,
+    cancel() {
+      if (timer !== null) clearTimeout(timer);
+      if (frame !== null) cancelAnimationFrame(frame);
+      if (held !== null) clearTimeout(held);
+      timer = null;
+      frame = null;
+      held = null;
+      pending = [];
+    }
+  };
+};
@@ -0,0 +1,12 @@
+/**
+ * Sets a User Timing mark once per page load.
+ * The Playwright metrics collector (testsprite_tests/metrics.py) reads these
+ * marks to time auth startup, the first Menu products and the OrderList render.
+ */
+const marked = new Set<string>();
+
+export const markOnce = (name: string): void => {
+  if (marked.has(name) || typeof performance === 'undefined' || !performance.mark) return;
+  marked.add(name);
+  performance.mark(name);
+};
@@ -0,0 +1,82 @@
+import { Product } from '../types';
+
+/**
+ * Copia persistente del menú en IndexedDB, junto con la versión del catálogo
+ * con la que se guardó (tabla catalog_versions). A diferencia de
+ * sessionStorage sobrevive al cierre de la pestaña y se lee sin bloquear el
+ * hilo principal con un JSON.parse.
+ *
+ * Los cambios de un admin se avisan a las demás pestañas por BroadcastChannel.
+ * Si el navegador no tiene IndexedDB (o está bloqueado, p. ej. en modo
+ * privado) todo degrada a "sin caché".
+ */
+
+const DB_NAME = 'gastromanager';
+const STORE = 'cache';
+const KEY = 'products';
+const CHANNEL_NAME = 'products-cache';
+
+export interface CachedProducts {
+  products: Product[];
+  version: number | null; // null si la base todavía no tiene catalog_versions
+  savedAt: number;
+}
+
+let dbPromise: Promise<IDBDatabase | null> | null = null;
+
+const openDb = (): Promise<IDBDatabase | null> => {
+  if (!dbPromise) {
+    dbPromise = new Promise((resolve) => {
+      if (typeof indexedDB === 'undefined') return resolve(null);
+      try {
+        const request = indexedDB.open(DB_NAME, 1);
+        request.onupgradeneeded = () => request.result.createObjectStore(STORE);
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => resolve(null);
+        request.onblocked = () => resolve(null);
+      } catch {
+        resolve(null);
+      }
+    });
+  }
+  return dbPromise;
+};
+
+const run = async <T>(mode: IDBTransactionMode, action: (store: IDBObjectStore) => IDBRequest): Promise<T | null> => {
+  const db = await openDb();
+  if (!db) return null;
+  return new Promise((resolve) => {
+    try {
+      const request = action(db.transaction(STORE, mode).objectStore(STORE));
+      request.onsuccess = () => resolve((request.result as T) ?? null);
+      request.onerror = () => resolve(null);
+    } catch {
+      resolve(null);
+    }
+  });
+};
+
+export const readCachedProducts = () => run<CachedProducts>('readonly', store => store.get(KEY));
+
+export const writeCachedProducts = async (products: Product[], version: number | null): Promise<void> => {
+  const entry: CachedProducts = { products, version, savedAt: Date.now() };
+  await run('readwrite', store => store.put(entry, KEY));
+};
+
+export const clearCachedProducts = async (): Promise<void> => {
+  await run('readwrite', store => store.delete(KEY));
+};
+
+// --- Aviso entre pestañas ---
+
+const channel = typeof BroadcastChannel !== 'undefined' ? new BroadcastChannel(CHANNEL_NAME) : null;
+
+// El mensaje llega a las otras pestañas del mismo origen, no a la que lo envía
+export const broadcastProductsChanged = () => channel?.postMessage('changed');
+
+export const onProductsChanged = (listener: () => void): (() => void) => {
+  if (!channel) return () => {};
+  const handler = () => listener();
+  channel.addEventListener('message', handler);
+  return () => channel.removeEventListener('message', handler);
+};
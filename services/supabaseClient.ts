@@ -30,8 +30,11 @@ const getEnv = (key: string) => {
   return '';
 };
 
-export const SUPABASE_URL = MANUAL_URL || getEnv('SUPABASE_URL');
-export const SUPABASE_ANON_KEY = MANUAL_ANON_KEY || getEnv('SUPABASE_ANON_KEY');
+// Las variables de entorno tienen prioridad sobre los valores manuales, así
+// VITE_SUPABASE_URL=http://127.0.0.1:54321 apunta la app al servidor local
+// de testsprite_tests/local_supabase sin tocar este archivo.
+export const SUPABASE_URL = getEnv('SUPABASE_URL') || MANUAL_URL;
+export const SUPABASE_ANON_KEY = getEnv('SUPABASE_ANON_KEY') || MANUAL_ANON_KEY;
 
 // Initialize client
 // If no keys are provided, we create a client pointing to a placeholder to avoid crashes,
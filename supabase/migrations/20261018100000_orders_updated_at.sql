@@ -0,0 +1,20 @@
+-- Last change of each order, kept by a trigger. After a reconnect the dashboard
+-- fetches only the rows with updated_at past the newest one it has seen
+-- (dataService.fetchOrderChanges, delta polling with updated_at=gt.).
+--
+-- Existing orders start with the time of this migration, so the first resync
+-- after it runs returns every order once.
+
+alter table public.orders add column if not exists updated_at timestamp with time zone default timezone('utc'::text, now());
+
+create or replace function public.touch_updated_at()
+returns trigger as $$
+begin
+  new.updated_at = timezone('utc'::text, now());
+  return new;
+end;
+$$ language plpgsql;
+
+create or replace trigger orders_touch_updated_at
+  before update on public.orders
+  for each row execute procedure public.touch_updated_at();
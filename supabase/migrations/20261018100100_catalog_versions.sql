@@ -0,0 +1,31 @@
+-- Catalog version: bumped on every change to products. Clients keep a cached
+-- menu tagged with the version and revalidate it by reading this one row
+-- (dataService.fetchCatalogVersion).
+
+create table if not exists public.catalog_versions (
+  name text primary key,
+  version bigint not null default 1,
+  updated_at timestamp with time zone default timezone('utc'::text, now())
+);
+
+insert into public.catalog_versions (name) values ('products') on conflict (name) do nothing;
+
+alter table public.catalog_versions enable row level security;
+
+drop policy if exists "Catalog versions are viewable by everyone" on public.catalog_versions;
+create policy "Catalog versions are viewable by everyone" on public.catalog_versions
+  for select using (true);
+
+create or replace function public.bump_catalog_version()
+returns trigger as $$
+begin
+  update public.catalog_versions
+  set version = version + 1, updated_at = timezone('utc'::text, now())
+  where name = tg_table_name;
+  return null;
+end;
+$$ language plpgsql security definer;
+
+create or replace trigger products_bump_catalog_version
+  after insert or update or delete on public.products
+  for each statement execute procedure public.bump_catalog_version();
@@ -0,0 +1,73 @@
+-- Checkout entry point: place_order.
+--
+-- The client sends only product ids and quantities; availability, prices and
+-- the total are resolved here in one transaction, so a stale cart cannot order
+-- a withdrawn product or an outdated price. Returns only the new id and total
+-- instead of echoing the whole row.
+--   p_items: [{"product_id": "<uuid>", "quantity": 2}, ...]
+--
+-- 20261018100300_order_items redefines it to write order_items.
+
+create or replace function public.place_order(
+  p_customer_name text,
+  p_customer_phone text,
+  p_address text,
+  p_items jsonb
+)
+returns table (id uuid, total numeric) as $$
+declare
+  v_items jsonb;
+  v_total numeric;
+  v_requested int;
+  v_found int;
+begin
+  if jsonb_typeof(p_items) is distinct from 'array' or jsonb_array_length(p_items) = 0 then
+    raise exception 'El pedido no tiene productos';
+  end if;
+
+  if exists (
+    select 1 from jsonb_to_recordset(p_items) as line(product_id uuid, quantity int)
+    where line.product_id is null or line.quantity is null or line.quantity <= 0
+  ) then
+    raise exception 'Cantidad inválida en el pedido';
+  end if;
+
+  -- Lock the rows so a concurrent price change lands before or after, never between
+  perform 1 from public.products p
+  where p.id in (select line.product_id from jsonb_to_recordset(p_items) as line(product_id uuid))
+  for share;
+
+  -- Same product twice in the payload counts as one line with the summed quantity
+  with requested as (
+    select line.product_id, sum(line.quantity)::int as quantity
+    from jsonb_to_recordset(p_items) as line(product_id uuid, quantity int)
+    group by line.product_id
+  )
+  select
+    (select count(*) from requested),
+    count(p.id),
+    coalesce(jsonb_agg(jsonb_build_object(
+      'id', p.id,
+      'name', p.name,
+      'price', p.price,
+      'category', p.category,
+      'image_url', p.image_url,
+      'quantity', r.quantity
+    )), '[]'::jsonb),
+    coalesce(sum(p.price * r.quantity), 0)
+  into v_requested, v_found, v_items, v_total
+  from requested r
+  join public.products p on p.id = r.product_id and p.active;
+
+  if v_found < v_requested then
+    raise exception 'Algún producto ya no está disponible';
+  end if;
+
+  return query
+  insert into public.orders as o (customer_name, customer_phone, address, items, total, status)
+  values (p_customer_name, p_customer_phone, coalesce(p_address, ''), v_items, v_total, 'pending')
+  returning o.id, o.total;
+end;
+$$ language plpgsql security definer set search_path = public;
+
+grant execute on function public.place_order(text, text, text, jsonb) to anon, authenticated;
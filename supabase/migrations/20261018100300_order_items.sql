@@ -0,0 +1,128 @@
+-- Order lines move from the orders.items jsonb column to an order_items table.
+--
+-- Creates the table, backfills it from the jsonb copies already stored, drops
+-- the column and points place_order at the new table.
+
+-- One row per order line. name and price are snapshots taken when the order
+-- was placed; product_id keeps the link for reporting and is cleared if the
+-- product is deleted later. line_no keeps the cart order.
+create table if not exists public.order_items (
+  id uuid default gen_random_uuid() primary key,
+  order_id uuid not null references public.orders(id) on delete cascade,
+  product_id uuid references public.products(id) on delete set null,
+  name text not null,
+  price numeric not null,
+  quantity integer not null check (quantity > 0),
+  line_no integer not null default 0
+);
+
+create index if not exists order_items_order_id_idx on public.order_items (order_id, line_no);
+create index if not exists order_items_product_id_idx on public.order_items (product_id);
+
+alter table public.order_items enable row level security;
+
+-- Same access orders had; 20261018125000_restrict_order_writes replaces it with
+-- staff-only reads.
+drop policy if exists "Enable all access for all users" on public.order_items;
+create policy "Enable all access for all users" on public.order_items
+  for all using (true) with check (true);
+
+-- The list reads order_items through PostgREST embedding; the computed field
+-- over the old jsonb column is no longer used.
+drop function if exists public.item_summary(public.orders);
+
+-- Backfill from the legacy orders.items jsonb (full CartItem copies), then drop
+-- the column. Safe to re-run: skips orders that already have lines, and does
+-- nothing once the column is gone. Ids that no longer match a product keep
+-- their snapshot with a null product_id.
+do $$
+begin
+  if exists (
+    select 1 from information_schema.columns
+    where table_schema = 'public' and table_name = 'orders' and column_name = 'items'
+  ) then
+    insert into public.order_items (order_id, product_id, name, price, quantity, line_no)
+    select
+      o.id,
+      p.id,
+      coalesce(line.item->>'name', ''),
+      coalesce((line.item->>'price')::numeric, 0),
+      greatest(coalesce((line.item->>'quantity')::int, 1), 1),
+      line.ordinality - 1
+    from public.orders o
+    cross join lateral jsonb_array_elements(
+      case when jsonb_typeof(o.items) = 'array' then o.items else '[]'::jsonb end
+    ) with ordinality as line(item, ordinality)
+    left join public.products p on p.id::text = line.item->>'id'
+    where not exists (select 1 from public.order_items oi where oi.order_id = o.id);
+
+    alter table public.orders drop column items;
+  end if;
+end $$;
+
+-- place_order (20261018100200_place_order) now writes the lines here instead of
+-- the jsonb column; the checks and the returned id and total are unchanged.
+create or replace function public.place_order(
+  p_customer_name text,
+  p_customer_phone text,
+  p_address text,
+  p_items jsonb
+)
+returns table (id uuid, total numeric) as $$
+declare
+  v_order_id uuid;
+  v_total numeric;
+  v_requested int;
+  v_found int;
+begin
+  if jsonb_typeof(p_items) is distinct from 'array' or jsonb_array_length(p_items) = 0 then
+    raise exception 'El pedido no tiene productos';
+  end if;
+
+  if exists (
+    select 1 from jsonb_to_recordset(p_items) as line(product_id uuid, quantity int)
+    where line.product_id is null or line.quantity is null or line.quantity <= 0
+  ) then
+    raise exception 'Cantidad inválida en el pedido';
+  end if;
+
+  -- Lock the rows so a concurrent price change lands before or after, never between
+  perform 1 from public.products p
+  where p.id in (select line.product_id from jsonb_to_recordset(p_items) as line(product_id uuid))
+  for share;
+
+  -- Same product twice in the payload counts as one line with the summed quantity
+  with requested as (
+    select line.product_id, sum(line.quantity)::int as quantity
+    from jsonb_to_recordset(p_items) as line(product_id uuid, quantity int)
+    group by line.product_id
+  )
+  select (select count(*) from requested), count(p.id), coalesce(sum(p.price * r.quantity), 0)
+  into v_requested, v_found, v_total
+  from requested r
+  join public.products p on p.id = r.product_id and p.active;
+
+  if v_found < v_requested then
+    raise exception 'Algún producto ya no está disponible';
+  end if;
+
+  insert into public.orders as o (customer_name, customer_phone, address, total, status)
+  values (p_customer_name, p_customer_phone, coalesce(p_address, ''), v_total, 'pending')
+  returning o.id into v_order_id;
+
+  -- Lines keep the order in which they first appear in the cart
+  insert into public.order_items (order_id, product_id, name, price, quantity, line_no)
+  select v_order_id, p.id, p.name, p.price, r.quantity, r.line_no
+  from (
+    select line.product_id, sum(line.quantity)::int as quantity, min(line.ordinality)::int - 1 as line_no
+    from rows from (jsonb_to_recordset(p_items) as (product_id uuid, quantity int))
+      with ordinality as line(product_id, quantity, ordinality)
+    group by line.product_id
+  ) r
+  join public.products p on p.id = r.product_id;
+
+  return query select v_order_id, v_total;
+end;
+$$ language plpgsql security definer set search_path = public;
+
+grant execute on function public.place_order(text, text, text, jsonb) to anon, authenticated;
@@ -0,0 +1,16 @@
+-- Indexes for the dashboard's order queries (services/dataService.ts).
+
+-- fetchOrders, default view: active orders newest first, paged by the
+-- (created_at, id) keyset. Partial, so delivered orders (most of the table
+-- over time) stay out of it; the predicate matches ACTIVE_ORDER_STATUSES.
+create index if not exists orders_active_feed_idx
+  on public.orders (created_at desc, id desc)
+  where status in ('pending', 'preparing', 'ready');
+
+-- fetchOrders with statuses = ['delivered']: the history pages.
+create index if not exists orders_status_feed_idx
+  on public.orders (status, created_at desc, id desc);
+
+-- fetchOrderChanges: rows touched after the high-water mark, oldest first.
+create index if not exists orders_updated_at_idx
+  on public.orders (updated_at);
@@ -0,0 +1,7 @@
+-- Index for the menu and the admin product table (services/dataService.ts).
+
+-- fetchProducts and fetchProductSummaries: active products ordered by
+-- category and name, which also gives Menu.tsx its categories in a stable order.
+create index if not exists products_menu_idx
+  on public.products (category, name)
+  where active;
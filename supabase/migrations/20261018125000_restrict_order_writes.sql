@@ -0,0 +1,34 @@
+-- Checkout goes only through place_order.
+--
+-- The baseline's "Enable all access for all users" policies let any client
+-- insert orders and order lines with whatever total and prices it liked,
+-- bypassing place_order, which is meant to be the price authority. Clients lose
+-- insert and delete on both tables; place_order and the other security definer
+-- functions still write as their owner. Reading orders and advancing their
+-- status is for staff (admins and employees) only, and status is the only
+-- column they can update: total, created_at and the customer details stay as
+-- place_order wrote them.
+
+create or replace function public.is_staff()
+returns boolean as $$
+  select exists (
+    select 1 from public.profiles where id = auth.uid() and role in ('admin', 'employee')
+  );
+$$ language sql stable security definer set search_path = public;
+
+drop policy if exists "Enable all access for all users" on public.orders;
+drop policy if exists "Enable all access for all users" on public.order_items;
+
+revoke all on public.orders from anon;
+revoke insert, update, delete, truncate on public.orders from authenticated;
+grant update (status) on public.orders to authenticated;
+revoke all on public.order_items from anon;
+revoke insert, update, delete, truncate on public.order_items from authenticated;
+
+create policy "Staff can view orders" on public.orders
+  for select to authenticated using (public.is_staff());
+create policy "Staff can update orders" on public.orders
+  for update to authenticated using (public.is_staff()) with check (public.is_staff());
+
+create policy "Staff can view order lines" on public.order_items
+  for select to authenticated using (public.is_staff());
@@ -0,0 +1,287 @@
+-- Monthly range partitions for orders, plus an archive for old delivered orders.
+--
+-- orders keeps only the working set: one partition per month of created_at.
+-- Delivered orders older than a configurable age move to orders_archive
+-- through a scheduled job, and months that end up empty are dropped.
+-- order_history reads across both tables for the delivered history and order
+-- details.
+--
+-- A primary key on a partitioned table must include the partition key, so
+-- orders is keyed on (id, created_at). order_items carries its order's
+-- created_at and references orders (id, created_at) on delete cascade; when an
+-- order is archived its lines move to order_items_archive with it. Embedding
+-- order_items(...) keeps working through the computed relationships below.
+
+-- 1. Rebuild orders as a partitioned table and copy the existing rows.
+
+alter table public.order_items drop constraint if exists order_items_order_id_fkey;
+
+alter table public.orders rename to orders_unpartitioned;
+
+create table public.orders (
+  id uuid not null default gen_random_uuid(),
+  customer_name text not null,
+  customer_phone text,
+  address text,
+  total numeric not null,
+  status text not null default 'pending',
+  created_at timestamp with time zone not null default timezone('utc'::text, now()),
+  updated_at timestamp with time zone default timezone('utc'::text, now())
+) partition by range (created_at);
+
+-- Creates the monthly partitions from p_from (default: this month) through
+-- p_months_ahead months from now. Partitions are only reachable through
+-- orders, so RLS is enabled on them without policies.
+create or replace function public.ensure_order_partitions(p_from date default null, p_months_ahead int default 3)
+returns void as $$
+declare
+  v_month date;
+  v_name text;
+begin
+  for v_month in
+    select generate_series(
+      date_trunc('month', coalesce(p_from, timezone('utc'::text, now())::date)::timestamp),
+      date_trunc('month', timezone('utc'::text, now())) + make_interval(months => p_months_ahead),
+      interval '1 month'
+    )::date
+  loop
+    v_name := 'orders_' || to_char(v_month, 'YYYY_MM');
+    execute format(
+      'create table if not exists public.%I partition of public.orders for values from (%L) to (%L)',
+      v_name,
+      v_month::timestamp at time zone 'utc',
+      (v_month + interval '1 month')::timestamp at time zone 'utc'
+    );
+    execute format('alter table public.%I enable row level security', v_name);
+  end loop;
+end;
+$$ language plpgsql security definer set search_path = public;
+
+-- Rows outside every monthly range (a clock far off) land here instead of failing.
+create table if not exists public.orders_default partition of public.orders default;
+alter table public.orders_default enable row level security;
+
+select public.ensure_order_partitions((select min(created_at)::date from public.orders_unpartitioned));
+
+insert into public.orders (id, customer_name, customer_phone, address, total, status, created_at, updated_at)
+select id, customer_name, customer_phone, address, total, status, coalesce(created_at, timezone('utc'::text, now())), updated_at
+from public.orders_unpartitioned;
+
+drop table public.orders_unpartitioned;
+
+alter table public.orders add primary key (id, created_at);
+
+-- Same indexes as 20261018120000_orders_feed_indexes, now on every partition.
+create index if not exists orders_active_feed_idx
+  on public.orders (created_at desc, id desc)
+  where status in ('pending', 'preparing', 'ready');
+create index if not exists orders_status_feed_idx
+  on public.orders (status, created_at desc, id desc);
+create index if not exists orders_updated_at_idx
+  on public.orders (updated_at);
+
+-- order_items follow their order through the partition key.
+alter table public.order_items add column if not exists order_created_at timestamp with time zone;
+
+update public.order_items l
+set order_created_at = o.created_at
+from public.orders o
+where o.id = l.order_id;
+
+-- Lines whose order is gone were orphans already; the cascade that removed
+-- them went with the old foreign key.
+delete from public.order_items where order_created_at is null;
+
+alter table public.order_items alter column order_created_at set not null;
+
+alter table public.order_items
+  add constraint order_items_order_fkey foreign key (order_id, order_created_at)
+  references public.orders (id, created_at) on delete cascade;
+
+-- place_order inserts lines by order id only; the key's created_at is filled in here.
+create or replace function public.set_order_item_created_at()
+returns trigger as $$
+begin
+  if new.order_created_at is null then
+    select o.created_at into new.order_created_at from public.orders o where o.id = new.order_id;
+  end if;
+  return new;
+end;
+$$ language plpgsql security definer set search_path = public;
+
+create or replace trigger order_items_set_order_created_at
+  before insert on public.order_items
+  for each row execute procedure public.set_order_item_created_at();
+
+-- Same access as 20261018125000_restrict_order_writes: clients never insert
+-- or delete (place_order does), staff read orders and update only their status.
+alter table public.orders enable row level security;
+
+revoke all on public.orders from anon;
+revoke insert, update, delete, truncate on public.orders from authenticated;
+grant update (status) on public.orders to authenticated;
+
+create policy "Staff can view orders" on public.orders
+  for select to authenticated using (public.is_staff());
+create policy "Staff can update orders" on public.orders
+  for update to authenticated using (public.is_staff()) with check (public.is_staff());
+
+create or replace trigger orders_touch_updated_at
+  before update on public.orders
+  for each row execute procedure public.touch_updated_at();
+
+-- Realtime sees changes on the partitions; publishing them as orders keeps
+-- the dashboard's subscription to the orders table working.
+do $$
+begin
+  if exists (select 1 from pg_publication where pubname = 'supabase_realtime') then
+    alter publication supabase_realtime set (publish_via_partition_root = true);
+    if not exists (
+      select 1 from pg_publication_tables
+      where pubname = 'supabase_realtime' and schemaname = 'public' and tablename = 'orders'
+    ) then
+      alter publication supabase_realtime add table public.orders;
+    end if;
+  end if;
+end $$;
+
+-- 2. Archive of delivered orders, read-only for staff.
+
+create table if not exists public.orders_archive (
+  id uuid primary key,
+  customer_name text not null,
+  customer_phone text,
+  address text,
+  total numeric not null,
+  status text not null default 'delivered',
+  created_at timestamp with time zone not null,
+  updated_at timestamp with time zone,
+  archived_at timestamp with time zone not null default timezone('utc'::text, now())
+);
+
+create index if not exists orders_archive_feed_idx
+  on public.orders_archive (created_at desc, id desc);
+
+alter table public.orders_archive enable row level security;
+
+revoke all on public.orders_archive from anon;
+revoke insert, update, delete, truncate on public.orders_archive from authenticated;
+
+create policy "Staff can view archived orders" on public.orders_archive
+  for select to authenticated using (public.is_staff());
+
+-- Delivered history and order details read through this view.
+create or replace view public.order_history with (security_invoker = true) as
+  select id, customer_name, customer_phone, address, total, status, created_at, updated_at
+  from public.orders
+  union all
+  select id, customer_name, customer_phone, address, total, status, created_at, updated_at
+  from public.orders_archive;
+
+revoke all on public.order_history from anon;
+
+-- Lines of archived orders, moved together with them.
+create table if not exists public.order_items_archive (
+  id uuid primary key,
+  order_id uuid not null references public.orders_archive(id) on delete cascade,
+  product_id uuid references public.products(id) on delete set null,
+  name text not null,
+  price numeric not null,
+  quantity integer not null check (quantity > 0),
+  line_no integer not null default 0
+);
+
+create index if not exists order_items_archive_order_id_idx
+  on public.order_items_archive (order_id, line_no);
+
+alter table public.order_items_archive enable row level security;
+
+revoke all on public.order_items_archive from anon;
+revoke insert, update, delete, truncate on public.order_items_archive from authenticated;
+
+create policy "Staff can view archived order lines" on public.order_items_archive
+  for select to authenticated using (public.is_staff());
+
+-- Computed relationships: embedding order_items(...) from orders or
+-- order_history works as it did with the foreign key on order_id alone. From
+-- order_history it also returns the lines of archived orders.
+create or replace function public.order_items(public.orders)
+returns setof public.order_items rows 8 as $$
+  select * from public.order_items where order_id = $1.id;
+$$ language sql stable;
+
+create or replace function public.order_items(public.order_history)
+returns setof public.order_items rows 8 as $$
+  select * from public.order_items where order_id = $1.id
+  union all
+  select a.id, a.order_id, a.product_id, a.name, a.price, a.quantity, a.line_no, $1.created_at
+  from public.order_items_archive a
+  where a.order_id = $1.id;
+$$ language sql stable;
+
+-- 3. Archival job.
+
+-- Moves delivered orders created more than p_older_than ago, with their lines,
+-- into orders_archive and order_items_archive, then drops monthly partitions
+-- that are past the cutoff and empty. Returns the number of orders moved.
+create or replace function public.archive_delivered_orders(p_older_than interval default interval '30 days')
+returns integer as $$
+declare
+  v_cutoff timestamp with time zone := timezone('utc'::text, now()) - p_older_than;
+  v_moved integer;
+  v_partition text;
+  v_empty boolean;
+begin
+  -- One statement: every part reads the same snapshot, so the lines are copied
+  -- before the delete's cascade removes them from order_items.
+  with moved as (
+    delete from public.orders o
+    where o.status = 'delivered' and o.created_at < v_cutoff
+    returning o.*
+  ), archived as (
+    insert into public.orders_archive (id, customer_name, customer_phone, address, total, status, created_at, updated_at)
+    select id, customer_name, customer_phone, address, total, status, created_at, updated_at from moved
+    returning id
+  ), archived_lines as (
+    insert into public.order_items_archive (id, order_id, product_id, name, price, quantity, line_no)
+    select l.id, l.order_id, l.product_id, l.name, l.price, l.quantity, l.line_no
+    from public.order_items l
+    join archived a on a.id = l.order_id
+  )
+  select count(*) into v_moved from archived;
+
+  for v_partition in
+    select c.relname
+    from pg_inherits i
+    join pg_class c on c.oid = i.inhrelid
+    where i.inhparent = 'public.orders'::regclass
+      and c.relname ~ '^orders_\d{4}_\d{2}$'
+      and to_date(substring(c.relname from 8), 'YYYY_MM') + interval '1 month' <= v_cutoff
+  loop
+    execute format('select not exists (select 1 from public.%I)', v_partition) into v_empty;
+    if v_empty then
+      -- Detached first: order_items_order_fkey references every partition
+      execute format('alter table public.orders detach partition public.%I', v_partition);
+      execute format('drop table public.%I', v_partition);
+    end if;
+  end loop;
+
+  return v_moved;
+end;
+$$ language plpgsql security definer set search_path = public;
+
+-- Nightly schedule where pg_cron is available (it is on Supabase). The
+-- archive age is the argument of the job: to change it, schedule
+-- 'archive-delivered-orders' again with another interval.
+do $$
+begin
+  if exists (select 1 from pg_extension where extname = 'pg_cron') then
+    perform cron.schedule('ensure-order-partitions', '0 3 * * *', $job$select public.ensure_order_partitions()$job$);
+    perform cron.schedule(
+      'archive-delivered-orders', '15 3 * * *',
+      $job$select public.archive_delivered_orders(interval '30 days')$job$
+    );
+  else
+    raise notice 'pg_cron is not installed: run ensure_order_partitions() and archive_delivered_orders() from another scheduler';
+  end if;
+end $$;
@@ -0,0 +1,212 @@
+-- Sales summaries for the dashboard's Reportes tab.
+--
+-- Three small tables hold daily revenue, orders per hour of the day and units
+-- per product and day. Statement-level triggers add each checkout to them as it
+-- is placed, so a report over years reads a few hundred summary rows instead
+-- of every order. Orders are never cancelled or edited after placement, and
+-- moving them to orders_archive is not a sale being undone, so only inserts
+-- are counted.
+--
+-- Days and hours are the restaurant's local ones: sales_timezone() is the one
+-- place where its zone is set, and sales_local_time() is the only conversion
+-- the triggers, the rebuild and sales_report use. After changing the zone,
+-- rebuild the tables with refresh_sales_reports().
+
+create or replace function public.sales_timezone()
+returns text as $$
+  select 'America/Argentina/Buenos_Aires'::text;
+$$ language sql immutable;
+
+-- Wall-clock time at the restaurant, so an order at 23:30 local counts on
+-- that day even though it is already the next day in UTC.
+create or replace function public.sales_local_time(p_at timestamp with time zone)
+returns timestamp as $$
+  select p_at at time zone public.sales_timezone();
+$$ language sql immutable;
+
+create table if not exists public.sales_daily (
+  day date primary key,
+  orders integer not null default 0,
+  revenue numeric not null default 0
+);
+
+create table if not exists public.sales_hourly (
+  day date not null,
+  hour integer not null check (hour between 0 and 23),
+  orders integer not null default 0,
+  revenue numeric not null default 0,
+  primary key (day, hour)
+);
+
+-- Keyed by the line's name snapshot, like the order history shows it;
+-- product_id is the last one seen under that name (null once deleted).
+create table if not exists public.product_sales_daily (
+  day date not null,
+  name text not null,
+  product_id uuid,
+  units integer not null default 0,
+  revenue numeric not null default 0,
+  primary key (day, name)
+);
+
+-- Only admins read the summaries.
+create or replace function public.is_admin()
+returns boolean as $$
+  select exists (select 1 from public.profiles where id = auth.uid() and role = 'admin');
+$$ language sql stable security definer set search_path = public;
+
+alter table public.sales_daily enable row level security;
+alter table public.sales_hourly enable row level security;
+alter table public.product_sales_daily enable row level security;
+
+create policy "Sales reports are viewable by admins" on public.sales_daily
+  for select using (public.is_admin());
+create policy "Sales reports are viewable by admins" on public.sales_hourly
+  for select using (public.is_admin());
+create policy "Sales reports are viewable by admins" on public.product_sales_daily
+  for select using (public.is_admin());
+
+-- Incremental maintenance: one upsert per bucket touched by the statement.
+
+create or replace function public.count_order_sales()
+returns trigger as $$
+begin
+  insert into public.sales_daily as s (day, orders, revenue)
+  select date_trunc('day', public.sales_local_time(o.created_at))::date, count(*), sum(o.total)
+  from new_orders o
+  group by 1
+  on conflict (day) do update
+    set orders = s.orders + excluded.orders, revenue = s.revenue + excluded.revenue;
+
+  insert into public.sales_hourly as s (day, hour, orders, revenue)
+  select date_trunc('day', o.local_time)::date, extract(hour from o.local_time)::integer, count(*), sum(o.total)
+  from (select public.sales_local_time(created_at) as local_time, total from new_orders) o
+  group by 1, 2
+  on conflict (day, hour) do update
+    set orders = s.orders + excluded.orders, revenue = s.revenue + excluded.revenue;
+
+  return null;
+end;
+$$ language plpgsql security definer set search_path = public;
+
+create or replace trigger orders_count_sales
+  after insert on public.orders
+  referencing new table as new_orders
+  for each statement execute procedure public.count_order_sales();
+
+-- Lines carry their order's created_at (order_items_order_fkey), so no lookup
+-- of the order is needed.
+create or replace function public.count_product_sales()
+returns trigger as $$
+begin
+  insert into public.product_sales_daily as s (day, name, product_id, units, revenue)
+  select
+    date_trunc('day', public.sales_local_time(l.order_created_at))::date,
+    l.name,
+    (array_agg(l.product_id) filter (where l.product_id is not null))[1],
+    sum(l.quantity),
+    sum(l.price * l.quantity)
+  from new_lines l
+  group by 1, 2
+  on conflict (day, name) do update
+    set units = s.units + excluded.units,
+        revenue = s.revenue + excluded.revenue,
+        product_id = coalesce(excluded.product_id, s.product_id);
+
+  return null;
+end;
+$$ language plpgsql security definer set search_path = public;
+
+create or replace trigger order_items_count_sales
+  after insert on public.order_items
+  referencing new table as new_lines
+  for each statement execute procedure public.count_product_sales();
+
+-- Full rebuild from orders and orders_archive: the backfill below, and the way
+-- to recover after changing sales_timezone(). Checkouts wait for it to finish.
+create or replace function public.refresh_sales_reports()
+returns void as $$
+begin
+  lock table public.sales_daily, public.sales_hourly, public.product_sales_daily in exclusive mode;
+  delete from public.sales_daily;
+  delete from public.sales_hourly;
+  delete from public.product_sales_daily;
+
+  insert into public.sales_daily (day, orders, revenue)
+  select date_trunc('day', public.sales_local_time(created_at))::date, count(*), sum(total)
+  from public.order_history
+  group by 1;
+
+  insert into public.sales_hourly (day, hour, orders, revenue)
+  select date_trunc('day', o.local_time)::date, extract(hour from o.local_time)::integer, count(*), sum(o.total)
+  from (select public.sales_local_time(created_at) as local_time, total from public.order_history) o
+  group by 1, 2;
+
+  insert into public.product_sales_daily (day, name, product_id, units, revenue)
+  select
+    date_trunc('day', public.sales_local_time(o.created_at))::date,
+    l.name,
+    (array_agg(l.product_id) filter (where l.product_id is not null))[1],
+    sum(l.quantity),
+    sum(l.price * l.quantity)
+  from (
+    select order_id, product_id, name, price, quantity from public.order_items
+    union all
+    select order_id, product_id, name, price, quantity from public.order_items_archive
+  ) l
+  join public.order_history o on o.id = l.order_id
+  group by 1, 2;
+end;
+$$ language plpgsql security definer set search_path = public;
+
+revoke execute on function public.refresh_sales_reports() from public, anon, authenticated;
+
+select public.refresh_sales_reports();
+
+-- Everything the Reportes tab shows for the last p_days days (today included)
+-- in one round trip: daily totals, orders per hour of the day and the p_top
+-- best-selling products. Runs as the caller, so non-admins get empty lists.
+-- timezone is sales_timezone(), so the client labels days and hours with the
+-- zone they were bucketed in instead of keeping its own copy.
+create or replace function public.sales_report(p_days integer default 30, p_top integer default 10)
+returns jsonb as $$
+  with bounds as (
+    select today - (greatest(p_days, 1) - 1) as day_from, today as day_to
+    from (select date_trunc('day', public.sales_local_time(now()))::date as today) t
+  )
+  select jsonb_build_object(
+    'from', b.day_from,
+    'to', b.day_to,
+    'timezone', public.sales_timezone(),
+    'daily', coalesce((
+      select jsonb_agg(jsonb_build_object('day', s.day, 'orders', s.orders, 'revenue', s.revenue) order by s.day)
+      from public.sales_daily s
+      where s.day between b.day_from and b.day_to
+    ), '[]'::jsonb),
+    'hourly', coalesce((
+      select jsonb_agg(jsonb_build_object('hour', h.hour, 'orders', h.orders, 'revenue', h.revenue) order by h.hour)
+      from (
+        select hour, sum(orders) as orders, sum(revenue) as revenue
+        from public.sales_hourly
+        where day between b.day_from and b.day_to
+        group by hour
+      ) h
+    ), '[]'::jsonb),
+    'products', coalesce((
+      select jsonb_agg(jsonb_build_object('name', p.name, 'units', p.units, 'revenue', p.revenue)
+                       order by p.units desc, p.revenue desc, p.name)
+      from (
+        select name, sum(units) as units, sum(revenue) as revenue
+        from public.product_sales_daily
+        where day between b.day_from and b.day_to
+        group by name
+        order by 2 desc, 3 desc, 1
+        limit greatest(p_top, 1)
+      ) p
+    ), '[]'::jsonb)
+  )
+  from bounds b;
+$$ language sql stable set search_path = public;
+
+revoke execute on function public.sales_report(integer, integer) from public, anon;
+grant execute on function public.sales_report(integer, integer) to authenticated;
@@ -0,0 +1,43 @@
+-- Published menu: the active products, grouped and ordered by category, as one
+-- versioned JSON document in the public "menu" Storage bucket (menu.json). The
+-- public Menu page fetches that file and revalidates it with its ETag instead
+-- of querying products.
+--
+-- The admin app republishes it after every product change and whenever an
+-- admin opens product management with a stale copy (dataService.publishMenu).
+-- The document is built here by menu_document(), so its shape lives in one
+-- place; version is catalog_versions' version for products, which tells a stale
+-- copy apart.
+
+insert into storage.buckets (id, name, public)
+values ('menu', 'menu', true)
+on conflict (id) do nothing;
+
+-- Anyone reads the public URL; only admins write. Overwriting (upsert) needs
+-- the select and update policies as well as insert.
+create policy "Admins publish the menu" on storage.objects
+  for insert to authenticated with check (bucket_id = 'menu' and public.is_admin());
+create policy "Admins read the published menu" on storage.objects
+  for select to authenticated using (bucket_id = 'menu' and public.is_admin());
+create policy "Admins replace the published menu" on storage.objects
+  for update to authenticated using (bucket_id = 'menu' and public.is_admin());
+
+-- {"version": 12, "published_at": "...", "categories": [{"name": "...", "products": [...]}]}
+-- Categories by name, products by name within each, like products_menu_idx
+-- reads them. The version and the products come from the same snapshot.
+create or replace function public.menu_document()
+returns jsonb as $$
+  select jsonb_build_object(
+    'version', (select version from public.catalog_versions where name = 'products'),
+    'published_at', timezone('utc'::text, now()),
+    'categories', coalesce((
+      select jsonb_agg(jsonb_build_object('name', c.category, 'products', c.products) order by c.category)
+      from (
+        select p.category, jsonb_agg(to_jsonb(p) order by p.name) as products
+        from public.products p
+        where p.active
+        group by p.category
+      ) c
+    ), '[]'::jsonb)
+  );
+$$ language sql stable;
@@ -1,3 +1,7 @@
+-- Baseline schema for a new project, as it was before versioned migrations.
+-- Every change since is a file in supabase/migrations, applied on top of this
+-- with testsprite_tests/migrate.py (or `supabase db push`).
+
 -- Create Products Table
 create table public.products (
   id uuid default gen_random_uuid() primary key,
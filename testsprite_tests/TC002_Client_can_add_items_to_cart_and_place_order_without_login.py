@@ -2,33 +2,15 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import CartPanel, MenuPage
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -49,70 +31,70 @@ async def run_test():
         # -> Add 'Hamburguesa Simple' to the cart and then add 'cono de papas' to the cart.
         frame = context.pages[-1]
         # Click 'Agregar al Carrito' button for Hamburguesa Simple
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = MenuPage(frame).add_to_cart_button("Hamburguesa Simple")
+        await steps.click(elem)
         
 
         # -> Try to increase quantity of 'Hamburguesa Simple' to 2 and verify cart updates total price correctly.
         frame = context.pages[-1]
         # Click '+' button to increase quantity of 'Hamburguesa Simple' in cart
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/div[2]/div/ul/li/div[2]/div[2]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = CartPanel(frame).increment_button()
+        await steps.click(elem)
         
 
         # -> Click 'Finalizar Pedido' button to proceed to checkout and submit the order as guest user.
         frame = context.pages[-1]
         # Click 'Finalizar Pedido' button to proceed to checkout
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = MenuPage(frame).category("Burgers")
+        await steps.click(elem)
         
 
         # -> Click 'Agregar al Carrito' button for 'Hamburguesa Simple' to add it to the cart.
         frame = context.pages[-1]
         # Click 'Agregar al Carrito' button for 'Hamburguesa Simple'
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = MenuPage(frame).add_to_cart_button("Hamburguesa Simple")
+        await steps.click(elem)
         
 
         # -> Try to add another product to the cart or increase quantity of 'Hamburguesa Simple' to test cart updates.
         frame = context.pages[-1]
         # Click '+' button to increase quantity of 'Hamburguesa Simple' in cart to 2
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/div[2]/div/ul/li/div[2]/div[2]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = CartPanel(frame).increment_button()
+        await steps.click(elem)
         
 
         frame = context.pages[-1]
         # Click 'Finalizar Pedido' button to proceed to checkout
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = CartPanel(frame).checkout_button
+        await steps.click(elem)
         
 
         # -> Click 'Agregar al Carrito' button for 'Hamburguesa Simple' (index 9) and then for 'cono de papas' (index 11) to add both to cart.
         frame = context.pages[-1]
         # Click 'Agregar al Carrito' for Hamburguesa Simple
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = MenuPage(frame).add_to_cart_button("Hamburguesa Simple")
+        await steps.click(elem)
         
 
         # -> Click 'Agregar al Carrito' button for 'cono de papas' at index 11 to add it to the cart.
         frame = context.pages[-1]
         # Click 'Agregar al Carrito' button for cono de papas
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div[2]/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = MenuPage(frame).add_to_cart_button("cono de papas")
+        await steps.click(elem)
         
 
         # -> Click '+' button (index 5) to increase quantity of 'cono de papas' in cart and verify subtotal updates.
         frame = context.pages[-1]
         # Click '+' button to increase quantity of 'cono de papas' in cart
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div/div[2]/div/ul/li/div[2]/div[2]/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = CartPanel(frame).increment_button()
+        await steps.click(elem)
         
 
         # -> Click 'Finalizar Pedido' button (index 6) to proceed to checkout and submit the order.
         frame = context.pages[-1]
         # Click 'Finalizar Pedido' button to proceed to checkout and submit the order
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = CartPanel(frame).checkout_button
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -121,15 +103,8 @@ async def run_test():
             await expect(frame.locator('text=Order Successfully Processed! Thank you for your purchase.').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The order submission did not succeed as expected. Guest users should be able to add multiple items to the cart, update quantities, see correct total in ARS, and submit the order without authentication.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
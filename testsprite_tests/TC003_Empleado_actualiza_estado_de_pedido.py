@@ -2,35 +2,16 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser, role="employee") as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto("http://localhost:3000/#/dashboard", wait_until="commit", timeout=10000)
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,80 +27,22 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click on 'Acceso Personal' to go to login page.
-        frame = context.pages[-1]
-        # Click on 'Acceso Personal' to go to login page
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input employee email and password, then click 'Iniciar sesión' button.
-        frame = context.pages[-1]
-        # Input employee email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('franabrate@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input employee password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('fran12345')
-        
-
-        frame = context.pages[-1]
-        # Click 'Iniciar sesión' button to login as employee
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # -> The context starts signed in as Employee, so the dashboard opens directly.
+        await steps.settle()
         
 
         # -> Scroll down or find an order with status 'PENDIENTE' to select for state change.
         await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
         
 
-        # -> Try to reload the dashboard page to attempt to load active orders again.
-        await page.goto('http://localhost:3000/#/dashboard', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Input employee credentials and login again to access dashboard.
-        frame = context.pages[-1]
-        # Input employee email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('franabrate@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input employee password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('fran12345')
-        
-
-        frame = context.pages[-1]
-        # Click 'Iniciar sesión' button to login as employee
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Try to reload the page and attempt login again or try alternative approach to access orders.
-        await page.goto('http://localhost:3000/#/login', timeout=10000)
-        await asyncio.sleep(3)
-        
-
         # --> Assertions to verify final state
         frame = context.pages[-1]
         try:
             await expect(frame.locator('text=Estado de pedido actualizado correctamente').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: The order status change did not reflect correctly as required by the test plan to verify employee can change order status between pendiente, preparando, listo, and entregado.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
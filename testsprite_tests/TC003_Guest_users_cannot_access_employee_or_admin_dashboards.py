@@ -2,33 +2,14 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -48,32 +29,25 @@ async def run_test():
         # Interact with the page elements to simulate user flow
         # -> Attempt to navigate to the Employee dashboard URL as a guest to verify access control.
         await page.goto('http://localhost:3000/employee', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Attempt to navigate to the Admin dashboard URL as a guest to verify access control.
         await page.goto('http://localhost:3000/admin', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Attempt to navigate to the order management page URL as a guest to verify access control.
         await page.goto('http://localhost:3000/orders', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
         await expect(frame.locator('text=Fresco y Local').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Pide comida deliciosa directamente para tu mesa.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,33 +2,15 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import LoginPage, Navbar
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -49,27 +31,27 @@ async def run_test():
         # -> Click on 'Acceso Personal' to navigate to the login page.
         frame = context.pages[-1]
         # Click on 'Acceso Personal' link to go to the login page.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).login_link
+        await steps.click(elem)
         
 
         # -> Input employee email and password, then submit the login form.
         frame = context.pages[-1]
         # Input employee email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'lukaariasm@gmail.com')
         
 
         frame = context.pages[-1]
         # Input employee password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('12345')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, '12345')
         
 
         frame = context.pages[-1]
         # Click on 'Iniciar sesión' button to submit login form
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -78,15 +60,8 @@ async def run_test():
             await expect(frame.locator('text=Access to product management granted').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: Employee should not have access to product management or user management sections as per the test plan.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
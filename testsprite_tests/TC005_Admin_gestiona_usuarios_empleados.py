@@ -2,35 +2,17 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import DashboardPage
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser, role="admin") as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto("http://localhost:3000/#/dashboard", wait_until="commit", timeout=10000)
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,104 +28,15 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click on 'Acceso Personal' to access login page for Admin login.
-        frame = context.pages[-1]
-        # Click on 'Acceso Personal' to go to login page
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input Admin credentials and click 'Iniciar sesión' to log in as Admin.
-        frame = context.pages[-1]
-        # Input Admin email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input Admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('luka12345')
-        
-
-        frame = context.pages[-1]
-        # Click 'Iniciar sesión' button to log in as Admin
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # -> The context starts signed in as Admin, so the dashboard opens directly.
+        await steps.settle()
         
 
         # -> Click on 'Gestión de Empleados' to access employee management panel.
         frame = context.pages[-1]
         # Click 'Gestión de Empleados' to open employee management panel
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div[2]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input Admin credentials again and log in to regain access to Admin dashboard.
-        frame = context.pages[-1]
-        # Input Admin email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input Admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('luka12345')
-        
-
-        frame = context.pages[-1]
-        # Click 'Iniciar sesión' button to log in as Admin
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Reload the page to try to recover from the stuck login screen and regain access to Admin dashboard.
-        await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Try to find and click 'Acceso Personal' or equivalent login button to access Admin login page.
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
-
-        await page.mouse.wheel(0, -await page.evaluate('() => window.innerHeight'))
-        
-
-        # -> Click on 'Acceso Personal' button to navigate to Admin login page.
-        frame = context.pages[-1]
-        # Click on 'Acceso Personal' to go to login page
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Reload the login page to try to recover from the loading state and regain access to the login form.
-        await page.goto('http://localhost:3000/#/login', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Input Admin email and password, then click 'Iniciar sesión' to log in as Admin.
-        frame = context.pages[-1]
-        # Input Admin email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input Admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('luka12345')
-        
-
-        frame = context.pages[-1]
-        # Click 'Iniciar sesión' button to log in as Admin
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Reload the login page to try to recover from the stuck login state and attempt login again.
-        await page.goto('http://localhost:3000/#/login', timeout=10000)
-        await asyncio.sleep(3)
+        elem = DashboardPage(frame).tab("employees")
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -152,15 +45,8 @@ async def run_test():
             await expect(frame.locator('text=Registro de empleado exitoso').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: The Admin was unable to register a new employee via Silent Signup or manage employees from the panel as required by the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,33 +2,15 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import LoginPage, Navbar
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -49,75 +31,75 @@ async def run_test():
         # -> Click on 'Acceso Personal' to attempt access to private panels without authentication.
         frame = context.pages[-1]
         # Click on 'Acceso Personal' to try accessing private employee or admin panel without authentication.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).login_link
+        await steps.click(elem)
         
 
         # -> Try to access private employee or admin panel URL directly without authentication to verify access denial and redirection.
         await page.goto('http://localhost:3000/#/admin', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Click on 'Acceso Personal' to proceed to login form for Employee login.
         frame = context.pages[-1]
         # Click on 'Acceso Personal' to go to login form.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).login_link
+        await steps.click(elem)
         
 
         # -> Input Employee email and password, then click 'Iniciar sesión' to log in.
         frame = context.pages[-1]
         # Input Employee email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('franabrate@gmail.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'franabrate@gmail.com')
         
 
         frame = context.pages[-1]
         # Input Employee password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('fran12345')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'fran12345')
         
 
         frame = context.pages[-1]
         # Click 'Iniciar sesión' to log in as Employee
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # -> Try to access admin panel or user/product management views as Employee to verify access restrictions.
         await page.goto('http://localhost:3000/#/admin', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Attempt to access user or product management functionalities as Employee to verify permission restrictions.
         await page.goto('http://localhost:3000/#/usuarios', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Click on 'Panel de Control' to navigate to main dashboard and then log out Employee.
         frame = context.pages[-1]
         # Click on 'Panel de Control' to go to main dashboard.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).dashboard_link
+        await steps.click(elem)
         
 
         # -> Input Admin email and password, then click 'Iniciar sesión' to log in as Admin.
         frame = context.pages[-1]
         # Input Admin email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'lukaariasm@gmail.com')
         
 
         frame = context.pages[-1]
         # Input Admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('luka12345')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'luka12345')
         
 
         frame = context.pages[-1]
         # Click 'Iniciar sesión' to log in as Admin
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -126,15 +108,8 @@ async def run_test():
             await expect(frame.locator('text=Acceso Concedido a Panel de Administración').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Access control verification failed. Roles Cliente, Empleado, and Admin do not have correct access permissions, or backend/Supabase RLS did not block unauthorized access as expected.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
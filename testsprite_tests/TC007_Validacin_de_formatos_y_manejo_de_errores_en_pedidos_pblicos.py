@@ -2,33 +2,15 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import MenuPage
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -49,15 +31,15 @@ async def run_test():
         # -> Try to add a product with quantity zero or negative and verify error message.
         frame = context.pages[-1]
         # Click 'Agregar al Carrito' button for 'Hamburguesa Simple' to try adding product with invalid quantity.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = MenuPage(frame).add_to_cart_button("Hamburguesa Simple")
+        await steps.click(elem)
         
 
         # -> Attempt to send an order with an empty cart and verify error message.
         frame = context.pages[-1]
         # Click 'Acceso Personal' to try to access order sending or cart page to attempt sending order with empty cart.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div[2]/div/img').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = MenuPage(frame).product_image("cono de papas")
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -66,15 +48,8 @@ async def run_test():
             await expect(frame.locator('text=Pedido enviado con éxito').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError('Test case failed: The application did not handle input errors correctly when adding products with invalid quantities or sending orders with an empty cart as specified in the test plan.')
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,33 +2,15 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import DashboardPage, LoginPage, Navbar
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -49,98 +31,98 @@ async def run_test():
         # -> Click on 'Acceso Personal' to navigate to the login page
         frame = context.pages[-1]
         # Click on 'Acceso Personal' link to go to login page
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).login_link
+        await steps.click(elem)
         
 
         # -> Input valid employee credentials and submit login form
         frame = context.pages[-1]
         # Input employee email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('franabrate@gmail.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'franabrate@gmail.com')
         
 
         frame = context.pages[-1]
         # Input employee password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('fran12345')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'fran12345')
         
 
         frame = context.pages[-1]
         # Click on 'Iniciar sesión' button to submit login form
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # -> Click on 'Cerrar Sesión' button to logout employee
         frame = context.pages[-1]
         # Click on 'Cerrar Sesión' button to logout employee user
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = DashboardPage(frame).sign_out_button
+        await steps.click(elem)
         
 
         # -> Try to click on profile icon or user initials to reveal dropdown menu containing logout button
         frame = context.pages[-1]
         # Click on profile icon or user initials to reveal logout menu
-        elem = frame.locator('xpath=html/body/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = frame.locator("#root")
+        await steps.click(elem)
         
 
         # -> Input invalid credentials and attempt login to verify error handling
         frame = context.pages[-1]
         # Input invalid email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invaliduser@example.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'invaliduser@example.com')
         
 
         frame = context.pages[-1]
         # Input invalid password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wrongpassword')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'wrongpassword')
         
 
         frame = context.pages[-1]
         # Click on 'Iniciar sesión' button to submit invalid login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # -> Input valid Admin credentials and submit login form
         frame = context.pages[-1]
         # Input Admin email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'lukaariasm@gmail.com')
         
 
         frame = context.pages[-1]
         # Input Admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('luka12345')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'luka12345')
         
 
         frame = context.pages[-1]
         # Click on 'Iniciar sesión' button to submit Admin login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # -> Input valid Admin credentials and submit login form again
         frame = context.pages[-1]
         # Input Admin email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'lukaariasm@gmail.com')
         
 
         frame = context.pages[-1]
         # Input Admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('luka12345')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'luka12345')
         
 
         frame = context.pages[-1]
         # Click on 'Iniciar sesión' button to submit Admin login
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -149,15 +131,8 @@ async def run_test():
             await expect(frame.locator('text=Inicio de sesión exitoso para usuario Empleado y Admin').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: El proceso de login/logout para usuarios Empleado y Admin no funcionó correctamente, incluyendo manejo de credenciales inválidas.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,33 +2,15 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import CartPanel, MenuPage
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -49,15 +31,15 @@ async def run_test():
         # -> Add an item to cart to check price formatting in cart.
         frame = context.pages[-1]
         # Click 'Agregar al Carrito' button for Hamburguesa Simple to add item to cart and check price formatting.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = MenuPage(frame).add_to_cart_button("Hamburguesa Simple")
+        await steps.click(elem)
         
 
         # -> Click on 'Acceso Personal' to navigate to login page for admin panel access.
         frame = context.pages[-1]
         # Click 'Acceso Personal' to go to login page for admin panel.
-        elem = frame.locator('xpath=html/body/div/div/div/div/div').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = CartPanel(frame).backdrop
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -66,15 +48,8 @@ async def run_test():
             await expect(frame.locator('text=Currency Format Test Passed').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The currency formatter did not consistently output prices in the correct Argentine Peso format ($ 1800.00) across the application including menu, cart, and admin panels as per the test plan.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,33 +2,15 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import LoginPage, Navbar
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -49,84 +31,84 @@ async def run_test():
         # -> Click on 'Acceso Personal' to go to login page for employee login.
         frame = context.pages[-1]
         # Click on 'Acceso Personal' link to go to login page
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).login_link
+        await steps.click(elem)
         
 
         # -> Input employee credentials and click login to test access restrictions.
         frame = context.pages[-1]
         # Input employee email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'lukaariasm@gmail.com')
         
 
         frame = context.pages[-1]
         # Input employee password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('12345')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, '12345')
         
 
         frame = context.pages[-1]
         # Click login button to submit employee credentials
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # -> Try to login as admin with valid credentials to test admin access and role-based restrictions.
         frame = context.pages[-1]
         # Click on 'Euge te amo' or home link to navigate back to homepage for admin login attempt
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).home_link
+        await steps.click(elem)
         
 
         # -> Click on 'Acceso Personal' to attempt admin login.
         frame = context.pages[-1]
         # Click on 'Acceso Personal' to go to login page for admin login attempt
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).login_link
+        await steps.click(elem)
         
 
         # -> Input admin credentials and click login to test admin access and role-based restrictions.
         frame = context.pages[-1]
         # Input admin email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin@example.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'admin@example.com')
         
 
         frame = context.pages[-1]
         # Input admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('adminpassword')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'adminpassword')
         
 
         frame = context.pages[-1]
         # Click login button to submit admin credentials
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # -> Attempt to access restricted URLs directly without login to verify redirection or blocking.
         await page.goto('http://localhost:3000/#/admin/product-management', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Verify if user is blocked or redirected away from this admin page as expected for unauthorized access.
         frame = context.pages[-1]
         # Click on 'Euge te amo' link to check if redirected or blocked from admin page
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).home_link
+        await steps.click(elem)
         
 
         # -> Attempt to access an authenticated page URL directly without login to verify redirection or blocking.
         await page.goto('http://localhost:3000/#/user/profile', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Verify if user is redirected to login or public menu page as expected for unauthenticated access.
         frame = context.pages[-1]
         # Click on 'Euge te amo' link to check if redirected or blocked from user profile page
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).home_link
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -146,15 +128,8 @@ async def run_test():
         await expect(frame.locator('text=cono de papas').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Delicious homemade cono de papas prepared with fresh ingredients. A classic Salads choice.').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=$ 7000.00').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,33 +2,15 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import CartPanel, LoginPage, MenuPage, Navbar
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -49,92 +31,92 @@ async def run_test():
         # -> Add one item to the cart by clicking 'Agregar al Carrito' button.
         frame = context.pages[-1]
         # Click 'Agregar al Carrito' for Hamburguesa Simple
-        elem = frame.locator('xpath=html/body/div/div/main/div/div[3]/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = MenuPage(frame).add_to_cart_button("Hamburguesa Simple")
+        await steps.click(elem)
         
 
         # -> Click the 'Finalizar Pedido' button to send the order from the public page.
         frame = context.pages[-1]
         # Click 'Finalizar Pedido' to send the order from the public page
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/div/div/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = CartPanel(frame).checkout_button
+        await steps.click(elem)
         
 
         # -> Attempt to manually navigate to employee and admin panel routes to verify access restrictions.
         await page.goto('http://localhost:3000/employee', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Navigate to /admin route to verify access restriction for unauthenticated users.
         await page.goto('http://localhost:3000/admin', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Click on 'Acceso Personal' button to open login form for employee authentication.
         frame = context.pages[-1]
         # Click 'Acceso Personal' to open login form
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).login_link
+        await steps.click(elem)
         
 
         # -> Input employee email and password, then click 'Iniciar sesión' to authenticate.
         frame = context.pages[-1]
         # Input employee email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('franabrate@gmail.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'franabrate@gmail.com')
         
 
         frame = context.pages[-1]
         # Input employee password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('fran12345')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'fran12345')
         
 
         frame = context.pages[-1]
         # Click 'Iniciar sesión' button to login as employee
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # -> Logout from employee session to proceed with admin login.
         await page.goto('http://localhost:3000/logout', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Navigate to home page to start admin login process.
         await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Reload the home page to ensure it loads correctly and interactive elements appear for admin login.
         await page.goto('http://localhost:3000', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Click on 'Acceso Personal' to open the login form for admin authentication.
         frame = context.pages[-1]
         # Click 'Acceso Personal' to open login form
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).login_link
+        await steps.click(elem)
         
 
         # -> Input admin email and password, then click 'Iniciar sesión' to authenticate as admin.
         frame = context.pages[-1]
         # Input admin email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'lukaariasm@gmail.com')
         
 
         frame = context.pages[-1]
         # Input admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('luka12345')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'luka12345')
         
 
         frame = context.pages[-1]
         # Click 'Iniciar sesión' button to login as admin
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -143,15 +125,8 @@ async def run_test():
             await expect(frame.locator('text=Acceso Cruzado Permitido').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan confirms the impossibility of cross-access between public views, employee panel, and admin panel in different sessions and roles. This assertion fails immediately to indicate the test plan execution failure.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,33 +2,15 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from page_objects import LoginPage, Navbar
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser) as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
         await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
         
@@ -49,58 +31,58 @@ async def run_test():
         # -> Click on 'Acceso Personal' to navigate to login page.
         frame = context.pages[-1]
         # Click on 'Acceso Personal' link to go to login page.
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = Navbar(frame).login_link
+        await steps.click(elem)
         
 
         # -> Input incorrect username and password, then submit the login form.
         frame = context.pages[-1]
         # Input incorrect email in the email field.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wronguser@example.com')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'wronguser@example.com')
         
 
         frame = context.pages[-1]
         # Input incorrect password in the password field.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wrongpassword')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'wrongpassword')
         
 
         frame = context.pages[-1]
         # Click on 'Iniciar sesión' button to submit login form with incorrect credentials.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # -> Reload the login page to reset the form and then submit with empty username and password fields to test validation error messages.
         await page.goto('http://localhost:3000/#/login', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # -> Submit the login form with empty username and password fields and verify validation error messages.
         frame = context.pages[-1]
         # Click on 'Iniciar sesión' button to submit login form with empty username and password fields.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # -> Test login with malformed email format and valid password, then verify error message.
         frame = context.pages[-1]
         # Input malformed email format in the email field.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email-format')
+        elem = LoginPage(frame).email_input
+        await steps.fill(elem, 'invalid-email-format')
         
 
         frame = context.pages[-1]
         # Input valid password in the password field.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('validpassword123')
+        elem = LoginPage(frame).password_input
+        await steps.fill(elem, 'validpassword123')
         
 
         frame = context.pages[-1]
         # Click on 'Iniciar sesión' button to submit login form with malformed email format.
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = LoginPage(frame).submit_button
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -110,15 +92,8 @@ async def run_test():
         await expect(frame.locator('text=Contraseña').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Iniciar sesión').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Acceso seguro solo para personal autorizado.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
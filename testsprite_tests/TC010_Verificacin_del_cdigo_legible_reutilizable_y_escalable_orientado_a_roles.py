@@ -2,35 +2,16 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
+from harness import scenario
+from steps import Steps
+
+
+async def run_test(browser=None):
+    async with scenario(browser, role="admin") as (context, page):
+        steps = Steps(context)
+
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto("http://localhost:3000/#/dashboard", wait_until="commit", timeout=10000)
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,45 +27,18 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Start by executing linters and style validators on the code base to check for errors and warnings.
-        await page.goto('http://localhost:3000/admin/login', timeout=10000)
-        await asyncio.sleep(3)
-        
-
-        # -> Try to find and click on 'Acceso Personal' button to navigate to login page.
-        frame = context.pages[-1]
-        # Click on 'Acceso Personal' button to navigate to login page
-        elem = frame.locator('xpath=html/body/div/div/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # -> The context starts signed in as Admin, so the dashboard opens directly.
+        await steps.settle()
         
 
-        # -> Input admin email and password, then click 'Iniciar sesión' to log in as admin.
-        frame = context.pages[-1]
-        # Input admin email
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('lukaariasm@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input admin password
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('luka12345')
-        
-
-        frame = context.pages[-1]
-        # Click 'Iniciar sesión' button to log in as admin
-        elem = frame.locator('xpath=html/body/div/div/main/div/div/div[2]/div/form/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Try to reload the page to recover the dashboard and access the required elements for further testing.
-        await page.goto('http://localhost:3000/admin/login#/dashboard', timeout=10000)
-        await asyncio.sleep(3)
+        # -> Start by executing linters and style validators on the code base to check for errors and warnings.
+        await page.goto('http://localhost:3000/admin/login', timeout=10000)
+        await steps.settle()
         
 
         # -> Since the dashboard UI is not accessible, switch focus to static code analysis by running linters and style validators directly on the code base outside the UI.
         await page.goto('http://localhost:3000/admin/code', timeout=10000)
-        await asyncio.sleep(3)
+        await steps.settle()
         
 
         # --> Assertions to verify final state
@@ -93,15 +47,8 @@ async def run_test():
             await expect(frame.locator('text=Modularidad y reutilización garantizadas').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError("Test plan execution failed: The static review and basic tests to confirm modular, reusable, and easily extensible code without overengineering did not pass.")
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+        await steps.finish()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
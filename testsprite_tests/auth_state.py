@@ -0,0 +1,159 @@
+"""Signed-in browser state for the staff scenarios.
+
+Typing credentials into the Supabase Auth UI costs every staff scenario
+several actions (and the generated scripts often retried them). Instead,
+each role signs in once through the GoTrue password grant and the session
+is written into a Playwright storage state, under the localStorage key
+supabase-js reads on startup. ``harness.scenario(browser, role="admin")``
+loads it into the context, so the scenario opens ``/#/dashboard`` already
+signed in.
+
+Sessions are cached in ``tmp/auth/<role>.json`` until shortly before they
+expire, so consecutive runs do not sign in again either. Credentials
+default to the seeded stand-in accounts and can be overridden with
+``TESTSPRITE_ADMIN_EMAIL`` / ``TESTSPRITE_ADMIN_PASSWORD`` (and the
+``EMPLOYEE`` equivalents).
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from http_client import HttpClient
+
+SUITE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SUITE_DIR.parent
+STATE_DIR = SUITE_DIR / "tmp" / "auth"
+CLIENT_CONFIG = REPO_ROOT / "services" / "supabaseClient.ts"
+
+ROLES = {
+    "admin": ("lukaariasm@gmail.com", "luka12345"),
+    "employee": ("franabrate@gmail.com", "fran12345"),
+}
+# Re-use a cached session only while it stays valid for at least this long.
+MIN_VALIDITY_S = 300
+
+_locks = {}
+_states = {}
+
+
+class AuthError(Exception):
+    pass
+
+
+def credentials(role):
+    email, password = ROLES[role]
+    prefix = f"TESTSPRITE_{role.upper()}_"
+    return os.environ.get(prefix + "EMAIL", email), os.environ.get(prefix + "PASSWORD", password)
+
+
+def read_env_file(path=REPO_ROOT / ".env"):
+    values = {}
+    if path.exists():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            name, sep, value = line.partition("=")
+            if sep and not name.strip().startswith("#"):
+                values[name.strip()] = value.strip().strip("'\"")
+    return values
+
+
+def supabase_config():
+    """Return ``(url, anon key)`` the way the app resolves them.
+
+    Environment variables win, then the repository's ``.env``, then the
+    manual constants in services/supabaseClient.ts.
+    """
+    env_file = read_env_file()
+    source = CLIENT_CONFIG.read_text(encoding="utf-8")
+
+    def resolve(key, constant):
+        value = os.environ.get(f"VITE_{key}") or env_file.get(f"VITE_{key}")
+        if value:
+            return value
+        match = re.search(rf'const {constant} = "([^"]*)"', source)
+        return match.group(1) if match else ""
+
+    return resolve("SUPABASE_URL", "MANUAL_URL"), resolve("SUPABASE_ANON_KEY", "MANUAL_ANON_KEY")
+
+
+def storage_key(supabase_url):
+    """The localStorage key supabase-js v2 persists the session under."""
+    return f"sb-{urlsplit(supabase_url).hostname.split('.')[0]}-auth-token"
+
+
+def storage_state(session, supabase_url, app_url):
+    parts = urlsplit(app_url)
+    return {
+        "cookies": [],
+        "origins": [{
+            "origin": f"{parts.scheme}://{parts.netloc}",
+            "localStorage": [{"name": storage_key(supabase_url), "value": json.dumps(session)}],
+        }],
+    }
+
+
+async def sign_in(role, supabase_url, anon_key):
+    """Return a GoTrue session for ``role`` via the password grant."""
+    email, password = credentials(role)
+    client = HttpClient(supabase_url, headers={"apikey": anon_key}, max_connections=1)
+    try:
+        response = await client.request(
+            "POST", "/auth/v1/token", params={"grant_type": "password"},
+            json_body={"email": email, "password": password},
+        )
+    finally:
+        await client.close()
+    if not response.ok:
+        body = response.json() or {}
+        message = body.get("msg") or body.get("error_description") or response.body[:200]
+        raise AuthError(f"Signing in as {role} ({email}) failed with {response.status}: {message}")
+
+    session = response.json()
+    session.setdefault("expires_at", int(time.time()) + session.get("expires_in", 3600))
+    return session
+
+
+def load_cached(path, supabase_url):
+    if not path.exists():
+        return None
+    cached = json.loads(path.read_text(encoding="utf-8"))
+    if cached.get("supabase_url") != supabase_url:
+        return None
+    if cached["session"].get("expires_at", 0) - time.time() < MIN_VALIDITY_S:
+        return None
+    return cached["session"]
+
+
+async def session_for(role, supabase_url=None, anon_key=None):
+    """GoTrue session for ``role`` on ``supabase_url`` (default: the app's project).
+
+    Signs in at most once per process and session; tools that talk to the
+    project directly send its ``access_token`` instead of the anon key.
+    """
+    if role not in ROLES:
+        raise ValueError(f"Unknown role {role!r}; expected one of {sorted(ROLES)}")
+    if supabase_url is None:
+        supabase_url, anon_key = supabase_config()
+    key = (role, supabase_url)
+    lock = _locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        if key not in _states:
+            path = STATE_DIR / f"{role}.json"
+            session = load_cached(path, supabase_url)
+            if session is None:
+                session = await sign_in(role, supabase_url, anon_key)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps({"supabase_url": supabase_url, "session": session}), encoding="utf-8")
+            _states[key] = session
+    return _states[key]
+
+
+async def state_for(role, app_url):
+    """Storage state for ``role``, signed in to the app's project."""
+    supabase_url, _ = supabase_config()
+    session = await session_for(role)
+    return storage_state(session, supabase_url, app_url)
@@ -0,0 +1,348 @@
+"""Realtime fan-out benchmark for the staff order dashboard.
+
+Every open Dashboard subscribes OrderList.tsx to ``postgres_changes`` on the
+whole ``orders`` table. This opens N simulated subscribers, injects orders
+at a controlled rate and measures, per subscriber, the delay from the
+insert request to
+
+* the realtime event arriving (raw websocket and browser subscribers),
+* the new row rendering in OrderList (browser subscribers only).
+
+Raw websocket subscribers join the same channel the app does and cost a few
+kilobytes each, so they show how far the realtime service scales; browser
+subscribers run the real dashboard in headless Playwright contexts and show
+what a kitchen screen or tablet actually sees.
+
+    python testsprite_tests/fanout.py --ws 200 --rate 2 --orders 40
+    python testsprite_tests/fanout.py --browsers 5 --ws 50 --rate 1 --orders 20
+
+The default target is the local stand-in (``python -m local_supabase``);
+browser subscribers additionally need the dev server. Orders are readable by
+staff only, so every subscriber (and the injector) uses one employee session
+from auth_state.py: raw subscribers join with its access token, browsers load
+it as their storage state.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import secrets
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+import auth_state
+import loadgen
+from http_client import HttpClient
+from local_supabase import websocket
+from local_supabase.realtime import decode
+from stats import summarize
+
+APP_URL = "http://localhost:3000"
+# Same channel and binding as OrderList.tsx
+CHANNEL_TOPIC = "realtime:schema-db-changes"
+CHANNEL_CONFIG = {
+    "broadcast": {"ack": False, "self": False},
+    "presence": {"key": ""},
+    "postgres_changes": [{"event": "*", "schema": "public", "table": "orders"}],
+    "private": False,
+}
+HEARTBEAT_S = 25
+MARKER_PREFIX = "Fanout"
+
+# Reports the first time each injected order's marker text is rendered.
+RENDER_SCRIPT = """
+(() => {
+  const seen = new Set();
+  const pattern = /%s [0-9a-f]+-\\d+/g;
+  const scan = (node) => {
+    const text = node.textContent || '';
+    for (const marker of text.match(pattern) || []) {
+      if (!seen.has(marker)) {
+        seen.add(marker);
+        window.__fanoutRendered && window.__fanoutRendered(marker, Date.now());
+      }
+    }
+  };
+  new MutationObserver((mutations) => {
+    for (const mutation of mutations) mutation.addedNodes.forEach(scan);
+  }).observe(document, { childList: true, subtree: true });
+})();
+""" % MARKER_PREFIX
+
+
+def realtime_url(url, anon_key):
+    parts = urlsplit(url)
+    scheme = "wss" if parts.scheme == "https" else "ws"
+    query = urlencode({"apikey": anon_key, "vsn": "1.0.0"})
+    return f"{scheme}://{parts.netloc}/realtime/v1/websocket?{query}"
+
+
+def insert_marker(message):
+    """Return the marker of an INSERT ``postgres_changes`` frame, if any."""
+    if isinstance(message, bytes):
+        return None
+    try:
+        _, _, _, event, payload = decode("1.0.0", message)
+    except (ValueError, KeyError, TypeError):
+        return None
+    if event != "postgres_changes":
+        return None
+    data = payload.get("data") or {}
+    name = (data.get("record") or {}).get("customer_name") or ""
+    if data.get("type") == "INSERT" and name.startswith(MARKER_PREFIX):
+        return name
+    return None
+
+
+class WsSubscriber:
+    """A raw Phoenix client joined to the dashboard's channel."""
+
+    kind = "ws"
+
+    def __init__(self, index, url, anon_key, access_token):
+        self.name = f"ws-{index}"
+        self.url = realtime_url(url, anon_key)
+        self.access_token = access_token
+        self.events = {}
+        self._ws = None
+        self._tasks = []
+        self._joined = asyncio.Event()
+
+    async def start(self):
+        self._ws = await websocket.connect(self.url)
+        self._tasks = [asyncio.ensure_future(self._listen()), asyncio.ensure_future(self._heartbeat())]
+        await self._ws.send(json.dumps({
+            "topic": CHANNEL_TOPIC,
+            "event": "phx_join",
+            "payload": {"config": CHANNEL_CONFIG, "access_token": self.access_token},
+            "ref": "1",
+            "join_ref": "1",
+        }))
+        await self._joined.wait()
+
+    async def _listen(self):
+        try:
+            while True:
+                message = await self._ws.recv()
+                received = time.time()
+                marker = insert_marker(message)
+                if marker:
+                    self.events.setdefault(marker, received)
+                elif isinstance(message, str) and '"phx_reply"' in message:
+                    self._joined.set()
+        except websocket.ConnectionClosed:
+            self._joined.set()
+
+    async def _heartbeat(self):
+        ref = 1
+        while True:
+            await asyncio.sleep(HEARTBEAT_S)
+            ref += 1
+            await self._ws.send(json.dumps({"topic": "phoenix", "event": "heartbeat", "payload": {}, "ref": str(ref)}))
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        if self._ws:
+            await self._ws.close()
+
+
+class BrowserSubscriber:
+    """A headless Dashboard showing OrderList, signed in with the employee storage state."""
+
+    kind = "browser"
+
+    def __init__(self, index, browser, storage_state, app_url):
+        self.name = f"browser-{index}"
+        self.browser = browser
+        self.storage_state = storage_state
+        self.app_url = app_url
+        self.events = {}
+        self.renders = {}
+        self.context = None
+
+    def _on_frame(self, payload):
+        marker = insert_marker(payload)
+        if marker:
+            self.events.setdefault(marker, time.time())
+
+    def _on_websocket(self, ws):
+        ws.on("framereceived", self._on_frame)
+
+    async def start(self):
+        self.context = await self.browser.new_context(storage_state=self.storage_state)
+        await self.context.expose_binding(
+            "__fanoutRendered", lambda source, marker, ts: self.renders.setdefault(marker, ts / 1000)
+        )
+        await self.context.add_init_script(RENDER_SCRIPT)
+        page = await self.context.new_page()
+        page.on("websocket", self._on_websocket)
+        await page.goto(f"{self.app_url}/#/dashboard")
+        await page.get_by_text("Pedidos Entrantes").wait_for(timeout=30000)
+
+    async def stop(self):
+        if self.context:
+            await self.context.close()
+
+
+async def inject(client, products, rate, count, run_id):
+    """Insert ``count`` orders at ``rate`` per second; return marker -> sent time."""
+    rng = random.Random(run_id)
+    sent, failed = {}, 0
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async def one(sequence):
+        nonlocal failed
+        order = loadgen.build_order(products, rng, sequence)
+        order["p_customer_name"] = f"{MARKER_PREFIX} {run_id}-{sequence}"
+        sent_at = time.time()
+        try:
+            response = await loadgen.place_order(client, order)
+        except (asyncio.TimeoutError, ConnectionError, OSError):
+            response = None
+        if response is not None and response.ok:
+            sent[order["p_customer_name"]] = sent_at
+        else:
+            failed += 1
+
+    tasks = []
+    for i in range(count):
+        delay = started + i / rate - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.ensure_future(one(i + 1)))
+    await asyncio.gather(*tasks)
+    return sent, failed
+
+
+def delays(group, sent, attribute):
+    """Milliseconds from each insert request to its arrival at every subscriber."""
+    return [
+        (getattr(sub, attribute)[marker] - sent_at) * 1000
+        for sub in group
+        for marker, sent_at in sent.items()
+        if marker in getattr(sub, attribute)
+    ]
+
+
+def report(subscribers, sent):
+    result = {}
+    for kind in sorted({s.kind for s in subscribers}):
+        group = [s for s in subscribers if s.kind == kind]
+        expected = len(sent) * len(group)
+        event_delays = delays(group, sent, "events")
+        entry = {
+            "subscribers": len(group),
+            "expected_events": expected,
+            "missed_events": expected - len(event_delays),
+            "insert_to_event": summarize(event_delays),
+        }
+        if kind == "browser":
+            render_delays = delays(group, sent, "renders")
+            entry["insert_to_render"] = summarize(render_delays)
+            entry["missed_renders"] = expected - len(render_delays)
+        result[kind] = entry
+    return result
+
+
+async def run_fanout(args):
+    # RLS only delivers order events to staff, so subscribe as the employee
+    session = await auth_state.session_for("employee", args.url, args.anon_key)
+    token = session["access_token"]
+    headers = {"apikey": args.anon_key, "Authorization": f"Bearer {token}"}
+    client = HttpClient(args.url, headers=headers, max_connections=50)
+    run_id = secrets.token_hex(3)
+    subscribers = [WsSubscriber(i, args.url, args.anon_key, token) for i in range(1, args.ws + 1)]
+
+    pw = browser = None
+    try:
+        products = await loadgen.fetch_products(client)
+        if args.browsers:
+            from playwright import async_api
+            from harness import launch_browser
+
+            pw = await async_api.async_playwright().start()
+            browser = await launch_browser(pw, shared=True)
+            state = await auth_state.state_for("employee", args.app_url)
+            subscribers += [
+                BrowserSubscriber(i, browser, state, args.app_url) for i in range(1, args.browsers + 1)
+            ]
+
+        print(f"Connecting {len(subscribers)} subscribers...")
+        started = time.perf_counter()
+        await asyncio.gather(*(s.start() for s in subscribers))
+        print(f"  subscribed in {time.perf_counter() - started:.1f}s; injecting {args.orders} orders at {args.rate}/s")
+
+        sent, failed = await inject(client, products, args.rate, args.orders, run_id)
+        await asyncio.sleep(args.drain)
+    finally:
+        await asyncio.gather(*(s.stop() for s in subscribers), return_exceptions=True)
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
+        await client.close()
+
+    return {
+        "url": args.url,
+        "rate": args.rate,
+        "orders_inserted": len(sent),
+        "orders_failed": failed,
+        "results": report(subscribers, sent),
+    }
+
+
+def print_report(result):
+    print(f"{result['orders_inserted']} orders inserted ({result['orders_failed']} failed)")
+    for kind, entry in result["results"].items():
+        for metric in ("insert_to_event", "insert_to_render"):
+            if metric not in entry:
+                continue
+            s = entry[metric]
+            fmt = lambda v: f"{v:.1f}" if v is not None else "-"
+            print(
+                f"{kind:<8} x{entry['subscribers']:<5} {metric:<17} p50 {fmt(s['p50_ms']):>8}  "
+                f"p95 {fmt(s['p95_ms']):>8}  p99 {fmt(s['p99_ms']):>8}  max {fmt(s['max_ms']):>8}"
+            )
+        print(f"{kind:<8} missed events: {entry['missed_events']}/{entry['expected_events']}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=loadgen.DEFAULT_URL, help="Supabase project URL")
+    parser.add_argument("--anon-key", default=os.environ.get("VITE_SUPABASE_ANON_KEY", "local-anon-key"))
+    parser.add_argument("--ws", type=int, default=0, help="Raw websocket subscribers")
+    parser.add_argument("--browsers", type=int, default=0, help="Headless dashboard subscribers")
+    parser.add_argument("--rate", type=float, default=1, help="Orders inserted per second")
+    parser.add_argument("--orders", type=int, default=20, help="Orders to insert")
+    parser.add_argument("--drain", type=float, default=5, help="Seconds to wait for late events")
+    parser.add_argument("--app-url", default=APP_URL, help="Dev server used by browser subscribers")
+    parser.add_argument("--output", type=Path, help="Write the report as JSON")
+    parser.add_argument("--allow-remote", action="store_true", help="Permit a non-local target")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not args.ws and not args.browsers:
+        print("Nothing to measure: pass --ws and/or --browsers.", file=sys.stderr)
+        return 2
+    if urlsplit(args.url).hostname not in loadgen.LOCAL_HOSTS and not args.allow_remote:
+        print(f"Refusing to benchmark {args.url} without --allow-remote.", file=sys.stderr)
+        return 2
+
+    result = asyncio.run(run_fanout(args))
+    print_report(result)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Shared browser plumbing for the TestSprite scenarios.
+
+Each TC*.py file exposes ``run_test(browser=None)``. Run on its own, the
+scenario starts its own Playwright instance and Chromium exactly as the
+generated scripts used to. When ``run_suite.py`` passes in a shared
+browser, the scenario only opens an isolated context on it, so a full pass
+pays for a single cold browser start.
+
+Staff scenarios pass ``role="admin"`` or ``role="employee"`` and start
+signed in (see auth_state.py) instead of typing credentials.
+"""
+
+import contextlib
+import contextvars
+
+from playwright import async_api
+
+import auth_state
+from metrics import PageMetrics
+
+BASE_URL = "http://localhost:3000"
+DEFAULT_TIMEOUT_MS = 5000
+
+# Standalone runs keep the flags the generated scripts were recorded with.
+STANDALONE_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+    "--single-process"                # Run the browser in a single process mode
+]
+
+# A shared browser hosts many contexts at once, which --single-process
+# cannot do reliably, so the suite runner drops it.
+SHARED_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+]
+
+
+# Per-scenario collectors (wait savings, metrics, ...) registered by helpers
+# created inside a scenario. The suite runner opens one session per task.
+_session = contextvars.ContextVar("scenario_session", default=None)
+
+
+def track():
+    """Start collecting helpers for the scenario running in this task."""
+    session = {}
+    _session.set(session)
+    return session
+
+
+def attach(name, collector):
+    """Register ``collector`` with the current scenario session, if any."""
+    session = _session.get()
+    if session is not None:
+        session[name] = collector
+
+
+async def launch_browser(pw, shared=False, headless=True):
+    """Launch Chromium with the argument set for standalone or shared use."""
+    return await pw.chromium.launch(
+        headless=headless,
+        args=SHARED_ARGS if shared else STANDALONE_ARGS,
+    )
+
+
+@contextlib.asynccontextmanager
+async def scenario(browser=None, role=None):
+    """Yield ``(context, page)`` for one scenario.
+
+    With no ``browser`` a private Playwright session and Chromium are
+    started and torn down around the scenario. With a shared ``browser``
+    only the context is created and closed here; the caller owns the
+    browser. Page metrics are recorded for every scenario either way.
+    With a ``role`` the context starts with that role's Supabase session.
+    """
+    pw = None
+    own_browser = None
+    context = None
+    metrics = None
+
+    try:
+        if browser is None:
+            pw = await async_api.async_playwright().start()
+            own_browser = await launch_browser(pw)
+            browser = own_browser
+
+        # Create a new browser context (like an incognito window)
+        storage_state = await auth_state.state_for(role, BASE_URL) if role else None
+        context = await browser.new_context(storage_state=storage_state)
+        context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        metrics = PageMetrics(context)
+        await metrics.install()
+
+        page = await context.new_page()
+        yield context, page
+
+    finally:
+        try:
+            if metrics:
+                await metrics.collect()
+        finally:
+            # A page that crashed or closed can make collect() fail; still release everything
+            if context:
+                await context.close()
+            if own_browser:
+                await own_browser.close()
+            if pw:
+                await pw.stop()
@@ -0,0 +1,251 @@
+"""Local history of suite runs with step-level timing.
+
+``tmp/test_results.json`` and ``tmp/raw_report.md`` only hold the latest
+pass/fail verdicts. ``run_suite.py`` additionally appends every run, every
+scenario and every recorded step (clicks, fills, waits, page loads) with its
+duration to a SQLite file, and this module reports on it:
+
+    python testsprite_tests/history.py runs
+    python testsprite_tests/history.py timeline TC004_Employee [--run 12]
+    python testsprite_tests/history.py slowest --runs 10
+    python testsprite_tests/history.py trend TC004 --runs 20
+"""
+
+import argparse
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+SUITE_DIR = Path(__file__).resolve().parent
+DEFAULT_PATH = SUITE_DIR / "tmp" / "history.sqlite"
+
+SCHEMA = """
+create table if not exists runs (
+  id integer primary key autoincrement,
+  started_at text not null,
+  git_commit text,
+  workers integer,
+  wall_time_s real,
+  total integer,
+  passed integer,
+  failed integer,
+  error integer
+);
+
+create table if not exists scenarios (
+  id integer primary key autoincrement,
+  run_id integer not null references runs(id) on delete cascade,
+  file text not null,
+  test_id text not null,
+  title text,
+  status text not null,
+  error text,
+  duration_s real
+);
+
+create table if not exists steps (
+  scenario_id integer not null references scenarios(id) on delete cascade,
+  seq integer not null,
+  step text not null,
+  target text,
+  offset_ms real,
+  duration_ms real,
+  legacy_wait_ms real,
+  ok integer not null default 1,
+  primary key (scenario_id, seq)
+);
+
+create index if not exists scenarios_file_idx on scenarios (file, run_id);
+"""
+
+
+def connect(path=DEFAULT_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.row_factory = sqlite3.Row
+    db.execute("pragma foreign_keys = on")
+    db.executescript(SCHEMA)
+    return db
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=SUITE_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def record_run(report, path=DEFAULT_PATH):
+    """Store one ``run_suite`` report; return the new run id."""
+    summary = report["summary"]
+    with connect(path) as db:
+        run_id = db.execute(
+            "insert into runs (started_at, git_commit, workers, wall_time_s, total, passed, failed, error)"
+            " values (?, ?, ?, ?, ?, ?, ?, ?)",
+            (report["started_at"], current_commit(), report["workers"], report["wall_time_s"],
+             summary["total"], summary["passed"], summary["failed"], summary["error"]),
+        ).lastrowid
+        for result in report["scenarios"]:
+            scenario_id = db.execute(
+                "insert into scenarios (run_id, file, test_id, title, status, error, duration_s)"
+                " values (?, ?, ?, ?, ?, ?, ?)",
+                (run_id, Path(result["file"]).stem, result["id"], result["title"], result["status"],
+                 result["error"], result.get("duration_s")),
+            ).lastrowid
+            db.executemany(
+                "insert into steps (scenario_id, seq, step, target, offset_ms, duration_ms, legacy_wait_ms, ok)"
+                " values (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (scenario_id, seq, s["step"], s.get("target"), s.get("offset_ms"), s["waited_ms"],
+                     s["legacy_wait_ms"], int(s.get("ok", True)))
+                    for seq, s in enumerate(result.get("steps", []), 1)
+                ],
+            )
+    return run_id
+
+
+# --- Reports ---
+
+def latest_run_id(db):
+    row = db.execute("select max(id) from runs").fetchone()
+    return row[0]
+
+
+def recent_run_ids(db, runs):
+    return [r[0] for r in db.execute("select id from runs order by id desc limit ?", (runs,))]
+
+
+def placeholders(values):
+    return ",".join("?" * len(values))
+
+
+def show_runs(db, limit):
+    print(f"{'run':>5}  {'started':<25} {'commit':<9} {'passed':>9} {'wall s':>8}")
+    for row in db.execute("select * from runs order by id desc limit ?", (limit,)):
+        print(
+            f"{row['id']:>5}  {row['started_at'][:25]:<25} {row['git_commit'] or '-':<9} "
+            f"{row['passed']:>4}/{row['total']:<4} {row['wall_time_s']:>8.1f}"
+        )
+
+
+def show_timeline(db, scenario, run_id, width=40):
+    run_id = run_id or latest_run_id(db)
+    rows = db.execute(
+        "select s.file, s.status, s.duration_s, st.* from scenarios s"
+        " left join steps st on st.scenario_id = s.id"
+        " where s.run_id = ? and s.file like ? order by s.file, st.seq",
+        (run_id, f"{scenario or ''}%"),
+    ).fetchall()
+    if not rows:
+        print(f"No scenarios matching {scenario!r} in run {run_id}.")
+        return
+
+    current = None
+    for row in rows:
+        if row["file"] != current:
+            current = row["file"]
+            total_ms = (row["duration_s"] or 0) * 1000 or 1
+            print(f"\n{current} [{row['status']}] {row['duration_s']}s (run {run_id})")
+        if row["seq"] is None:
+            continue
+        start = int((row["offset_ms"] or 0) / total_ms * width)
+        length = max(1, int(row["duration_ms"] / total_ms * width))
+        bar = " " * min(start, width - 1) + "#" * min(length, width - min(start, width - 1))
+        flag = "" if row["ok"] else "  FAILED"
+        print(
+            f"  {row['seq']:>3} {row['offset_ms'] or 0:>8.0f}ms {row['duration_ms']:>8.0f}ms |{bar:<{width}}| "
+            f"{row['step']:<9} {(row['target'] or '')[:60]}{flag}"
+        )
+
+
+def show_slowest(db, runs, limit):
+    run_ids = recent_run_ids(db, runs)
+    if not run_ids:
+        print("No runs recorded yet.")
+        return
+    rows = db.execute(
+        "select s.file, st.seq, st.step, st.target, count(*) as samples,"
+        " avg(st.duration_ms) as avg_ms, max(st.duration_ms) as max_ms, avg(st.legacy_wait_ms) as legacy_ms"
+        " from steps st join scenarios s on s.id = st.scenario_id"
+        f" where s.run_id in ({placeholders(run_ids)})"
+        " group by s.file, st.seq, st.step, st.target order by avg_ms desc limit ?",
+        (*run_ids, limit),
+    ).fetchall()
+    print(f"Slowest steps over the last {len(run_ids)} run(s):")
+    print(f"{'avg ms':>9} {'max ms':>9} {'n':>4}  {'scenario':<40} {'#':>3} step")
+    for row in rows:
+        print(
+            f"{row['avg_ms']:>9.0f} {row['max_ms']:>9.0f} {row['samples']:>4}  {row['file'][:40]:<40} "
+            f"{row['seq']:>3} {row['step']} {(row['target'] or '')[:50]}"
+        )
+
+
+def show_trend(db, scenario, runs):
+    run_ids = recent_run_ids(db, runs)
+    if not run_ids:
+        print("No runs recorded yet.")
+        return
+    rows = db.execute(
+        "select s.file, s.run_id, s.status, s.duration_s,"
+        " (select sum(duration_ms) from steps where scenario_id = s.id and step != 'navigate') as waited_ms"
+        " from scenarios s"
+        f" where s.run_id in ({placeholders(run_ids)}) and s.file like ?"
+        " order by s.file, s.run_id",
+        (*run_ids, f"{scenario or ''}%"),
+    ).fetchall()
+
+    current = None
+    for row in rows:
+        if row["file"] != current:
+            current = row["file"]
+            print(f"\n{current}")
+            print(f"  {'run':>5} {'status':<7} {'duration s':>10} {'waits s':>8}")
+        waited = (row["waited_ms"] or 0) / 1000
+        print(f"  {row['run_id']:>5} {row['status']:<7} {row['duration_s'] or 0:>10.2f} {waited:>8.2f}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, default=DEFAULT_PATH, help="History database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runs = commands.add_parser("runs", help="List recorded runs")
+    runs.add_argument("--limit", type=int, default=20)
+
+    timeline = commands.add_parser("timeline", help="Per-step timeline of each scenario in a run")
+    timeline.add_argument("scenario", nargs="?", help="Scenario file prefix, e.g. TC004")
+    timeline.add_argument("--run", type=int, help="Run id (default: latest)")
+
+    slowest = commands.add_parser("slowest", help="Slowest steps averaged over recent runs")
+    slowest.add_argument("--runs", type=int, default=10)
+    slowest.add_argument("--limit", type=int, default=20)
+
+    trend = commands.add_parser("trend", help="Scenario durations across recent runs")
+    trend.add_argument("scenario", nargs="?", help="Scenario file prefix, e.g. TC004")
+    trend.add_argument("--runs", type=int, default=10)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    db = connect(args.db)
+    try:
+        if args.command == "runs":
+            show_runs(db, args.limit)
+        elif args.command == "timeline":
+            show_timeline(db, args.scenario, args.run)
+        elif args.command == "slowest":
+            show_slowest(db, args.runs, args.limit)
+        else:
+            show_trend(db, args.scenario, args.runs)
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+"""Small keep-alive HTTP/1.1 client on asyncio streams.
+
+The benchmark tools need thousands of concurrent requests without pulling
+in aiohttp, so this pools persistent connections per client and speaks
+just enough HTTP/1.1 (Content-Length and chunked bodies) for PostgREST and
+GoTrue responses.
+"""
+
+import asyncio
+import json
+import ssl
+from urllib.parse import urlencode, urlsplit
+
+
+class HttpResponse:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class HttpClient:
+    def __init__(self, base_url, headers=None, max_connections=100, timeout=30):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.netloc = parts.netloc
+        self.base_path = parts.path.rstrip("/")
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self._idle = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def _connect(self):
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def request(self, method, path, params=None, json_body=None, headers=None):
+        target = self.base_path + path
+        if params:
+            target += "?" + urlencode(params)
+        body = json.dumps(json_body).encode() if json_body is not None else b""
+
+        merged = {"Host": self.netloc, **self.headers, **(headers or {})}
+        if json_body is not None:
+            merged.setdefault("Content-Type", "application/json")
+        merged["Content-Length"] = str(len(body))
+        head = f"{method} {target} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in merged.items()) + "\r\n"
+
+        async with self._slots:
+            reused = bool(self._idle)
+            reader, writer = self._idle.pop() if reused else await self._connect()
+            try:
+                response = await self._exchange(reader, writer, head.encode() + body, method)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                if not reused:
+                    raise
+                # The server closed an idle keep-alive connection; retry once fresh.
+                reader, writer = await self._connect()
+                response = await self._exchange(reader, writer, head.encode() + body, method)
+            if response.headers.get("connection", "").lower() == "close":
+                writer.close()
+            else:
+                self._idle.append((reader, writer))
+            return response
+
+    async def _exchange(self, reader, writer, payload, method):
+        try:
+            writer.write(payload)
+            await writer.drain()
+            return await asyncio.wait_for(self._read_response(reader, method), self.timeout)
+        except BaseException:
+            writer.close()
+            raise
+
+    async def _read_response(self, reader, method):
+        head = await reader.readuntil(b"\r\n\r\n")
+        status_line, *lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+        status = int(status_line.split(" ", 2)[1])
+        headers = {}
+        for line in lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if method == "HEAD" or status in (204, 304):
+            return HttpResponse(status, headers, b"")
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip(), 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            return HttpResponse(status, headers, b"".join(chunks))
+        if "content-length" in headers:
+            return HttpResponse(status, headers, await reader.readexactly(int(headers["content-length"])))
+        return HttpResponse(status, headers, await reader.read())
+
+    async def close(self):
+        for _, writer in self._idle:
+            writer.close()
+        self._idle.clear()
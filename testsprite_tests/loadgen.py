@@ -0,0 +1,236 @@
+"""Load generator for anonymous order placement (the public checkout).
+
+Simulates guest carts built from the live ``products`` list and posts them
+the way Cart.tsx -> dataService.createOrder does: an unauthenticated
+``rpc('place_order', ...).single()`` with product ids and quantities, which
+prices the cart and inserts the order inside the database. Arrivals follow an open
+model (orders per second, independent of response time), shaped by a ramp,
+step or spike profile, and every stage reports throughput, p50/p95/p99
+latency and error rates.
+
+    python testsprite_tests/loadgen.py ramp --peak 50 --stages 5 --stage-duration 30
+    python testsprite_tests/loadgen.py step --rates 5,20,40 --stage-duration 20
+    python testsprite_tests/loadgen.py spike --base 5 --peak 120 --spike-duration 10
+
+The default target is the local stand-in (``python -m local_supabase``);
+pointing at a remote project requires ``--allow-remote``.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from http_client import HttpClient
+from stats import summarize
+
+DEFAULT_URL = "http://127.0.0.1:54321"
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+
+class Stage:
+    def __init__(self, name, rate, duration_s):
+        self.name = name
+        self.rate = rate
+        self.duration_s = duration_s
+        self.sent = 0
+        self.dropped = 0
+        self.latencies_ms = []
+        self.errors = {}
+
+    def record(self, latency_ms, error=None):
+        if error is None:
+            self.latencies_ms.append(latency_ms)
+        else:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def report(self):
+        ok = len(self.latencies_ms)
+        failed = sum(self.errors.values())
+        return {
+            "stage": self.name,
+            "target_rate": self.rate,
+            "duration_s": self.duration_s,
+            "sent": self.sent,
+            "ok": ok,
+            "failed": failed,
+            "dropped": self.dropped,
+            "throughput_rps": round(ok / self.duration_s, 2) if self.duration_s else None,
+            "error_rate": round(failed / self.sent, 4) if self.sent else 0.0,
+            "errors": dict(self.errors),
+            "latency": summarize(self.latencies_ms),
+        }
+
+
+# --- Profiles ---
+
+def ramp_profile(peak, stages, stage_duration):
+    return [Stage(f"ramp-{i}", round(peak * i / stages, 2), stage_duration) for i in range(1, stages + 1)]
+
+
+def step_profile(rates, stage_duration):
+    return [Stage(f"step-{i}", rate, stage_duration) for i, rate in enumerate(rates, 1)]
+
+
+def spike_profile(base, peak, stage_duration, spike_duration):
+    return [
+        Stage("baseline", base, stage_duration),
+        Stage("spike", peak, spike_duration),
+        Stage("recovery", base, stage_duration),
+    ]
+
+
+# --- Guest carts ---
+
+def build_order(products, rng, sequence):
+    """Return the place_order arguments createOrder would send for a random guest cart."""
+    lines = rng.sample(products, k=min(len(products), rng.randint(1, 4)))
+    return {
+        "p_customer_name": f"Cliente de carga {sequence}",
+        "p_customer_phone": f"351{rng.randint(1000000, 9999999)}",
+        "p_address": rng.choice(["", f"Calle {rng.randint(1, 999)}"]),
+        "p_items": [{"product_id": product["id"], "quantity": rng.randint(1, 3)} for product in lines],
+    }
+
+
+async def fetch_products(client):
+    response = await client.request("GET", "/rest/v1/products", params={"select": "*", "active": "eq.true"})
+    if not response.ok:
+        raise SystemExit(f"Could not load products ({response.status}): {response.body[:200]!r}")
+    products = response.json() or []
+    if not products:
+        raise SystemExit("The products table has no active products to build carts from.")
+    return products
+
+
+async def place_order(client, order):
+    return await client.request(
+        "POST",
+        "/rest/v1/rpc/place_order",
+        json_body=order,
+        headers={"Accept": "application/vnd.pgrst.object+json"},
+    )
+
+
+# --- Runner ---
+
+async def run_stage(client, stage, products, rng, counter, in_flight, max_in_flight):
+    interval = 1 / stage.rate if stage.rate > 0 else None
+    total = int(stage.rate * stage.duration_s)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    async def one(order):
+        sent_at = time.perf_counter()
+        try:
+            response = await place_order(client, order)
+            latency = (time.perf_counter() - sent_at) * 1000
+            stage.record(latency, None if response.ok else f"HTTP {response.status}")
+        except asyncio.TimeoutError:
+            stage.record(0, "timeout")
+        except (ConnectionError, OSError, asyncio.IncompleteReadError) as err:
+            stage.record(0, type(err).__name__)
+
+    for i in range(total):
+        delay = started + i * interval - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            stage.dropped += 1
+            continue
+        counter[0] += 1
+        stage.sent += 1
+        task = asyncio.ensure_future(one(build_order(products, rng, counter[0])))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+
+    remaining = started + stage.duration_s - loop.time()
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+
+
+async def run_load(url, anon_key, stages, max_in_flight=500, seed=None, timeout=30):
+    headers = {"apikey": anon_key, "Authorization": f"Bearer {anon_key}"}
+    client = HttpClient(url, headers=headers, max_connections=max_in_flight, timeout=timeout)
+    rng = random.Random(seed)
+    counter = [0]
+    in_flight = set()
+    try:
+        products = await fetch_products(client)
+        for stage in stages:
+            print(f"-> {stage.name}: {stage.rate} orders/s for {stage.duration_s}s")
+            await run_stage(client, stage, products, rng, counter, in_flight, max_in_flight)
+        if in_flight:
+            await asyncio.wait(in_flight, timeout=timeout)
+    finally:
+        await client.close()
+    return [stage.report() for stage in stages]
+
+
+def print_report(reports):
+    print(f"{'stage':<10} {'rate':>7} {'sent':>7} {'ok/s':>8} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for r in reports:
+        latency = r["latency"]
+        fmt = lambda v: f"{v:.1f}" if v is not None else "-"
+        print(
+            f"{r['stage']:<10} {r['target_rate']:>7} {r['sent']:>7} {fmt(r['throughput_rps']):>8} "
+            f"{r['error_rate'] * 100:>5.1f}% {fmt(latency['p50_ms']):>8} {fmt(latency['p95_ms']):>8} "
+            f"{fmt(latency['p99_ms']):>8}"
+        )
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=DEFAULT_URL, help="Supabase project URL (REST base)")
+    parser.add_argument("--anon-key", default=os.environ.get("VITE_SUPABASE_ANON_KEY", "local-anon-key"))
+    parser.add_argument("--max-in-flight", type=int, default=500, help="Requests beyond this are counted as dropped")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible carts")
+    parser.add_argument("--output", type=Path, help="Write the per-stage report as JSON")
+    parser.add_argument("--allow-remote", action="store_true", help="Permit a non-local target")
+
+    profiles = parser.add_subparsers(dest="profile", required=True)
+    ramp = profiles.add_parser("ramp", help="Linearly increasing rate")
+    ramp.add_argument("--peak", type=float, required=True)
+    ramp.add_argument("--stages", type=int, default=5)
+    ramp.add_argument("--stage-duration", type=float, default=30)
+
+    step = profiles.add_parser("step", help="Explicit list of rates")
+    step.add_argument("--rates", required=True, help="Comma-separated orders/s, e.g. 5,10,20")
+    step.add_argument("--stage-duration", type=float, default=30)
+
+    spike = profiles.add_parser("spike", help="Baseline, short spike, recovery")
+    spike.add_argument("--base", type=float, required=True)
+    spike.add_argument("--peak", type=float, required=True)
+    spike.add_argument("--stage-duration", type=float, default=30)
+    spike.add_argument("--spike-duration", type=float, default=10)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if urlsplit(args.url).hostname not in LOCAL_HOSTS and not args.allow_remote:
+        print(f"Refusing to load-test {args.url} without --allow-remote.", file=sys.stderr)
+        return 2
+
+    if args.profile == "ramp":
+        stages = ramp_profile(args.peak, args.stages, args.stage_duration)
+    elif args.profile == "step":
+        stages = step_profile([float(r) for r in args.rates.split(",")], args.stage_duration)
+    else:
+        stages = spike_profile(args.base, args.peak, args.stage_duration, args.spike_duration)
+
+    reports = asyncio.run(run_load(args.url, args.anon_key, stages, args.max_in_flight, args.seed))
+    print_report(reports)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({"url": args.url, "stages": reports}, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+"""Local, offline stand-in for the Supabase project used by the app.
+
+Emulates the parts of PostgREST, GoTrue, Storage and Realtime that
+services/dataService.ts, App.tsx and OrderList.tsx use, backed by in-memory
+tables whose columns and defaults are read from supabase_schema.sql followed
+by the migrations in supabase/migrations.
+"""
+
+import json
+from pathlib import Path
+
+from .schema import load_sales_timezone, load_schema
+from .server import LocalSupabase
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+DEFAULT_SCHEMA = PACKAGE_DIR.parents[1] / "supabase_schema.sql"
+DEFAULT_MIGRATIONS = PACKAGE_DIR.parents[1] / "supabase" / "migrations"
+DEFAULT_SEED = PACKAGE_DIR / "seed.json"
+DEFAULT_PORT = 54321
+
+
+def create_app(schema_path=DEFAULT_SCHEMA, seed_path=DEFAULT_SEED, latency_ms=0, migrations_dir=DEFAULT_MIGRATIONS):
+    """Build a seeded ``LocalSupabase`` from the baseline schema, its migrations and a seed file."""
+    scripts = [Path(schema_path)]
+    if migrations_dir and Path(migrations_dir).is_dir():
+        scripts += sorted(Path(migrations_dir).glob("*.sql"))
+    sql = "\n".join(path.read_text(encoding="utf-8") for path in scripts)
+    seed = json.loads(Path(seed_path).read_text(encoding="utf-8")) if seed_path else None
+    return LocalSupabase(load_schema(sql), seed=seed, latency_ms=latency_ms, sales_timezone=load_sales_timezone(sql))
+
+
+__all__ = ["LocalSupabase", "create_app", "DEFAULT_PORT"]
@@ -0,0 +1,29 @@
+"""Run the stand-in server: ``python -m local_supabase --latency-ms 20``."""
+
+import argparse
+import asyncio
+from pathlib import Path
+
+from . import DEFAULT_PORT, DEFAULT_SCHEMA, DEFAULT_SEED, create_app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="local_supabase", description="Offline Supabase stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Fixed delay added to every response and realtime event")
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA)
+    parser.add_argument("--seed", type=Path, default=DEFAULT_SEED)
+    args = parser.parse_args(argv)
+
+    app = create_app(args.schema, args.seed, args.latency_ms)
+    print(f"Local Supabase listening on http://{args.host}:{args.port} (latency {args.latency_ms}ms)")
+    print(f"Start the app with VITE_SUPABASE_URL=http://{args.host}:{args.port} npm run dev")
+    try:
+        asyncio.run(app.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""The subset of the GoTrue (Supabase Auth) API used by the app.
+
+Password sign-in, refresh, ``/user``, sign-out and ``/signup`` (the silent
+employee signup in dataService.createEmployee). Tokens are real HS256 JWTs
+signed with a local secret so supabase-js can decode them.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+import uuid
+
+from .protocol import HttpError, Response
+from .schema import utc_now
+
+JWT_SECRET = b"local-supabase-stand-in-secret"
+TOKEN_TTL_S = 3600
+
+
+def b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def b64url_decode(data):
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def sign_jwt(claims):
+    header = b64url(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    payload = b64url(json.dumps(claims).encode())
+    signature = hmac.new(JWT_SECRET, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    return f"{header}.{payload}.{b64url(signature)}"
+
+
+def verify_jwt(token):
+    try:
+        header, payload, signature = token.split(".")
+    except ValueError:
+        return None
+    expected = hmac.new(JWT_SECRET, f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    if not hmac.compare_digest(b64url(expected), signature):
+        return None
+    claims = json.loads(b64url_decode(payload))
+    if claims.get("exp", 0) < time.time():
+        return None
+    return claims
+
+
+def hash_password(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def auth_error(status, error_code, message):
+    return HttpError(status, {"code": status, "error_code": error_code, "msg": message})
+
+
+class Auth:
+    def __init__(self, db):
+        self.db = db
+        self.users = {}
+        self.refresh_tokens = {}
+
+    # --- Users ---
+
+    def create_user(self, email, password, user_id=None, role=None, metadata=None):
+        email = email.strip().lower()
+        if any(user["email"] == email for user in self.users.values()):
+            raise auth_error(422, "user_already_exists", "User already registered")
+
+        now = utc_now()
+        user = {
+            "id": user_id or str(uuid.uuid4()),
+            "aud": "authenticated",
+            "role": "authenticated",
+            "email": email,
+            "email_confirmed_at": now,
+            "phone": "",
+            "confirmed_at": now,
+            "last_sign_in_at": None,
+            "app_metadata": {"provider": "email", "providers": ["email"]},
+            "user_metadata": metadata or {},
+            "identities": [],
+            "created_at": now,
+            "updated_at": now,
+        }
+        self.users[user["id"]] = {**user, "password": hash_password(password)}
+
+        # Emulates the on_auth_user_created trigger (public.handle_new_user).
+        self.db.insert("profiles", {"id": user["id"], "email": email, "role": "employee"})
+        if role and role != "employee":
+            self.db.update("profiles", lambda row: row["id"] == user["id"], {"role": role})
+        return user
+
+    def public_user(self, user_id):
+        user = dict(self.users[user_id])
+        user.pop("password")
+        return user
+
+    def user_from_token(self, token):
+        claims = verify_jwt(token) if token else None
+        if not claims or claims.get("sub") not in self.users:
+            return None
+        return self.public_user(claims["sub"])
+
+    # --- Sessions ---
+
+    def issue_session(self, user_id):
+        self.users[user_id]["last_sign_in_at"] = utc_now()
+        user = self.public_user(user_id)
+        now = int(time.time())
+        refresh_token = secrets.token_urlsafe(24)
+        self.refresh_tokens[refresh_token] = user_id
+        access_token = sign_jwt({
+            "sub": user_id,
+            "email": user["email"],
+            "aud": "authenticated",
+            "role": "authenticated",
+            "iat": now,
+            "exp": now + TOKEN_TTL_S,
+            "session_id": str(uuid.uuid4()),
+        })
+        return {
+            "access_token": access_token,
+            "token_type": "bearer",
+            "expires_in": TOKEN_TTL_S,
+            "expires_at": now + TOKEN_TTL_S,
+            "refresh_token": refresh_token,
+            "user": user,
+        }
+
+    def sign_in(self, email, password):
+        email = (email or "").strip().lower()
+        for user_id, user in self.users.items():
+            if user["email"] == email and hmac.compare_digest(user["password"], hash_password(password or "")):
+                return self.issue_session(user_id)
+        raise auth_error(400, "invalid_credentials", "Invalid login credentials")
+
+    # --- HTTP ---
+
+    def handle(self, request, route):
+        if route == "token" and request.method == "POST":
+            body = request.json() or {}
+            grant_type = request.param("grant_type")
+            if grant_type == "password":
+                return Response(200, self.sign_in(body.get("email"), body.get("password")))
+            if grant_type == "refresh_token":
+                user_id = self.refresh_tokens.pop(body.get("refresh_token"), None)
+                if user_id is None:
+                    raise auth_error(400, "refresh_token_not_found", "Invalid Refresh Token: Refresh Token Not Found")
+                return Response(200, self.issue_session(user_id))
+            raise auth_error(400, "unsupported_grant_type", f"Unsupported grant type: {grant_type}")
+
+        if route == "signup" and request.method == "POST":
+            body = request.json() or {}
+            if not body.get("email") or len(body.get("password") or "") < 6:
+                raise auth_error(422, "weak_password", "Password should be at least 6 characters.")
+            metadata = body.get("data") or {}
+            user = self.create_user(body["email"], body["password"], metadata=metadata)
+            return Response(200, self.issue_session(user["id"]))
+
+        if route == "user" and request.method == "GET":
+            user = self.user_from_token(request.bearer)
+            if user is None:
+                raise auth_error(401, "bad_jwt", "invalid JWT: unable to parse or verify signature")
+            return Response(200, user)
+
+        if route == "logout" and request.method == "POST":
+            return Response(204)
+
+        if route == "settings" and request.method == "GET":
+            return Response(200, {"external": {"email": True}, "disable_signup": False, "mailer_autoconfirm": True})
+
+        raise auth_error(404, "not_found", f"Unsupported auth route: {request.method} /{route}")
@@ -0,0 +1,469 @@
+"""The subset of the PostgREST API used by services/dataService.ts and App.tsx.
+
+Supported: ``select`` column lists (with ``alias:column`` renames and
+one-to-many embeds such as ``order_items(name,quantity)``, ordered with
+``order_items.order``), horizontal filters (eq, neq, gt, gte,
+lt, lte, like, ilike, in, is, and their ``not.`` forms), ``or``/``and``
+logic trees such as the keyset cursor in fetchOrders, ``order``,
+``limit``/``offset``, ``Prefer: return=representation`` / ``count=exact``
+and single-object responses (``.single()``). ``POST /rest/v1/rpc/<name>``
+calls the database functions mirrored in ``FUNCTIONS``; the read-only
+views in ``UNION_VIEWS`` read across their tables.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+from .protocol import HttpError, Response
+
+RESERVED_PARAMS = {"select", "order", "limit", "offset", "on_conflict", "columns"}
+LOGIC_PARAMS = {"or", "and", "not.or", "not.and"}
+SINGLE_OBJECT = "application/vnd.pgrst.object+json"
+
+
+def pgrst_error(status, code, message, details=None, hint=None):
+    return HttpError(status, {"code": code, "message": message, "details": details, "hint": hint})
+
+
+def comparable(column, value):
+    """Normalise a value so Python comparisons match Postgres ordering."""
+    if value is None:
+        return None
+    if column.type == "timestamp" and isinstance(value, str):
+        return datetime.fromisoformat(value.replace(" ", "T"))
+    return column.coerce(value)
+
+
+def parse_list(raw):
+    """Parse a PostgREST list literal such as ``(a,b,"c,d")``."""
+    if not (raw.startswith("(") and raw.endswith(")")):
+        raise pgrst_error(400, "PGRST100", f'"failed to parse filter ({raw})"')
+    return [item.strip('"') for item in re.findall(r'"[^"]*"|[^,]+', raw[1:-1])]
+
+
+def like_pattern(raw, flags=0):
+    escaped = re.escape(raw).replace(r"\*", ".*").replace("%", ".*").replace("_", ".")
+    return re.compile(f"^{escaped}$", flags | re.DOTALL)
+
+
+def compile_filter(table, column_name, expression):
+    """Return a row predicate for ``column=op.value``."""
+    column = table.column(column_name)
+    if column is None:
+        raise pgrst_error(400, "42703", f"column {table.name}.{column_name} does not exist")
+
+    negate = expression.startswith("not.")
+    if negate:
+        expression = expression[4:]
+    op, _, raw = expression.partition(".")
+
+    if op == "in":
+        values = [comparable(column, v) for v in parse_list(raw)]
+        test = lambda v: v is not None and v in values
+    elif op == "is":
+        expected = {"null": None, "true": True, "false": False}.get(raw.lower(), "invalid")
+        if expected == "invalid":
+            raise pgrst_error(400, "PGRST100", f'"failed to parse filter (is.{raw})"')
+        test = lambda v: v is expected
+    elif op in ("like", "ilike"):
+        pattern = like_pattern(raw, re.IGNORECASE if op == "ilike" else 0)
+        test = lambda v: v is not None and bool(pattern.match(str(v)))
+    elif op in ("eq", "neq", "gt", "gte", "lt", "lte"):
+        target = comparable(column, raw)
+        compare = {
+            "eq": lambda v: v == target,
+            "neq": lambda v: v != target,
+            "gt": lambda v: v > target,
+            "gte": lambda v: v >= target,
+            "lt": lambda v: v < target,
+            "lte": lambda v: v <= target,
+        }[op]
+        test = lambda v: v is not None and compare(v)
+    else:
+        raise pgrst_error(400, "PGRST100", f'"failed to parse filter ({op}.{raw})"')
+
+    def predicate(row):
+        result = test(comparable(column, row.get(column_name)))
+        return not result if negate else result
+
+    return predicate
+
+
+def split_top_level(raw):
+    """Split ``a,and(b,c),"d,e"`` on the commas outside parentheses and quotes."""
+    parts, depth, quoted, current = [], 0, False, ""
+    for char in raw:
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char == "(":
+            depth += 1
+        elif not quoted and char == ")":
+            depth -= 1
+        elif not quoted and depth == 0 and char == ",":
+            parts.append(current)
+            current = ""
+            continue
+        current += char
+    parts.append(current)
+    return parts
+
+
+def compile_logic(table, operator, raw):
+    """Return a row predicate for ``or=(...)`` / ``and=(...)``, nested to any depth."""
+    negate = operator.startswith("not.")
+    operator = operator[4:] if negate else operator
+    if not (raw.startswith("(") and raw.endswith(")")):
+        raise pgrst_error(400, "PGRST100", f'"failed to parse logic tree ({raw})"')
+
+    predicates = []
+    for term in split_top_level(raw[1:-1]):
+        term = term.strip()
+        head, _, rest = term.partition("(")
+        if head in LOGIC_PARAMS and rest:
+            predicates.append(compile_logic(table, head, "(" + rest))
+            continue
+        column_name, _, expression = term.partition(".")
+        prefix = "not." if expression.startswith("not.") else ""
+        op, _, value = expression[len(prefix):].partition(".")
+        if len(value) > 1 and value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+        predicates.append(compile_filter(table, column_name, f"{prefix}{op}.{value}"))
+
+    combine = any if operator == "or" else all
+
+    def predicate(row):
+        result = combine(p(row) for p in predicates)
+        return not result if negate else result
+
+    return predicate
+
+
+def parse_order(table, raw):
+    """Return ``[(column, descending, nulls_first)]`` for an ``order`` param."""
+    terms = []
+    for term in raw.split(","):
+        name, *modifiers = term.strip().split(".")
+        column = table.column(name)
+        if column is None:
+            raise pgrst_error(400, "42703", f"column {table.name}.{name} does not exist")
+        descending = "desc" in modifiers
+        nulls_first = "nullsfirst" in modifiers or (descending and "nullslast" not in modifiers)
+        terms.append((column, descending, nulls_first))
+    return terms
+
+
+def sort_rows(rows, terms):
+    # Stable sorts applied from the last key to the first give a multi-key order.
+    for column, descending, nulls_first in reversed(terms):
+        present = [r for r in rows if r.get(column.name) is not None]
+        missing = [r for r in rows if r.get(column.name) is None]
+        present.sort(key=lambda r: comparable(column, r[column.name]), reverse=descending)
+        rows = missing + present if nulls_first else present + missing
+    return rows
+
+
+def place_order(db, args):
+    """Mirror of ``public.place_order``: snapshot active products into order_items, total server-side."""
+    lines = args.get("p_items")
+    if not isinstance(lines, list) or not lines:
+        raise pgrst_error(400, "P0001", "El pedido no tiene productos")
+    requested = {}
+    for line in lines:
+        if not isinstance(line, dict) or not line.get("product_id"):
+            raise pgrst_error(400, "P0001", "Cantidad inválida en el pedido")
+        quantity = line.get("quantity")
+        if not isinstance(quantity, int) or quantity <= 0:
+            raise pgrst_error(400, "P0001", "Cantidad inválida en el pedido")
+        requested[line["product_id"]] = requested.get(line["product_id"], 0) + quantity
+    products = {p["id"]: p for p in db.select("products") if p.get("active") and p["id"] in requested}
+    if len(products) < len(requested):
+        raise pgrst_error(400, "P0001", "Algún producto ya no está disponible")
+    order = db.insert("orders", {
+        "customer_name": args.get("p_customer_name"),
+        "customer_phone": args.get("p_customer_phone"),
+        "address": args.get("p_address") or "",
+        "total": sum(products[pid]["price"] * quantity for pid, quantity in requested.items()),
+        "status": "pending",
+    })
+    for line_no, (pid, quantity) in enumerate(requested.items()):
+        product = products[pid]
+        db.insert("order_items", {
+            "order_id": order["id"],
+            "order_created_at": order["created_at"],
+            "product_id": pid,
+            "name": product["name"],
+            "price": product["price"],
+            "quantity": quantity,
+            "line_no": line_no,
+        })
+    return [{"id": order["id"], "total": order["total"]}]
+
+
+def sales_time(value, zone):
+    """A timestamp (ISO string or datetime) in ``zone``, like ``public.sales_local_time``."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace(" ", "T"))
+    return value.astimezone(zone)
+
+
+INTERVAL_RE = re.compile(r"^\s*(\d+)\s*(day|hour|minute)s?\s*$")
+
+
+def archive_delivered_orders(db, args):
+    """Mirror of ``public.archive_delivered_orders``: move old delivered orders and their lines to the archive."""
+    raw = args.get("p_older_than") or "30 days"
+    match = INTERVAL_RE.match(str(raw))
+    if not match:
+        raise pgrst_error(400, "22007", f'invalid input syntax for type interval: "{raw}"')
+    cutoff = datetime.now(timezone.utc) - timedelta(**{match.group(2) + "s": int(match.group(1))})
+    created_at = db.table("orders").column("created_at")
+    moved = db.delete(
+        "orders",
+        lambda row: row.get("status") == "delivered" and comparable(created_at, row.get("created_at")) < cutoff,
+    )
+    moved_ids = {order["id"] for order in moved}
+    for order in moved:
+        db.insert("orders_archive", order)
+    # The order_items_order_fkey cascade, after copying the lines
+    for line in db.delete("order_items", lambda row: row.get("order_id") in moved_ids):
+        line.pop("order_created_at", None)
+        db.insert("order_items_archive", line)
+    return len(moved)
+
+
+def sales_report(db, args):
+    """Mirror of ``public.sales_report`` over the summary tables."""
+    days = max(int(args.get("p_days") or 30), 1)
+    top = max(int(args.get("p_top") or 10), 1)
+    day_to = sales_time(datetime.now(timezone.utc), db.sales_timezone).date()
+    day_from = day_to - timedelta(days=days - 1)
+    in_range = lambda row: day_from.isoformat() <= row["day"] <= day_to.isoformat()
+
+    daily = sorted(
+        ({"day": r["day"], "orders": r["orders"], "revenue": r["revenue"]} for r in db.select("sales_daily") if in_range(r)),
+        key=lambda r: r["day"],
+    )
+    hourly = {}
+    for row in filter(in_range, db.select("sales_hourly")):
+        bucket = hourly.setdefault(row["hour"], {"hour": row["hour"], "orders": 0, "revenue": 0})
+        bucket["orders"] += row["orders"]
+        bucket["revenue"] += row["revenue"]
+    products = {}
+    for row in filter(in_range, db.select("product_sales_daily")):
+        product = products.setdefault(row["name"], {"name": row["name"], "units": 0, "revenue": 0})
+        product["units"] += row["units"]
+        product["revenue"] += row["revenue"]
+    ranked = sorted(products.values(), key=lambda p: (-p["units"], -p["revenue"], p["name"]))
+    return {
+        "from": day_from.isoformat(),
+        "to": day_to.isoformat(),
+        "timezone": db.sales_timezone.key,
+        "daily": daily,
+        "hourly": [hourly[hour] for hour in sorted(hourly)],
+        "products": ranked[:top],
+    }
+
+
+def menu_document(db, args):
+    """Mirror of ``public.menu_document``: active products grouped by category, both by name."""
+    version = next((row["version"] for row in db.select("catalog_versions") if row["name"] == "products"), None)
+    categories = {}
+    for product in db.select("products"):
+        if product.get("active"):
+            categories.setdefault(product.get("category"), []).append(product)
+    return {
+        "version": version,
+        "published_at": datetime.now(timezone.utc).isoformat(),
+        "categories": [
+            {"name": name, "products": sorted(products, key=lambda p: p["name"])}
+            for name, products in sorted(categories.items(), key=lambda item: (item[0] is None, item[0] or ""))
+        ],
+    }
+
+
+# Database functions reachable through /rest/v1/rpc/<name>.
+FUNCTIONS = {
+    "place_order": place_order,
+    "archive_delivered_orders": archive_delivered_orders,
+    "sales_report": sales_report,
+    "menu_document": menu_document,
+}
+
+# Views defined as a UNION ALL of tables with the same columns; the first one
+# supplies the columns and relationships.
+UNION_VIEWS = {
+    "order_history": ("orders", "orders_archive"),
+}
+
+# Embeds served by a computed relationship that also reads the archive.
+UNION_EMBEDS = {
+    "order_items": ("order_items", "order_items_archive"),
+}
+
+
+EMBED_RE = re.compile(r"^((?:\w+:)?\w+)\((.*)\)$", re.DOTALL)
+
+
+class Embed:
+    """A one-to-many embed: child rows whose foreign key points at the row's id."""
+
+    def __init__(self, table, foreign_key, fields):
+        self.table = table
+        self.foreign_key = foreign_key
+        self.fields = fields
+
+
+def parse_select(db, table, raw):
+    """Return ``[(output name, column name or Embed)]``, or None for a bare ``*``."""
+    if not raw or raw.strip() == "*":
+        return None
+    terms = [term.strip() for term in split_top_level(raw) if term.strip()]
+    if terms == ["count"]:
+        return []
+    fields = []
+    for term in terms:
+        embed = EMBED_RE.match(term)
+        if embed:
+            alias, _, name = embed.group(1).rpartition(":")
+            child = db.table(name)
+            foreign_key = child.foreign_key(table.name)
+            if foreign_key is None:
+                raise pgrst_error(
+                    400, "PGRST200",
+                    f"Could not find a relationship between '{table.name}' and '{name}' in the schema cache",
+                )
+            sub = parse_select(db, child, embed.group(2))
+            fields.append((alias or name, Embed(child, foreign_key, sub)))
+            continue
+        if term == "*":
+            fields.extend((name, name) for name in table.columns)
+            continue
+        alias, _, name = term.rpartition(":")
+        if table.column(name) is None:
+            raise pgrst_error(400, "42703", f"column {table.name}.{name} does not exist")
+        fields.append((alias or name, name))
+    return fields
+
+
+def project(db, rows, fields, table, orders):
+    """Apply a parsed select list; ``orders`` maps embedded table names to ``order`` params."""
+    if fields is None:
+        return rows
+    children = {}
+    for _, field in fields:
+        if isinstance(field, Embed):
+            grouped = {}
+            for source in UNION_EMBEDS.get(field.table.name, (field.table.name,)):
+                for child in db.select(source):
+                    grouped.setdefault(child.get(field.foreign_key), []).append(child)
+            children[field.table.name] = grouped
+    result = []
+    for row in rows:
+        projected = {}
+        for alias, field in fields:
+            if isinstance(field, Embed):
+                nested = children[field.table.name].get(row.get("id"), [])
+                if field.table.name in orders:
+                    nested = sort_rows(nested, parse_order(field.table, orders[field.table.name]))
+                projected[alias] = project(db, nested, field.fields, field.table, orders)
+            else:
+                projected[alias] = row.get(field)
+        result.append(projected)
+    return result
+
+
+class PostgREST:
+    def __init__(self, db):
+        self.db = db
+
+    def handle(self, request, table_name):
+        if table_name.startswith("rpc/"):
+            return self.rpc(request, table_name[len("rpc/"):])
+        sources = UNION_VIEWS.get(table_name, (table_name,))
+        table = self.db.table(sources[0])
+        predicate = self._where(request, table)
+        prefer = request.header("prefer")
+        representation = "return=representation" in prefer
+
+        if request.method in ("GET", "HEAD"):
+            rows = self._read(request, table, sources, predicate)
+            return self._respond(request, table, rows, prefer, status=200)
+
+        if len(sources) > 1:
+            raise pgrst_error(400, "55000", f'cannot change view "{table_name}"')
+
+        if request.method == "POST":
+            payload = request.json()
+            records = payload if isinstance(payload, list) else [payload]
+            inserted = [self.db.insert(table.name, record) for record in records]
+            return self._respond(request, table, inserted if representation else None, prefer, status=201)
+
+        if request.method == "PATCH":
+            updated = self.db.update(table.name, predicate, request.json() or {})
+            if representation:
+                return self._respond(request, table, updated, prefer, status=200)
+            return Response(204)
+
+        if request.method == "DELETE":
+            deleted = self.db.delete(table.name, predicate)
+            if representation:
+                return self._respond(request, table, deleted, prefer, status=200)
+            return Response(204)
+
+        raise pgrst_error(405, "PGRST117", f"Unsupported HTTP method: {request.method}")
+
+    def rpc(self, request, name):
+        function = FUNCTIONS.get(name)
+        if function is None:
+            raise pgrst_error(404, "PGRST202", f"Could not find the function public.{name} in the schema cache")
+        if request.method != "POST":
+            raise pgrst_error(405, "PGRST101", f"Only POST is supported for public.{name}")
+        rows = function(self.db, request.json() or {})
+        return self._rows_response(request, rows, status=200, headers={})
+
+    def _where(self, request, table):
+        filters = [
+            compile_logic(table, key, value) if key in LOGIC_PARAMS else compile_filter(table, key, value)
+            for key, value in request.params
+            if key not in RESERVED_PARAMS and key.rpartition(".")[2] not in RESERVED_PARAMS
+        ]
+        return lambda row: all(f(row) for f in filters)
+
+    def _read(self, request, table, sources, predicate):
+        rows = [row for name in sources for row in self.db.select(name) if predicate(row)]
+        order = request.param("order")
+        if order:
+            rows = sort_rows(rows, parse_order(table, order))
+        return rows
+
+    def _respond(self, request, table, rows, prefer, status):
+        headers = {}
+        total = len(rows) if rows is not None else 0
+
+        if rows is not None and request.method in ("GET", "HEAD"):
+            offset = int(request.param("offset", 0))
+            limit = request.param("limit")
+            rows = rows[offset:offset + int(limit)] if limit is not None else rows[offset:]
+            if "count=exact" in prefer:
+                end = offset + len(rows) - 1
+                headers["Content-Range"] = f"{offset}-{end}/{total}" if rows else f"*/{total}"
+
+        if rows is None:
+            return Response(status, headers=headers)
+
+        # Embedded ordering arrives as e.g. order_items.order=line_no.asc
+        orders = {key[:-len(".order")]: value for key, value in request.params if key.endswith(".order")}
+        rows = project(self.db, rows, parse_select(self.db, table, request.param("select")), table, orders)
+        return self._rows_response(request, rows, status, headers)
+
+    def _rows_response(self, request, rows, status, headers):
+        if SINGLE_OBJECT in request.header("accept"):
+            if len(rows) != 1:
+                raise pgrst_error(
+                    406,
+                    "PGRST116",
+                    "JSON object requested, multiple (or no) rows returned",
+                    details=f"The result contains {len(rows)} rows",
+                )
+            return Response(status, rows[0], headers=headers, content_type=SINGLE_OBJECT)
+        return Response(status, rows, headers=headers)
@@ -0,0 +1,106 @@
+"""HTTP/1.1 request parsing and response writing for the stand-in server."""
+
+import asyncio
+import json
+from http import HTTPStatus
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PATCH, PUT, DELETE, HEAD, OPTIONS",
+    "Access-Control-Expose-Headers": "Content-Range, Content-Location, X-Total-Count",
+    "Access-Control-Max-Age": "86400",
+}
+
+
+class HttpError(Exception):
+    """An error response with a JSON body in the service's own error shape."""
+
+    def __init__(self, status, body):
+        super().__init__(body)
+        self.status = status
+        self.body = body
+
+
+class Request:
+    def __init__(self, method, target, headers, body):
+        parts = urlsplit(target)
+        self.method = method
+        self.path = unquote(parts.path)
+        # A list, not a dict: PostgREST allows the same column twice
+        # (created_at=gte.X&created_at=lt.Y).
+        self.params = parse_qsl(parts.query, keep_blank_values=True)
+        self.headers = headers
+        self.body = body
+
+    def param(self, name, default=None):
+        return next((value for key, value in self.params if key == name), default)
+
+    def header(self, name, default=""):
+        return self.headers.get(name.lower(), default)
+
+    def json(self):
+        if not self.body:
+            return None
+        try:
+            return json.loads(self.body)
+        except ValueError as err:
+            raise HttpError(400, {"code": "PGRST102", "message": "Empty or invalid json", "details": str(err), "hint": None})
+
+    @property
+    def bearer(self):
+        authorization = self.header("authorization")
+        return authorization[7:] if authorization.lower().startswith("bearer ") else None
+
+
+class Response:
+    def __init__(self, status=200, body=None, headers=None, content_type="application/json"):
+        self.status = status
+        self.headers = dict(headers or {})
+        if body is None:
+            self.body = b""
+        elif isinstance(body, bytes):
+            self.body = body
+        else:
+            self.body = json.dumps(body).encode()
+        if self.body:
+            self.headers.setdefault("Content-Type", content_type)
+
+
+async def read_request(reader):
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+        return None
+
+    request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+    method, target, _ = request_line.split(" ", 2)
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readline()).strip(), 16)
+            if size == 0:
+                await reader.readline()
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        body = b"".join(chunks)
+    else:
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+    return Request(method, target, headers, body)
+
+
+def write_response(writer, response, keep_alive):
+    headers = {**CORS_HEADERS, **response.headers}
+    headers["Content-Length"] = str(len(response.body))
+    headers["Connection"] = "keep-alive" if keep_alive else "close"
+    status = HTTPStatus(response.status)
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + response.body)
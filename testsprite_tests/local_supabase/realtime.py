@@ -0,0 +1,144 @@
+"""Phoenix-channel endpoint that streams ``postgres_changes`` like Supabase Realtime.
+
+Both wire formats of realtime-js are understood: the JSON object format of
+``vsn=1.0.0`` and the ``[join_ref, ref, topic, event, payload]`` array
+format of ``vsn=2.0.0``.
+"""
+
+import asyncio
+import itertools
+import json
+
+from .websocket import ConnectionClosed
+
+
+def encode(vsn, join_ref, ref, topic, event, payload):
+    if vsn.startswith("2"):
+        return json.dumps([join_ref, ref, topic, event, payload])
+    return json.dumps({"join_ref": join_ref, "ref": ref, "topic": topic, "event": event, "payload": payload})
+
+
+def decode(vsn, message):
+    data = json.loads(message)
+    if isinstance(data, list):
+        return tuple(data)
+    return data.get("join_ref"), data.get("ref"), data["topic"], data["event"], data.get("payload") or {}
+
+
+def parse_binding_filter(raw):
+    """Parse a channel filter such as ``status=eq.pending`` into a predicate."""
+    if not raw:
+        return lambda record: True
+    column, _, expression = raw.partition("=")
+    op, _, value = expression.partition(".")
+    if op == "in":
+        values = value.strip("()").split(",")
+        return lambda record: str(record.get(column)) in values
+    compare = {
+        "eq": lambda a: a == value,
+        "neq": lambda a: a != value,
+    }.get(op)
+    if compare is None:
+        return lambda record: True
+    return lambda record: compare(str(record.get(column)))
+
+
+class Binding:
+    def __init__(self, binding_id, config):
+        self.id = binding_id
+        self.event = config.get("event", "*")
+        self.schema = config.get("schema", "public")
+        self.table = config.get("table")
+        self.filter = config.get("filter")
+        self._matches_filter = parse_binding_filter(self.filter)
+
+    def matches(self, change):
+        if self.event not in ("*", change["type"]):
+            return False
+        if self.schema not in ("*", change["schema"]):
+            return False
+        if self.table not in (None, "*", change["table"]):
+            return False
+        return self._matches_filter(change["record"] or change["old_record"])
+
+    def describe(self):
+        # realtime-js compares bindings with ===, so an absent filter must
+        # stay absent rather than become null.
+        described = {"id": self.id, "event": self.event, "schema": self.schema, "table": self.table}
+        if self.filter is not None:
+            described["filter"] = self.filter
+        return described
+
+
+class Client:
+    def __init__(self, ws, vsn):
+        self.ws = ws
+        self.vsn = vsn
+        # topic -> (join_ref, [Binding])
+        self.channels = {}
+
+    async def push(self, join_ref, ref, topic, event, payload):
+        await self.ws.send(encode(self.vsn, join_ref, ref, topic, event, payload))
+
+
+class Realtime:
+    def __init__(self, db, latency_ms=0):
+        self.latency = latency_ms / 1000
+        self.clients = set()
+        self._binding_ids = itertools.count(1)
+        db.listeners.append(self.publish)
+
+    async def serve(self, ws, params):
+        client = Client(ws, params.get("vsn", "1.0.0"))
+        self.clients.add(client)
+        try:
+            while True:
+                message = await ws.recv()
+                if isinstance(message, bytes):
+                    continue
+                await self.receive(client, *decode(client.vsn, message))
+        except ConnectionClosed:
+            pass
+        finally:
+            self.clients.discard(client)
+
+    async def receive(self, client, join_ref, ref, topic, event, payload):
+        reply = {"status": "ok", "response": {}}
+
+        if event == "phx_join":
+            config = payload.get("config") or {}
+            bindings = [Binding(next(self._binding_ids), c) for c in config.get("postgres_changes") or []]
+            client.channels[topic] = (join_ref, bindings)
+            reply["response"] = {"postgres_changes": [b.describe() for b in bindings]}
+            await client.push(join_ref, ref, topic, "phx_reply", reply)
+            if bindings:
+                await client.push(join_ref, None, topic, "system", {
+                    "status": "ok",
+                    "message": "Subscribed to PostgreSQL",
+                    "extension": "postgres_changes",
+                    "channel": topic.split(":", 1)[-1],
+                })
+            return
+
+        if event == "phx_leave":
+            client.channels.pop(topic, None)
+
+        # heartbeat, access_token, broadcast and presence are acknowledged only
+        if ref is not None:
+            await client.push(join_ref, ref, topic, "phx_reply", reply)
+
+    def publish(self, change):
+        for client in list(self.clients):
+            for topic, (join_ref, bindings) in client.channels.items():
+                ids = [b.id for b in bindings if b.matches(change)]
+                if ids:
+                    asyncio.ensure_future(self._deliver(client, join_ref, topic, ids, change))
+
+    async def _deliver(self, client, join_ref, topic, ids, change):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        payload = {"ids": ids, "data": {**change, "errors": None}}
+        try:
+            await client.push(join_ref, None, topic, "postgres_changes", payload)
+        except (ConnectionClosed, ConnectionError):
+            self.clients.discard(client)
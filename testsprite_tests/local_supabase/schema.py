@@ -0,0 +1,200 @@
+"""Table definitions read from supabase_schema.sql and its migrations.
+
+Only the parts of the DDL the stand-in needs are understood: column names,
+types, ``default`` expressions, ``not null``, ``check (col in (...))`` and
+``references public.<table>`` (for resource embedding), plus ``alter table
+... add column`` / ``drop column``. Everything else in the script (RLS, policies, functions) is ignored.
+"""
+
+import re
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+CREATE_TABLE_RE = re.compile(
+    r"create\s+table\s+(?:if\s+not\s+exists\s+)?public\.(\w+)\s*\((.*?)\)\s*(?:partition\s+by[^;]*)?;",
+    re.IGNORECASE | re.DOTALL,
+)
+ADD_COLUMN_RE = re.compile(
+    r"alter\s+table\s+(?:if\s+exists\s+)?public\.(\w+)\s+add\s+column\s+(?:if\s+not\s+exists\s+)?([^;]+);",
+    re.IGNORECASE,
+)
+DROP_COLUMN_RE = re.compile(
+    r"alter\s+table\s+(?:if\s+exists\s+)?public\.(\w+)\s+drop\s+column\s+(?:if\s+exists\s+)?\"?(\w+)\"?\s*;",
+    re.IGNORECASE,
+)
+REFERENCES_RE = re.compile(r"\breferences\s+(?:public\.)?(\w+)", re.IGNORECASE)
+CHECK_IN_RE = re.compile(r"check\s*\(\s*\w+\s+in\s*\(([^)]*)\)\s*\)", re.IGNORECASE)
+DEFAULT_RE = re.compile(
+    r"\bdefault\s+(.+?)(?=\s+(?:primary|not|null|references|check|unique|generated)\b|$)",
+    re.IGNORECASE,
+)
+SALES_TIMEZONE_RE = re.compile(
+    r"function\s+public\.sales_timezone\s*\(\s*\).*?\$\$\s*select\s+'([^']+)'",
+    re.IGNORECASE | re.DOTALL,
+)
+TABLE_CONSTRAINT_PREFIXES = ("primary key", "foreign key", "unique", "constraint", "check")
+
+# Postgres type names as realtime reports them in the ``columns`` list.
+REALTIME_TYPES = {
+    "uuid": "uuid",
+    "text": "text",
+    "numeric": "numeric",
+    "integer": "int4",
+    "int": "int4",
+    "bigint": "int8",
+    "boolean": "bool",
+    "jsonb": "jsonb",
+    "date": "date",
+    "timestamp": "timestamptz",
+}
+
+
+def utc_now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+def strip_comments(sql):
+    return re.sub(r"--[^\n]*", "", sql)
+
+
+def split_top_level(body):
+    """Split a column list on commas that are not inside parentheses."""
+    parts, depth, current = [], 0, []
+    for char in body:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append("".join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    if "".join(current).strip():
+        parts.append("".join(current).strip())
+    return parts
+
+
+class Column:
+    def __init__(self, name, type_name, default=None, not_null=False, choices=None, references=None):
+        self.name = name
+        self.type = type_name
+        self.default = default
+        self.not_null = not_null
+        self.choices = choices
+        self.references = references
+
+    @classmethod
+    def parse(cls, definition):
+        name, rest = definition.split(None, 1)
+        lowered = rest.lower()
+        type_name = next(
+            (t for t in ("timestamp", "numeric", "boolean", "jsonb", "uuid", "bigint", "integer", "int", "date", "text")
+             if lowered.startswith(t)),
+            lowered.split()[0],
+        )
+
+        default_match = DEFAULT_RE.search(rest)
+        check_match = CHECK_IN_RE.search(rest)
+        references_match = REFERENCES_RE.search(rest)
+        choices = None
+        if check_match:
+            choices = [c.strip().strip("'") for c in check_match.group(1).split(",")]
+
+        return cls(
+            name=name.strip('"'),
+            type_name=type_name,
+            default=default_match.group(1).strip() if default_match else None,
+            not_null="not null" in lowered or "primary key" in lowered,
+            choices=choices,
+            references=references_match.group(1) if references_match else None,
+        )
+
+    @property
+    def realtime_type(self):
+        return REALTIME_TYPES.get(self.type, self.type)
+
+    def default_value(self):
+        """Evaluate the column's ``default`` expression, if it has one."""
+        expr = self.default
+        if expr is None:
+            return None
+        lowered = expr.lower()
+        if "gen_random_uuid" in lowered:
+            return str(uuid.uuid4())
+        if "now()" in lowered or "current_timestamp" in lowered:
+            return utc_now()
+        if lowered in ("true", "false"):
+            return lowered == "true"
+        if expr.startswith("'"):
+            return expr.split("'")[1]
+        if lowered == "null":
+            return None
+        return self.coerce(expr)
+
+    def coerce(self, value):
+        """Convert a JSON or query-string value to the column's Python type."""
+        if value is None:
+            return None
+        if self.type == "numeric":
+            number = Decimal(str(value))
+            return int(number) if number == number.to_integral_value() else float(number)
+        if self.type in ("integer", "int", "bigint"):
+            return int(value)
+        if self.type == "boolean":
+            if isinstance(value, str):
+                return value.lower() in ("true", "t", "1")
+            return bool(value)
+        return value
+
+
+class Table:
+    def __init__(self, name, columns):
+        self.name = name
+        self.columns = {column.name: column for column in columns}
+
+    def column(self, name):
+        return self.columns.get(name)
+
+    def foreign_key(self, target):
+        """Name of the column referencing table ``target``, if any."""
+        return next((c.name for c in self.columns.values() if c.references == target), None)
+
+
+def load_schema(sql):
+    """Return ``{table_name: Table}`` for every ``create table public.*``.
+
+    Statements apply in script order, so a column a later migration adds or
+    drops, or a table it recreates, ends up as the migrations leave it.
+    """
+    sql = strip_comments(sql)
+    statements = sorted(
+        (match.start(), kind, match)
+        for kind, pattern in (("create", CREATE_TABLE_RE), ("add", ADD_COLUMN_RE), ("drop", DROP_COLUMN_RE))
+        for match in pattern.finditer(sql)
+    )
+    tables = {}
+    for _, kind, match in statements:
+        name = match.group(1)
+        if kind == "create":
+            columns = [
+                Column.parse(part)
+                for part in split_top_level(match.group(2))
+                if not part.lower().startswith(TABLE_CONSTRAINT_PREFIXES)
+            ]
+            tables[name] = Table(name, columns)
+        elif name not in tables:
+            continue
+        elif kind == "add":
+            column = Column.parse(match.group(2))
+            tables[name].columns[column.name] = column
+        else:
+            tables[name].columns.pop(match.group(2), None)
+    return tables
+
+
+def load_sales_timezone(sql):
+    """The zone the last ``public.sales_timezone()`` definition returns (UTC if there is none)."""
+    zones = SALES_TIMEZONE_RE.findall(strip_comments(sql))
+    return zones[-1] if zones else "UTC"
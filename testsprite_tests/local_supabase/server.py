@@ -0,0 +1,149 @@
+"""HTTP front end that routes requests to the emulated Supabase services."""
+
+import asyncio
+
+from . import websocket
+from .gotrue import Auth
+from .postgrest import PostgREST, sales_time
+from .protocol import HttpError, Response, read_request, write_response
+from .realtime import Realtime
+from .storage import Storage
+from .store import Database, DatabaseError
+
+
+class LocalSupabase:
+    """The stand-in project: one database shared by all emulated services."""
+
+    def __init__(self, tables, seed=None, latency_ms=0, sales_timezone="UTC"):
+        self.db = Database(tables, sales_timezone)
+        self.latency = latency_ms / 1000
+        self.auth = Auth(self.db)
+        self.rest = PostgREST(self.db)
+        self.storage = Storage()
+        self.realtime = Realtime(self.db, latency_ms=latency_ms)
+        self.db.listeners.append(self.bump_catalog_version)
+        self.db.listeners.append(self.count_sales)
+        if seed:
+            self.load_seed(seed)
+
+    def load_seed(self, seed):
+        for user in seed.get("users", []):
+            self.auth.create_user(user["email"], user["password"], user_id=user.get("id"), role=user.get("role"))
+        for table, rows in seed.get("tables", {}).items():
+            for row in rows:
+                self.db.insert(table, row)
+
+    def bump_catalog_version(self, change):
+        """Mirror of the products_bump_catalog_version trigger (per row rather than per statement)."""
+        if change["table"] != "products" or "catalog_versions" not in self.db.tables:
+            return
+        is_products = lambda row: row["name"] == "products"
+        current = [row for row in self.db.select("catalog_versions") if is_products(row)]
+        if current:
+            self.db.update("catalog_versions", is_products, {"version": current[0]["version"] + 1})
+        else:
+            self.db.insert("catalog_versions", {"name": "products"})
+
+    def count_sales(self, change):
+        """Mirror of the orders_count_sales and order_items_count_sales triggers (per row)."""
+        if change["type"] != "INSERT" or "sales_daily" not in self.db.tables:
+            return
+        record = change["record"]
+        if change["table"] == "orders":
+            placed = sales_time(record["created_at"], self.db.sales_timezone)
+            day = placed.date().isoformat()
+            self.add_sales("sales_daily", {"day": day}, orders=1, revenue=record["total"])
+            self.add_sales("sales_hourly", {"day": day, "hour": placed.hour}, orders=1, revenue=record["total"])
+        elif change["table"] == "order_items":
+            self.add_sales(
+                "product_sales_daily",
+                {"day": sales_time(record["order_created_at"], self.db.sales_timezone).date().isoformat(), "name": record["name"]},
+                units=record["quantity"],
+                revenue=record["price"] * record["quantity"],
+                product_id=record.get("product_id"),
+            )
+
+    def add_sales(self, table, key, product_id=None, **amounts):
+        """Upsert one summary bucket, adding ``amounts`` to what it already holds."""
+        matches = lambda row: all(row[column] == value for column, value in key.items())
+        current = [row for row in self.db.select(table) if matches(row)]
+        changes = dict(amounts)
+        if product_id is not None:
+            changes["product_id"] = product_id
+        if current:
+            for column, amount in amounts.items():
+                changes[column] = current[0][column] + amount
+            self.db.update(table, matches, changes)
+        else:
+            self.db.insert(table, {**key, **changes})
+
+    async def dispatch(self, request):
+        path = request.path
+        if request.method == "OPTIONS":
+            requested = request.header("access-control-request-headers", "*")
+            return Response(204, headers={"Access-Control-Allow-Headers": requested})
+        if path.startswith("/rest/v1/"):
+            return self.rest.handle(request, path[len("/rest/v1/"):])
+        if path.startswith("/auth/v1/"):
+            return self.auth.handle(request, path[len("/auth/v1/"):])
+        if path.startswith("/storage/v1/"):
+            return self.storage.handle(request, path[len("/storage/v1/"):])
+        raise HttpError(404, {"message": f"No route for {request.method} {path}"})
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await read_request(reader)
+                if request is None:
+                    break
+
+                if request.header("upgrade").lower() == "websocket":
+                    await self.upgrade(request, reader, writer)
+                    return
+
+                try:
+                    response = await self.dispatch(request)
+                except HttpError as err:
+                    response = Response(err.status, err.body)
+                except DatabaseError as err:
+                    response = Response(err.status, {"code": err.code, "message": err.message, "details": None, "hint": None})
+
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                if request.method == "HEAD":
+                    response.body = b""
+
+                keep_alive = request.header("connection").lower() != "close"
+                write_response(writer, response, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def upgrade(self, request, reader, writer):
+        if not request.path.startswith("/realtime/v1/websocket"):
+            write_response(writer, Response(404, {"message": "Not found"}), keep_alive=False)
+            return
+        key = request.header("sec-websocket-key")
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {websocket.accept_key(key)}\r\n\r\n"
+            ).encode()
+        )
+        await writer.drain()
+        await self.realtime.serve(websocket.WebSocket(reader, writer), dict(request.params))
+
+    async def serve(self, host="127.0.0.1", port=54321, ready=None):
+        """Serve until cancelled; ``ready`` (an asyncio.Event) is set once the port accepts connections."""
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
@@ -0,0 +1,80 @@
+"""The subset of the Supabase Storage API used by uploadProductImage and publishMenu.
+
+Public objects carry an ``ETag`` and the ``Cache-Control`` given at upload
+(``max-age=3600`` by default, like Supabase), and answer ``If-None-Match``
+with 304 so browser cache validation behaves as in production.
+"""
+
+import hashlib
+import mimetypes
+import re
+import uuid
+
+from .protocol import HttpError, Response
+
+
+FIELD_NAME_RE = re.compile(r'name="([^"]*)"')
+
+
+def parse_multipart(body, content_type):
+    """Return ``(content_type, data, fields)``: the first file part and the plain form fields."""
+    boundary = content_type.split("boundary=", 1)[1].strip('"')
+    file_part, fields = None, {}
+    for part in body.split(b"--" + boundary.encode()):
+        head, _, data = part.partition(b"\r\n\r\n")
+        data = data[:-2] if data.endswith(b"\r\n") else data
+        headers = head.decode("latin-1").lower()
+        if "filename=" not in headers:
+            name = FIELD_NAME_RE.search(head.decode("latin-1"))
+            if name:
+                fields[name.group(1)] = data.decode("utf-8")
+            continue
+        if file_part is None:
+            part_type = "application/octet-stream"
+            for line in headers.split("\r\n"):
+                if line.startswith("content-type:"):
+                    part_type = line.split(":", 1)[1].strip()
+            file_part = (part_type, data)
+    if file_part is None:
+        raise HttpError(400, {"statusCode": "400", "error": "Invalid Request", "message": "No file in form data"})
+    return file_part[0], file_part[1], fields
+
+
+class Storage:
+    def __init__(self):
+        self.objects = {}
+
+    def handle(self, request, route):
+        if route.startswith("object/public/") and request.method in ("GET", "HEAD"):
+            bucket, _, path = route[len("object/public/"):].partition("/")
+            if (bucket, path) not in self.objects:
+                raise HttpError(404, {"statusCode": "404", "error": "not_found", "message": "Object not found"})
+            content_type, data, cache_control = self.objects[(bucket, path)]
+            etag = '"' + hashlib.md5(data).hexdigest() + '"'
+            headers = {"ETag": etag, "Cache-Control": cache_control}
+            if etag in request.header("if-none-match"):
+                return Response(304, headers=headers)
+            return Response(200, data, headers=headers, content_type=content_type)
+
+        if route.startswith("object/") and request.method in ("POST", "PUT"):
+            bucket, _, path = route[len("object/"):].partition("/")
+            key = (bucket, path)
+            upsert = request.header("x-upsert") == "true" or request.method == "PUT"
+            if key in self.objects and not upsert:
+                raise HttpError(400, {"statusCode": "409", "error": "Duplicate", "message": "The resource already exists"})
+
+            content_type = request.header("content-type")
+            cache_control = request.header("cache-control") or "max-age=3600"
+            if content_type.startswith("multipart/form-data"):
+                content_type, data, fields = parse_multipart(request.body, content_type)
+                if fields.get("cacheControl"):
+                    cache_control = f"max-age={fields['cacheControl']}"
+            else:
+                data = request.body
+            if not content_type or content_type == "application/octet-stream":
+                content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+            self.objects[key] = (content_type, data, cache_control)
+            return Response(200, {"Id": str(uuid.uuid4()), "Key": f"{bucket}/{path}"})
+
+        raise HttpError(404, {"statusCode": "404", "error": "not_found", "message": f"Unsupported storage route: /{route}"})
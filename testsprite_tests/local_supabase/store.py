@@ -0,0 +1,122 @@
+"""In-memory tables with column defaults and change notifications."""
+
+import copy
+from zoneinfo import ZoneInfo
+
+from .schema import utc_now
+
+
+class DatabaseError(Exception):
+    """A constraint violation, reported with the Postgres error code."""
+
+    def __init__(self, code, message, status=400):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+class Database:
+    def __init__(self, tables, sales_timezone="UTC"):
+        self.tables = tables
+        self.rows = {name: [] for name in tables}
+        # What public.sales_timezone() returns; the sales summaries are local to it
+        self.sales_timezone = ZoneInfo(sales_timezone)
+        # Called with a change dict after every write, like a WAL consumer.
+        self.listeners = []
+
+    def table(self, name):
+        if name not in self.tables:
+            raise DatabaseError(
+                "42P01",
+                f'Could not find the table \'public.{name}\' in the schema cache',
+                status=404,
+            )
+        return self.tables[name]
+
+    def select(self, name):
+        self.table(name)
+        return [copy.deepcopy(row) for row in self.rows[name]]
+
+    def insert(self, name, record):
+        table = self.table(name)
+        unknown = set(record) - set(table.columns)
+        if unknown:
+            column = sorted(unknown)[0]
+            raise DatabaseError("PGRST204", f"Could not find the '{column}' column of '{name}' in the schema cache")
+
+        row = {}
+        for column in table.columns.values():
+            if column.name in record:
+                row[column.name] = column.coerce(record[column.name])
+            else:
+                row[column.name] = column.default_value()
+        self._validate(table, row)
+
+        if "id" in row and any(existing.get("id") == row["id"] for existing in self.rows[name]):
+            raise DatabaseError("23505", f'duplicate key value violates unique constraint "{name}_pkey"', status=409)
+
+        self.rows[name].append(row)
+        self._emit("INSERT", name, row, None)
+        return copy.deepcopy(row)
+
+    def update(self, name, predicate, changes):
+        table = self.table(name)
+        updated = []
+        for row in self.rows[name]:
+            if not predicate(row):
+                continue
+            candidate = dict(row)
+            for key, value in changes.items():
+                column = table.column(key)
+                if column is None:
+                    raise DatabaseError("PGRST204", f"Could not find the '{key}' column of '{name}' in the schema cache")
+                candidate[key] = column.coerce(value)
+            if table.column("updated_at") is not None and "updated_at" not in changes:
+                # Same as the touch_updated_at trigger (20261018100000_orders_updated_at)
+                candidate["updated_at"] = utc_now()
+            self._validate(table, candidate)
+            row.update(candidate)
+            updated.append(copy.deepcopy(row))
+            self._emit("UPDATE", name, row, {"id": row.get("id")})
+        return updated
+
+    def delete(self, name, predicate):
+        self.table(name)
+        kept, deleted = [], []
+        for row in self.rows[name]:
+            (deleted if predicate(row) else kept).append(row)
+        self.rows[name] = kept
+        for row in deleted:
+            self._emit("DELETE", name, None, {"id": row.get("id")})
+        return deleted
+
+    def _validate(self, table, row):
+        for column in table.columns.values():
+            value = row.get(column.name)
+            if value is None and column.not_null:
+                raise DatabaseError(
+                    "23502",
+                    f'null value in column "{column.name}" of relation "{table.name}" violates not-null constraint',
+                )
+            if value is not None and column.choices and value not in column.choices:
+                raise DatabaseError(
+                    "23514",
+                    f'new row for relation "{table.name}" violates check constraint "{table.name}_{column.name}_check"',
+                )
+
+    def _emit(self, event_type, name, record, old_record):
+        change = {
+            "type": event_type,
+            "schema": "public",
+            "table": name,
+            "commit_timestamp": utc_now(),
+            "record": copy.deepcopy(record) if record is not None else {},
+            "old_record": old_record or {},
+            "columns": [
+                {"name": column.name, "type": column.realtime_type}
+                for column in self.tables[name].columns.values()
+            ],
+        }
+        for listener in list(self.listeners):
+            listener(change)
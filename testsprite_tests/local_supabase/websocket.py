@@ -0,0 +1,176 @@
+"""Minimal RFC 6455 WebSocket framing over asyncio streams.
+
+Used by the realtime endpoint of the stand-in server and, as a client, by
+the benchmark tools. Only what Phoenix/realtime-js needs is implemented:
+text and binary messages, fragmentation, ping/pong and close.
+"""
+
+import asyncio
+import base64
+import hashlib
+import os
+import ssl
+import struct
+from urllib.parse import urlsplit
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+def accept_key(key):
+    digest = hashlib.sha1((key + GUID).encode()).digest()
+    return base64.b64encode(digest).decode()
+
+
+def apply_mask(data, mask):
+    return bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+
+
+class ConnectionClosed(Exception):
+    pass
+
+
+class WebSocket:
+    """One open WebSocket connection.
+
+    Clients must mask the frames they send and servers must not, so the
+    side is chosen with ``client``.
+    """
+
+    def __init__(self, reader, writer, client=False):
+        self.reader = reader
+        self.writer = writer
+        self.client = client
+        self.closed = False
+        self._send_lock = asyncio.Lock()
+
+    async def _read_frame(self):
+        head = await self.reader.readexactly(2)
+        fin = bool(head[0] & 0x80)
+        opcode = head[0] & 0x0F
+        masked = bool(head[1] & 0x80)
+        length = head[1] & 0x7F
+        if length == 126:
+            (length,) = struct.unpack("!H", await self.reader.readexactly(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await self.reader.readexactly(8))
+        mask = await self.reader.readexactly(4) if masked else None
+        payload = await self.reader.readexactly(length)
+        if mask:
+            payload = apply_mask(payload, mask)
+        return fin, opcode, payload
+
+    async def _write_frame(self, opcode, payload):
+        header = bytearray([0x80 | opcode])
+        mask_bit = 0x80 if self.client else 0
+        length = len(payload)
+        if length < 126:
+            header.append(mask_bit | length)
+        elif length < 1 << 16:
+            header.append(mask_bit | 126)
+            header += struct.pack("!H", length)
+        else:
+            header.append(mask_bit | 127)
+            header += struct.pack("!Q", length)
+        if self.client:
+            mask = os.urandom(4)
+            header += mask
+            payload = apply_mask(payload, mask)
+
+        async with self._send_lock:
+            self.writer.write(bytes(header) + payload)
+            await self.writer.drain()
+
+    async def recv(self):
+        """Return the next text (str) or binary (bytes) message.
+
+        Raises ``ConnectionClosed`` once the peer closes the connection.
+        """
+        fragments, message_opcode = [], None
+        while True:
+            try:
+                fin, opcode, payload = await self._read_frame()
+            except (asyncio.IncompleteReadError, ConnectionError) as err:
+                self.closed = True
+                raise ConnectionClosed() from err
+
+            if opcode == OP_PING:
+                await self._write_frame(OP_PONG, payload)
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                await self.close()
+                raise ConnectionClosed()
+
+            if opcode != OP_CONTINUATION:
+                message_opcode = opcode
+            fragments.append(payload)
+            if fin:
+                data = b"".join(fragments)
+                return data.decode() if message_opcode == OP_TEXT else data
+
+    async def send(self, message):
+        if self.closed:
+            raise ConnectionClosed()
+        if isinstance(message, str):
+            await self._write_frame(OP_TEXT, message.encode())
+        else:
+            await self._write_frame(OP_BINARY, message)
+
+    async def close(self, code=1000):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            await self._write_frame(OP_CLOSE, struct.pack("!H", code))
+        except ConnectionError:
+            pass
+        self.writer.close()
+
+
+async def connect(url, headers=None):
+    """Open a client connection to a ``ws://`` or ``wss://`` URL."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("ws", "wss"):
+        raise ValueError(f"Only ws:// and wss:// URLs are supported, got {url!r}")
+    secure = parts.scheme == "wss"
+    reader, writer = await asyncio.open_connection(
+        parts.hostname,
+        parts.port or (443 if secure else 80),
+        ssl=ssl.create_default_context() if secure else None,
+    )
+
+    key = base64.b64encode(os.urandom(16)).decode()
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    lines = [
+        f"GET {path} HTTP/1.1",
+        f"Host: {parts.netloc}",
+        "Upgrade: websocket",
+        "Connection: Upgrade",
+        f"Sec-WebSocket-Key: {key}",
+        "Sec-WebSocket-Version: 13",
+    ]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+    await writer.drain()
+
+    response = await reader.readuntil(b"\r\n\r\n")
+    status_line, *header_lines = response.decode("latin-1").split("\r\n")
+    if " 101 " not in status_line:
+        writer.close()
+        raise ConnectionError(f"WebSocket upgrade refused: {status_line}")
+    received = {
+        name.lower(): value
+        for name, value in (line.split(": ", 1) for line in header_lines if ": " in line)
+    }
+    if received.get("sec-websocket-accept") != accept_key(key):
+        writer.close()
+        raise ConnectionError("WebSocket upgrade returned a bad accept key")
+    return WebSocket(reader, writer, client=True)
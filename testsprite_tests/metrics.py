@@ -0,0 +1,175 @@
+"""Per-scenario web performance metrics and the baseline comparison.
+
+``PageMetrics`` is installed on every scenario context by
+``harness.scenario``. It records, for the first document each scenario
+loads:
+
+* navigation timing (TTFB, DOMContentLoaded, load) and LCP,
+* the User Timing marks the app sets (``auth:ready`` when AuthProvider
+  leaves its spinner, ``menu:products`` when the first Menu product card
+  renders, ``orders:ready`` when OrderList shows "Pedidos Entrantes", see
+  services/perf.ts),
+* the number of Supabase requests the scenario made.
+
+``run_suite.py`` writes them to ``tmp/metrics.json`` and compares them with
+``metrics_baseline.json``.
+"""
+
+import json
+from pathlib import Path
+
+import harness
+from steps import is_supabase_request
+
+BASELINE_PATH = Path(__file__).resolve().parent / "metrics_baseline.json"
+DEFAULT_TOLERANCE = 0.2
+# Absolute slack so jitter on small timings does not count as a regression.
+DEFAULT_SLACK_MS = 100
+
+INIT_SCRIPT = """
+(() => {
+  window.__perfMetrics = { lcp: null };
+  try {
+    new PerformanceObserver((list) => {
+      const entries = list.getEntries();
+      const last = entries[entries.length - 1];
+      if (last) window.__perfMetrics.lcp = last.renderTime || last.loadTime || last.startTime;
+    }).observe({ type: 'largest-contentful-paint', buffered: true });
+  } catch (e) {}
+  window.addEventListener('pagehide', () => {
+    if (window.__reportPerf) window.__reportPerf(window.__collectPerf());
+  });
+  window.__collectPerf = () => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const marks = {};
+    for (const mark of performance.getEntriesByType('mark')) {
+      if (!(mark.name in marks)) marks[mark.name] = mark.startTime;
+    }
+    return {
+      url: location.href,
+      navigation: nav ? {
+        ttfb: nav.responseStart,
+        dom_content_loaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+      } : null,
+      lcp: window.__perfMetrics.lcp,
+      marks,
+    };
+  };
+})();
+"""
+
+MARK_METRICS = {
+    "auth_ready_ms": "auth:ready",
+    "menu_first_product_ms": "menu:products",
+    "orders_ready_ms": "orders:ready",
+}
+
+# metric -> (start mark, end mark); durations survive the typing time of a
+# login flow that would otherwise dominate the absolute mark times.
+MEASURE_METRICS = {
+    "menu_load_ms": ("menu:mount", "menu:products"),
+    "orders_load_ms": ("orders:mount", "orders:ready"),
+}
+
+
+def rounded(value):
+    return round(value, 1) if isinstance(value, (int, float)) else None
+
+
+class PageMetrics:
+    """Collects timing snapshots from every document a context loads."""
+
+    def __init__(self, context):
+        self.context = context
+        self.documents = []
+        self.supabase_requests = 0
+        self.requests_by_service = {}
+        context.on("request", self._on_request)
+        harness.attach("metrics", self)
+
+    async def install(self):
+        await self.context.expose_binding("__reportPerf", lambda source, snapshot: self.documents.append(snapshot))
+        await self.context.add_init_script(INIT_SCRIPT)
+
+    def _on_request(self, request):
+        if is_supabase_request(request.url):
+            self.supabase_requests += 1
+            service = request.url.split("/v1/", 1)[0].rsplit("/", 1)[-1]
+            self.requests_by_service[service] = self.requests_by_service.get(service, 0) + 1
+
+    async def collect(self):
+        """Snapshot the documents still open; call before the context closes."""
+        for page in self.context.pages:
+            try:
+                self.documents.append(await page.evaluate("window.__collectPerf && window.__collectPerf()"))
+            except Exception:
+                # A page that never finished loading has nothing to report.
+                pass
+
+    def summary(self):
+        documents = [d for d in self.documents if d]
+        first = next((d for d in documents if d.get("navigation")), {})
+        navigation = first.get("navigation") or {}
+
+        result = {
+            "ttfb_ms": rounded(navigation.get("ttfb")),
+            "dom_content_loaded_ms": rounded(navigation.get("dom_content_loaded")),
+            "load_ms": rounded(navigation.get("load")),
+            "lcp_ms": rounded(first.get("lcp")),
+            "supabase_requests": self.supabase_requests,
+            "supabase_requests_by_service": dict(self.requests_by_service),
+        }
+        for metric, mark in MARK_METRICS.items():
+            result[metric] = next((rounded(d["marks"][mark]) for d in documents if mark in d.get("marks", {})), None)
+        for metric, (start, end) in MEASURE_METRICS.items():
+            result[metric] = next(
+                (rounded(d["marks"][end] - d["marks"][start])
+                 for d in documents if start in d.get("marks", {}) and end in d.get("marks", {})),
+                None,
+            )
+        return result
+
+
+# --- Baseline ---
+
+def load_baseline(path=BASELINE_PATH):
+    path = Path(path)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(metrics_by_scenario, path=BASELINE_PATH):
+    Path(path).write_text(json.dumps(metrics_by_scenario, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE, slack_ms=DEFAULT_SLACK_MS):
+    """Return the metrics that got worse than ``baseline`` by more than the tolerance.
+
+    A timing regresses when it exceeds ``baseline * (1 + tolerance) + slack_ms``;
+    the Supabase request count is compared exactly, with neither tolerance nor
+    slack, since one extra request per scenario is already a real regression.
+    """
+    regressions = []
+    for scenario_id, metrics in sorted(current.items()):
+        expected = baseline.get(scenario_id)
+        if not expected:
+            continue
+        for name, value in metrics.items():
+            reference = expected.get(name)
+            if not isinstance(value, (int, float)) or not isinstance(reference, (int, float)):
+                continue
+            if name == "supabase_requests":
+                limit = reference
+            else:
+                limit = reference * (1 + tolerance) + slack_ms
+            if value > limit:
+                regressions.append({
+                    "scenario": scenario_id,
+                    "metric": name,
+                    "baseline": reference,
+                    "current": value,
+                    "limit": round(limit, 1),
+                })
+    return regressions
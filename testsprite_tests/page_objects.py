@@ -0,0 +1,269 @@
+"""Page objects for the app's screens, built on its ``data-testid`` hooks.
+
+The generated scripts located elements with absolute XPaths such as
+``html/body/div/div/main/div/div[3]/div/div[2]/div[2]/button``, which break
+on any layout change. Every locator here is a single CSS selector over the
+``data-testid`` (and ``data-*``) attributes set in the components, so it
+resolves in one query regardless of the markup around it.
+
+Objects are cheap and bound to the frame they are created on, matching the
+scripts' ``frame = context.pages[-1]`` idiom:
+
+    frame = context.pages[-1]
+    await steps.click(MenuPage(frame).add_to_cart_button("Hamburguesa Simple"))
+"""
+
+
+def testid(name, **data):
+    """CSS selector for ``data-testid=name`` plus optional ``data-*`` attributes."""
+    selector = f'[data-testid="{name}"]'
+    for key, value in data.items():
+        selector += f'[data-{key.replace("_", "-")}="{value}"]'
+    return selector
+
+
+class PageObject:
+    def __init__(self, frame):
+        self.frame = frame
+
+    def find(self, *selectors):
+        """Locator for descendant selectors joined into one CSS query."""
+        return self.frame.locator(" ".join(selectors))
+
+
+class Navbar(PageObject):
+    @property
+    def home_link(self):
+        return self.find(testid("nav-home"))
+
+    @property
+    def dashboard_link(self):
+        return self.find(testid("nav-dashboard"))
+
+    @property
+    def login_link(self):
+        return self.find(testid("nav-login"))
+
+    @property
+    def cart_button(self):
+        return self.find(testid("nav-cart"))
+
+    @property
+    def cart_count(self):
+        return self.find(testid("nav-cart-count"))
+
+
+class MenuPage(PageObject):
+    def category(self, name):
+        return self.find(testid("menu-category", category=name))
+
+    def product_card(self, name):
+        return self.find(testid("product-card", product_name=name))
+
+    def product_image(self, name):
+        return self.find(testid("product-card", product_name=name), "img")
+
+    def add_to_cart_button(self, name):
+        return self.find(testid("product-card", product_name=name), testid("add-to-cart"))
+
+    async def add_to_cart(self, steps, name, times=1):
+        for _ in range(times):
+            await steps.click(self.add_to_cart_button(name))
+
+
+class CartPanel(PageObject):
+    @property
+    def panel(self):
+        return self.find(testid("cart-panel"))
+
+    @property
+    def backdrop(self):
+        return self.find(testid("cart-backdrop"))
+
+    @property
+    def close_button(self):
+        return self.find(testid("cart-close"))
+
+    def item(self, name):
+        return self.find(testid("cart-item", product_name=name))
+
+    @property
+    def items(self):
+        return self.find(testid("cart-item"))
+
+    def increment_button(self, name=None):
+        """``+`` of the named line, or of the first line when no name is given."""
+        line = testid("cart-item", product_name=name) if name else testid("cart-item")
+        return self.find(line, testid("cart-increment")).first
+
+    def decrement_button(self, name=None):
+        line = testid("cart-item", product_name=name) if name else testid("cart-item")
+        return self.find(line, testid("cart-decrement")).first
+
+    def quantity(self, name):
+        return self.find(testid("cart-item", product_name=name), testid("cart-quantity"))
+
+    @property
+    def subtotal(self):
+        return self.find(testid("cart-subtotal"))
+
+    @property
+    def checkout_button(self):
+        return self.find(testid("cart-checkout"))
+
+    @property
+    def name_input(self):
+        return self.find(testid("checkout-name"))
+
+    @property
+    def phone_input(self):
+        return self.find(testid("checkout-phone"))
+
+    @property
+    def address_input(self):
+        return self.find(testid("checkout-address"))
+
+    @property
+    def submit_button(self):
+        return self.find(testid("checkout-submit"))
+
+    @property
+    def back_button(self):
+        return self.find(testid("checkout-back"))
+
+    @property
+    def success(self):
+        return self.find(testid("order-success"))
+
+    async def place_order(self, steps, name, phone, address=""):
+        """From an open cart: go to the details step, fill it in and submit."""
+        await steps.click(self.checkout_button)
+        await steps.fill(self.name_input, name)
+        await steps.fill(self.phone_input, phone)
+        if address:
+            await steps.fill(self.address_input, address)
+        await steps.click(self.submit_button)
+
+
+class LoginPage(PageObject):
+    # The Supabase Auth UI renders its own inputs; the wrapper carries the hook.
+    @property
+    def email_input(self):
+        return self.find(testid("login-form"), "input[type=email]")
+
+    @property
+    def password_input(self):
+        return self.find(testid("login-form"), "input[type=password]")
+
+    @property
+    def submit_button(self):
+        return self.find(testid("login-form"), "button[type=submit]")
+
+    async def sign_in(self, steps, email, password):
+        await steps.fill(self.email_input, email)
+        await steps.fill(self.password_input, password)
+        await steps.click(self.submit_button)
+
+
+class DashboardPage(PageObject):
+    def tab(self, name):
+        """``orders``, ``products``, ``employees`` or ``reports``."""
+        return self.find(testid("dashboard-tab", tab=name))
+
+    @property
+    def role_label(self):
+        return self.find(testid("dashboard-role"))
+
+    @property
+    def sign_out_button(self):
+        return self.find(testid("dashboard-sign-out"))
+
+
+class OrderListPanel(PageObject):
+    @property
+    def refresh_button(self):
+        return self.find(testid("orders-refresh"))
+
+    @property
+    def load_older_button(self):
+        """Pages through the remaining active orders, then the delivered history."""
+        return self.find(testid("orders-load-older"))
+
+    def section(self, status):
+        """Heading of the board section for one status.
+
+        The board is windowed, so only the rows near the viewport are in the
+        DOM; scroll before asserting on orders far down the list.
+        """
+        return self.find(testid("orders-section", status=status))
+
+    def rows(self, status=None):
+        return self.find(testid("order-row", status=status) if status else testid("order-row"))
+
+    def row(self, order_id):
+        return self.find(testid("order-row", order_id=order_id))
+
+    def details_toggle(self, order_id):
+        """Expands the row with the full order (line prices) loaded on demand."""
+        return self.find(testid("order-row", order_id=order_id), testid("order-toggle-details"))
+
+    def details(self, order_id):
+        return self.find(testid("order-row", order_id=order_id), testid("order-details"))
+
+    def select_checkbox(self, order_id):
+        return self.find(testid("order-row", order_id=order_id), testid("order-select"))
+
+    def select_section(self, status):
+        """Header checkbox selecting every loaded order of one status."""
+        return self.find(testid("orders-select-section", status=status))
+
+    @property
+    def bulk_count(self):
+        return self.find(testid("orders-bulk-count"))
+
+    @property
+    def bulk_advance_button(self):
+        """Moves every selected order to its next status, one request per current status."""
+        return self.find(testid("orders-bulk-advance"))
+
+    @property
+    def bulk_clear_button(self):
+        return self.find(testid("orders-bulk-clear"))
+
+    def advance_button(self, next_status, order_id=None):
+        """Button moving an order (the first one that can, by default) to ``next_status``."""
+        row = testid("order-row", order_id=order_id) if order_id else testid("order-row")
+        return self.find(row, testid("order-advance", next_status=next_status)).first
+
+
+class ReportsPanel(PageObject):
+    def range_button(self, days):
+        """``7``, ``30``, ``90`` or ``365`` days, today included."""
+        return self.find(testid("reports-range", days=days))
+
+    @property
+    def revenue(self):
+        return self.find(testid("reports-revenue"))
+
+    @property
+    def orders(self):
+        return self.find(testid("reports-orders"))
+
+    @property
+    def average_ticket(self):
+        return self.find(testid("reports-average"))
+
+    def day_bar(self, day):
+        """Bar of one ``YYYY-MM-DD`` day; its title holds the revenue and order count."""
+        return self.find(testid("reports-day", day=day))
+
+    def hour_bar(self, hour):
+        return self.find(testid("reports-hour", hour=hour))
+
+    @property
+    def product_rows(self):
+        """Best sellers of the range, most units first."""
+        return self.find(testid("reports-product"))
+
+    def product_row(self, name):
+        return self.find(testid("reports-product", product_name=name))
@@ -0,0 +1,233 @@
+"""Check with EXPLAIN that the queries dataService sends use their indexes.
+
+Each entry in ``QUERIES`` is the SQL that PostgREST runs for one call in
+services/dataService.ts (its filters and ordering, without the JSON shaping)
+and the indexes that must serve it. Plans are taken with sequential scans
+disabled: on a small development database the planner rightly prefers them,
+so what is checked is that the index fits the query's shape and, for ordered
+reads, that it delivers the order without a Sort node. orders is partitioned
+by month, so its scans use each partition's copy of an index; those are
+reported under the name of the index created on orders.
+
+    python testsprite_tests/query_plans.py
+    python testsprite_tests/query_plans.py --db-url postgresql://... --verbose
+
+Run it after ``migrate.py up``; it exits non-zero if any query misses its index.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from migrate import DEFAULT_DB_URL, PsqlError, psql
+
+# Placeholder keys: the plan shape does not depend on whether rows match.
+SOME_ID = "00000000-0000-0000-0000-000000000000"
+SOME_TIME = "2026-01-01T00:00:00+00:00"
+
+
+class Query:
+    def __init__(self, call, sql, index, ordered=False):
+        self.call = call
+        self.sql = sql
+        # Reads through order_history need one index per table of the union
+        self.indexes = (index,) if isinstance(index, str) else tuple(index)
+        self.ordered = ordered
+
+
+QUERIES = [
+    Query(
+        "fetchOrders (active orders, first page)",
+        "select id from public.orders where status = any('{pending,preparing,ready}'::text[])"
+        " order by created_at desc, id desc limit 51",
+        "orders_active_feed_idx",
+        ordered=True,
+    ),
+    Query(
+        "fetchOrders (active orders, next page)",
+        "select id from public.orders where status = any('{pending,preparing,ready}'::text[])"
+        f" and (created_at < '{SOME_TIME}' or (created_at = '{SOME_TIME}' and id < '{SOME_ID}'))"
+        " order by created_at desc, id desc limit 51",
+        "orders_active_feed_idx",
+        ordered=True,
+    ),
+    Query(
+        "fetchOrders (delivered history)",
+        "select id from public.order_history where status = 'delivered'"
+        f" and (created_at < '{SOME_TIME}' or (created_at = '{SOME_TIME}' and id < '{SOME_ID}'))"
+        " order by created_at desc, id desc limit 51",
+        ("orders_status_feed_idx", "orders_archive_feed_idx"),
+        ordered=True,
+    ),
+    Query(
+        "fetchOrderChanges",
+        f"select id from public.orders where updated_at > '{SOME_TIME}' order by updated_at",
+        "orders_updated_at_idx",
+        ordered=True,
+    ),
+    Query(
+        "order_items embed (list, details, fetchOrderSummaries)",
+        f"select name, quantity from public.order_items where order_id = '{SOME_ID}' order by line_no",
+        "order_items_order_id_idx",
+        ordered=True,
+    ),
+    Query(
+        "order_items embed of an archived order (order_history)",
+        f"select name, quantity from public.order_items_archive where order_id = '{SOME_ID}' order by line_no",
+        "order_items_archive_order_id_idx",
+        ordered=True,
+    ),
+    Query(
+        "fetchOrderDetails",
+        f"select id from public.order_history where id = '{SOME_ID}'",
+        ("orders_pkey", "orders_archive_pkey"),
+    ),
+    Query(
+        "fetchOrderSummaries",
+        f"select id from public.orders where id = any('{{{SOME_ID}}}'::uuid[])",
+        "orders_pkey",
+    ),
+    Query(
+        "updateOrdersStatus",
+        f"select id from public.orders where id = any('{{{SOME_ID}}}'::uuid[]) and status = 'pending'",
+        "orders_pkey",
+    ),
+    Query(
+        "fetchProductSummaries / menu_document (menu)",
+        "select * from public.products where active = true order by category, name",
+        "products_menu_idx",
+        ordered=True,
+    ),
+    Query(
+        "fetchProduct",
+        f"select * from public.products where id = '{SOME_ID}'",
+        "products_pkey",
+    ),
+    Query(
+        "fetchCatalogVersion",
+        "select version from public.catalog_versions where name = 'products'",
+        "catalog_versions_pkey",
+    ),
+    Query(
+        "fetchSalesReport (daily)",
+        "select day, orders, revenue from public.sales_daily"
+        " where day between '2026-01-01' and '2026-12-31' order by day",
+        "sales_daily_pkey",
+        ordered=True,
+    ),
+    Query(
+        "fetchSalesReport (per hour)",
+        "select hour, sum(orders) from public.sales_hourly"
+        " where day between '2026-01-01' and '2026-12-31' group by hour",
+        "sales_hourly_pkey",
+    ),
+    Query(
+        "fetchSalesReport (products)",
+        "select name, sum(units) from public.product_sales_daily"
+        " where day between '2026-01-01' and '2026-12-31' group by name",
+        "product_sales_daily_pkey",
+    ),
+    Query(
+        "fetchProfileRole",
+        f"select role from public.profiles where id = '{SOME_ID}'",
+        "profiles_pkey",
+    ),
+]
+
+
+# Each partition's index is attached to the parent's, which may itself be a
+# partition's index one level up.
+INDEX_PARENTS = """
+select child.relname, parent.relname
+from pg_inherits i
+join pg_class child on child.oid = i.inhrelid
+join pg_class parent on parent.oid = i.inhparent
+where child.relkind in ('i', 'I');
+"""
+
+
+def index_parents(db_url):
+    """Map each partition index name to the index it is attached to."""
+    output = psql(db_url, INDEX_PARENTS, "--tuples-only", "--no-align", "--field-separator=|")
+    return dict(line.split("|", 1) for line in output.splitlines() if "|" in line)
+
+
+def root_index(name, parents):
+    while name in parents:
+        name = parents[name]
+    return name
+
+
+def explain(db_url, sql):
+    """The JSON plan of ``sql`` with sequential scans disabled."""
+    script = f"begin;\nset local enable_seqscan = off;\nexplain (format json) {sql};\nrollback;\n"
+    output = psql(db_url, script, "--tuples-only", "--no-align")
+    return json.loads(output)[0]["Plan"]
+
+
+def walk(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+def check(plan, query, parents):
+    """Return a list of problems with ``plan`` for ``query`` (empty when it is fine)."""
+    nodes = list(walk(plan))
+    problems = []
+    used = {root_index(node["Index Name"], parents) for node in nodes if "Index Name" in node}
+    missing = [index for index in query.indexes if index not in used]
+    if missing:
+        problems.append(f"expected {', '.join(missing)}, used {', '.join(sorted(used)) or 'none'}")
+    if query.ordered and any(node["Node Type"] in ("Sort", "Incremental Sort") for node in nodes):
+        problems.append("sorts instead of reading in index order")
+    return problems
+
+
+def format_plan(plan, depth=0):
+    label = plan["Node Type"]
+    if "Index Name" in plan:
+        label += f" using {plan['Index Name']}"
+    if "Relation Name" in plan:
+        label += f" on {plan['Relation Name']}"
+    lines = ["  " * depth + "-> " + label]
+    for child in plan.get("Plans", []):
+        lines.extend(format_plan(child, depth + 1))
+    return lines
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db-url", default=os.environ.get("DATABASE_URL", DEFAULT_DB_URL), help="Postgres connection URL")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan, not only the failing ones")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    failures = 0
+    try:
+        parents = index_parents(args.db_url)
+    except PsqlError as err:
+        print(f"query_plans: {err}", file=sys.stderr)
+        return 2
+    for query in QUERIES:
+        try:
+            plan = explain(args.db_url, query.sql)
+        except PsqlError as err:
+            print(f"query_plans: {err}", file=sys.stderr)
+            return 2
+        problems = check(plan, query, parents)
+        failures += bool(problems)
+        print(f"{'FAIL' if problems else 'ok':<5} {query.call:<52} {', '.join(query.indexes)}")
+        for problem in problems:
+            print(f"      {problem}")
+        if problems or args.verbose:
+            print("\n".join("      " + line for line in format_plan(plan)))
+    print(f"{len(QUERIES) - failures}/{len(QUERIES)} queries use their index")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+"""Run the TestSprite scenarios concurrently against one shared browser.
+
+Usage (from the repository root, with the dev server on :3000):
+
+    python testsprite_tests/run_suite.py --workers 6
+    python testsprite_tests/run_suite.py TC004 TC005
+    python testsprite_tests/run_suite.py --changed --base main
+
+Every TC*.py file is imported (not executed) and its ``run_test`` is given
+the shared Chromium, so each scenario gets its own isolated context. At most
+``--workers`` scenarios run at the same time and the combined results are
+written to ``tmp/suite_results.json``; every run is also appended, step by
+step, to the ``tmp/history.sqlite`` store (see history.py).
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import time
+import traceback
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+import harness
+import history
+import metrics
+import selection
+from harness import launch_browser
+from local_supabase import DEFAULT_PORT, create_app
+
+SUITE_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT = SUITE_DIR / "tmp" / "suite_results.json"
+DEFAULT_METRICS_OUTPUT = SUITE_DIR / "tmp" / "metrics.json"
+DEFAULT_WORKERS = 4
+DEFAULT_TIMEOUT_S = 180
+
+
+def discover(selectors=None):
+    """Return the scenario files, optionally filtered by id or name prefix."""
+    paths = sorted(SUITE_DIR.glob("TC*.py"))
+    if not selectors:
+        return paths
+    return [p for p in paths if any(p.stem.startswith(s) for s in selectors)]
+
+
+def load_scenario(path):
+    """Import a TC file and return its ``run_test`` coroutine function."""
+    spec = importlib.util.spec_from_file_location(f"scenario_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.run_test
+
+
+def scenario_title(path):
+    test_id, _, name = path.stem.partition("_")
+    return test_id, name.replace("_", " ")
+
+
+async def run_one(browser, path, semaphore, timeout):
+    test_id, title = scenario_title(path)
+    result = {
+        "id": test_id,
+        "title": title,
+        "file": path.name,
+        "status": "passed",
+        "error": None,
+    }
+
+    async with semaphore:
+        session = harness.track()
+        started = time.perf_counter()
+        try:
+            run_test = load_scenario(path)
+            await asyncio.wait_for(run_test(browser), timeout=timeout)
+        except asyncio.TimeoutError:
+            result["status"] = "failed"
+            result["error"] = f"Scenario timed out after {timeout}s"
+        except AssertionError as err:
+            result["status"] = "failed"
+            result["error"] = str(err)
+        except Exception as err:
+            result["status"] = "error"
+            result["error"] = "".join(traceback.format_exception_only(type(err), err)).strip()
+        result["duration_s"] = round(time.perf_counter() - started, 3)
+        if "steps" in session:
+            result["waits"] = session["steps"].summary()
+            result["steps"] = session["steps"].records
+        if "metrics" in session:
+            result["metrics"] = session["metrics"].summary()
+
+    saved = result.get("waits", {}).get("saved_ms", 0) / 1000
+    print(f"[{result['status'].upper():6}] {path.name} ({result['duration_s']}s, {saved:.1f}s saved vs fixed waits)")
+    return result
+
+
+async def start_stand_in(app, port=DEFAULT_PORT):
+    """Start the local stand-in and return its task once the port is listening.
+
+    Scenarios launched before that would fail on connection refused; a port
+    already in use surfaces here instead of as a wall of failed scenarios.
+    """
+    ready = asyncio.Event()
+    task = asyncio.ensure_future(app.serve(port=port, ready=ready))
+    waiter = asyncio.ensure_future(ready.wait())
+    await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+    if not ready.is_set():
+        waiter.cancel()
+        task.result()  # Re-raises why serve() stopped, e.g. the port is taken
+    return task
+
+
+async def run_suite(paths, workers=DEFAULT_WORKERS, timeout=DEFAULT_TIMEOUT_S, headless=True, local_supabase=None):
+    semaphore = asyncio.Semaphore(workers)
+    started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+
+    stand_in = None
+    if local_supabase is not None:
+        # Staff scenarios sign in against the stand-in too (auth_state.py).
+        os.environ.setdefault("VITE_SUPABASE_URL", f"http://127.0.0.1:{DEFAULT_PORT}")
+        stand_in = await start_stand_in(create_app(latency_ms=local_supabase))
+
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, shared=True, headless=headless)
+        try:
+            results = await asyncio.gather(
+                *(run_one(browser, path, semaphore, timeout) for path in paths)
+            )
+        finally:
+            await browser.close()
+            if stand_in:
+                stand_in.cancel()
+
+    wall_time = time.perf_counter() - started
+    return {
+        "started_at": started_at.isoformat(),
+        "wall_time_s": round(wall_time, 3),
+        "serial_time_s": round(sum(r["duration_s"] for r in results), 3),
+        "workers": workers,
+        "summary": {
+            "total": len(results),
+            "passed": sum(r["status"] == "passed" for r in results),
+            "failed": sum(r["status"] == "failed" for r in results),
+            "error": sum(r["status"] == "error" for r in results),
+            "saved_s": round(sum(r.get("waits", {}).get("saved_ms", 0) for r in results) / 1000, 3),
+        },
+        "scenarios": list(results),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("selectors", nargs="*", help="Scenario ids or file prefixes, e.g. TC004")
+    parser.add_argument("--changed", action="store_true", help="Only run scenarios affected by the git diff")
+    parser.add_argument("--base", default="HEAD", help="Git revision --changed diffs against")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Maximum scenarios running at once")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT_S, help="Per-scenario timeout in seconds")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Combined result file")
+    parser.add_argument("--metrics-output", type=Path, default=DEFAULT_METRICS_OUTPUT, help="Per-scenario metrics artifact")
+    parser.add_argument("--baseline", type=Path, default=metrics.BASELINE_PATH, help="Stored metrics baseline")
+    parser.add_argument("--tolerance", type=float, default=metrics.DEFAULT_TOLERANCE, help="Allowed relative slowdown, e.g. 0.2")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run's metrics as the new baseline")
+    parser.add_argument("--history", type=Path, default=history.DEFAULT_PATH, help="SQLite run history")
+    parser.add_argument("--no-history", action="store_true", help="Do not record this run in the history")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument(
+        "--local-supabase", action="store_true",
+        help=f"Serve the offline Supabase stand-in on :{DEFAULT_PORT} for the duration of the run",
+    )
+    parser.add_argument("--latency-ms", type=float, default=0, help="Fixed response latency of the stand-in")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    paths = discover(args.selectors)
+    if args.changed:
+        selected, reasons = selection.select(selection.changed_files(args.base), [p.stem for p in paths])
+        if selected is None:
+            print(f"Changes to {', '.join(reasons['*'])} affect every scenario; running all {len(paths)}.")
+        else:
+            paths = [p for p in paths if p.stem in selected]
+            if not paths:
+                print(f"No scenario is affected by the changes since {args.base}.")
+                return 0
+            print(f"Running {len(paths)} scenario(s) affected by the changes since {args.base}.")
+    if not paths:
+        print("No scenarios matched.", file=sys.stderr)
+        return 2
+
+    report = asyncio.run(run_suite(
+        paths, args.workers, args.timeout, headless=not args.headed, local_supabase=args.latency_ms if args.local_supabase else None,
+    ))
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    summary = report["summary"]
+    print(
+        f"{summary['passed']}/{summary['total']} passed in {report['wall_time_s']}s "
+        f"(serial sum {report['serial_time_s']}s, {summary['saved_s']}s saved by condition waits) "
+        f"-> {args.output}"
+    )
+
+    if not args.no_history:
+        run_id = history.record_run(report, args.history)
+        print(f"Recorded as run {run_id} in {args.history} (python testsprite_tests/history.py timeline --run {run_id})")
+
+    # Keyed by file stem: TC001..TC010 each have two generated variants.
+    current = {Path(r["file"]).stem: r["metrics"] for r in report["scenarios"] if "metrics" in r}
+    args.metrics_output.parent.mkdir(parents=True, exist_ok=True)
+    args.metrics_output.write_text(json.dumps(current, indent=2, sort_keys=True), encoding="utf-8")
+
+    regressions = []
+    if args.update_baseline:
+        metrics.save_baseline(current, args.baseline)
+        print(f"Metrics baseline updated -> {args.baseline}")
+    else:
+        baseline = metrics.load_baseline(args.baseline)
+        if baseline is None:
+            print(f"No metrics baseline at {args.baseline}; run with --update-baseline to create one.")
+        else:
+            regressions = metrics.compare(current, baseline, args.tolerance)
+            for r in regressions:
+                print(
+                    f"[SLOWER] {r['scenario']} {r['metric']}: {r['current']} "
+                    f"(baseline {r['baseline']}, limit {r['limit']})"
+                )
+
+    passed = summary["passed"] == summary["total"]
+    return 0 if passed and not regressions else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""Change-aware scenario selection.
+
+``tmp/code_summary.json`` maps each feature ("Menu System", "Cart &
+Checkout", ...) to its source files. Combined with a scan of the TS/TSX
+imports, a git diff is turned into the set of affected features, and from
+there into the scenarios that exercise them (``SCENARIO_FEATURES``):
+
+    python testsprite_tests/selection.py                 # working tree vs HEAD
+    python testsprite_tests/selection.py --base main     # branch vs main
+    python testsprite_tests/run_suite.py --changed --base main
+
+A changed file affects a feature when the feature's files import it,
+directly or transitively. Some changes cannot be attributed to a feature
+and select the whole suite: the composition roots (App.tsx, index.tsx),
+build configuration, the database schema, and the suite's own plumbing.
+Edited TC files select themselves.
+"""
+
+import argparse
+import ast
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+SUITE_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SUITE_DIR.parent
+CODE_SUMMARY = SUITE_DIR / "tmp" / "code_summary.json"
+
+SOURCE_SUFFIXES = (".ts", ".tsx")
+IMPORT_RE = re.compile(r"""(?:import|export)\s+(?:[^'";]*?\sfrom\s+)?['"](\.{1,2}/[^'"]+)['"]""")
+SKIPPED_DIRS = {"node_modules", "dist", "testsprite_tests", ".git"}
+
+# Changes here can affect every screen, so they select the whole suite.
+FULL_RUN_FILES = {
+    "App.tsx",
+    "index.tsx",
+    "index.html",
+    "index.css",
+    "package.json",
+    "package-lock.json",
+    "vite.config.ts",
+    "tsconfig.json",
+    "tailwind.config.js",
+    "postcss.config.js",
+    "supabase_schema.sql",
+}
+FULL_RUN_PREFIXES = ("supabase/",)
+
+ALL_FEATURES = "*"
+
+# Features each scenario exercises, keyed by TC file stem.
+SCENARIO_FEATURES = {
+    "TC001_Client_can_browse_menu_without_authentication": ["Menu System"],
+    "TC001_Cliente_puede_realizar_pedidos_sin_autenticacin": ["Menu System", "Cart & Checkout"],
+    "TC002_Client_can_add_items_to_cart_and_place_order_without_login": ["Menu System", "Cart & Checkout"],
+    "TC003_Empleado_actualiza_estado_de_pedido": ["Authentication & RBAC", "Order Management (Staff/Admin)"],
+    "TC003_Guest_users_cannot_access_employee_or_admin_dashboards": ["Authentication & RBAC"],
+    "TC004_Admin_puede_crear_editar_y_eliminar_productos": ["Authentication & RBAC", "Product Management (Admin)"],
+    "TC004_Employee_login_success_and_access_to_order_management": [
+        "Authentication & RBAC", "Order Management (Staff/Admin)",
+    ],
+    "TC005_Admin_gestiona_usuarios_empleados": ["Authentication & RBAC", "Employee Management (Admin)"],
+    "TC005_Employee_updates_order_status_workflow": ["Authentication & RBAC", "Order Management (Staff/Admin)"],
+    "TC006_Admin_full_access_to_orders_products_and_user_management": [
+        "Authentication & RBAC",
+        "Order Management (Staff/Admin)",
+        "Product Management (Admin)",
+        "Employee Management (Admin)",
+    ],
+    "TC006_Control_de_acceso_basado_en_roles___Validacin_frontend_y_backend": ["Authentication & RBAC"],
+    "TC007_Role_Based_Access_Control_RBAC_enforcement_on_backend": ["Authentication & RBAC"],
+    "TC007_Validacin_de_formatos_y_manejo_de_errores_en_pedidos_pblicos": ["Menu System", "Cart & Checkout"],
+    "TC008_Autenticacin_segura_con_Supabase_Auth_para_Empleados_y_Admins": ["Authentication & RBAC"],
+    "TC008_Currency_formatting_utility_correctness": ["Menu System", "Cart & Checkout"],
+    "TC009_Frontend_attempts_to_access_unauthorized_pages_are_blocked": ["Authentication & RBAC"],
+    "TC009_Separacin_clara_entre_vistas_pblicas_y_privadas___prueba_end_to_end": [
+        "Authentication & RBAC", "Menu System",
+    ],
+    "TC010_Error_handling_for_authentication_failures": ["Authentication & RBAC"],
+    "TC010_Verificacin_del_cdigo_legible_reutilizable_y_escalable_orientado_a_roles": [ALL_FEATURES],
+    "TC011_Order_placement_handles_edge_cases_and_validations": ["Menu System", "Cart & Checkout"],
+    "TC012_Admin_creates_and_modifies_employee_accounts_with_validation": [
+        "Authentication & RBAC", "Employee Management (Admin)",
+    ],
+}
+
+
+def load_features(path=CODE_SUMMARY):
+    """Return ``{feature name: [repo-relative files]}`` from the code summary."""
+    summary = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {feature["name"]: feature["files"] for feature in summary["features"]}
+
+
+# --- Dependency scans ---
+
+def resolve_import(importer, specifier, known):
+    base = (Path(importer).parent / specifier).as_posix()
+    parts = []
+    for part in base.split("/"):
+        if part == "..":
+            parts.pop()
+        elif part not in (".", ""):
+            parts.append(part)
+    base = "/".join(parts)
+    for candidate in (base, *(base + s for s in SOURCE_SUFFIXES), *(f"{base}/index{s}" for s in SOURCE_SUFFIXES)):
+        if candidate in known:
+            return candidate
+    return None
+
+
+def source_imports(root=REPO_ROOT):
+    """Map every TS/TSX file to the repo files it imports."""
+    files = {
+        p.relative_to(root).as_posix(): p
+        for p in root.rglob("*")
+        if p.suffix in SOURCE_SUFFIXES and not SKIPPED_DIRS.intersection(p.relative_to(root).parts)
+    }
+    graph = {}
+    for name, path in files.items():
+        text = path.read_text(encoding="utf-8", errors="replace")
+        graph[name] = {
+            target for spec in IMPORT_RE.findall(text) if (target := resolve_import(name, spec, files))
+        }
+    return graph
+
+
+def closure(files, graph, stop=FULL_RUN_FILES):
+    """Every file reachable from ``files`` through imports, not expanding ``stop``."""
+    seen, pending = set(), list(files)
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        if name not in stop:
+            pending.extend(graph.get(name, ()))
+    return seen
+
+
+def suite_modules(suite_dir=SUITE_DIR):
+    """Repo-relative paths of the Python modules the suite runner loads."""
+    local = {p.stem: p for p in suite_dir.glob("*.py")}
+    packages = {p.name: p for p in suite_dir.iterdir() if (p / "__init__.py").exists()}
+    pending = [suite_dir / "run_suite.py", *suite_dir.glob("TC*.py")]
+    seen = set()
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            names = []
+            if isinstance(node, ast.Import):
+                names = [alias.name.split(".")[0] for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module.split(".")[0]]
+            for name in names:
+                if name in local:
+                    pending.append(local[name])
+                elif name in packages:
+                    pending.extend(packages[name].glob("*.py"))
+                    seen.update(p for p in packages[name].iterdir() if p.suffix != ".py" and p.is_file())
+    return {p.relative_to(REPO_ROOT).as_posix() for p in seen if not p.name.startswith("TC")}
+
+
+# --- Selection ---
+
+def changed_files(base="HEAD"):
+    """Files changed relative to ``base``, including untracked ones."""
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.split("\n")
+
+    files = set(git("diff", "--name-only", base)) | set(git("ls-files", "--others", "--exclude-standard"))
+    return sorted(f for f in files if f)
+
+
+def select(changed, scenarios, features=None, graph=None):
+    """Return ``(selected stems, reasons)`` for the changed files.
+
+    ``reasons`` maps each selected stem to the changes that selected it;
+    ``None`` for the selected stems means every scenario must run.
+    """
+    features = load_features() if features is None else features
+    graph = source_imports() if graph is None else graph
+    suite = suite_modules()
+    feature_files = {name: closure(files, graph) for name, files in features.items()}
+
+    reasons = {}
+
+    def pick(stem, why):
+        reasons.setdefault(stem, []).append(why)
+
+    full_run = []
+    for path in changed:
+        if path in FULL_RUN_FILES or path.startswith(FULL_RUN_PREFIXES) or path in suite:
+            full_run.append(path)
+            continue
+        name = Path(path).name
+        if path.startswith("testsprite_tests/") and name.startswith("TC") and name.endswith(".py"):
+            if Path(path).stem in scenarios:
+                pick(Path(path).stem, path)
+            continue
+        affected = [feature for feature, files in feature_files.items() if path in files]
+        for stem in scenarios:
+            covered = SCENARIO_FEATURES.get(stem, [ALL_FEATURES])
+            hits = [f for f in affected if f in covered or ALL_FEATURES in covered]
+            if hits:
+                pick(stem, f"{path} ({', '.join(hits)})")
+
+    if full_run:
+        return None, {"*": full_run}
+    return sorted(reasons), reasons
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base", default="HEAD", help="Git revision to diff against")
+    parser.add_argument("files", nargs="*", help="Changed files to use instead of the git diff")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    changed = args.files or changed_files(args.base)
+    scenarios = [p.stem for p in sorted(SUITE_DIR.glob("TC*.py"))]
+    selected, reasons = select(changed, scenarios)
+
+    if selected is None:
+        print(f"Full run; these changes affect every scenario: {', '.join(reasons['*'])}")
+        return 0
+    if not selected:
+        print("No scenario is affected by the changes.")
+        return 0
+    for stem in selected:
+        print(f"{stem}\n    <- {'; '.join(reasons[stem])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+"""Latency summaries shared by the benchmark tools."""
+
+import math
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of ``values`` (0 < p <= 100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies_ms):
+    """Return count, mean, p50/p95/p99 and max of a list of latencies."""
+    if not latencies_ms:
+        return {"count": 0, "mean_ms": None, "p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    return {
+        "count": len(latencies_ms),
+        "mean_ms": round(sum(latencies_ms) / len(latencies_ms), 2),
+        "p50_ms": round(percentile(latencies_ms, 50), 2),
+        "p95_ms": round(percentile(latencies_ms, 95), 2),
+        "p99_ms": round(percentile(latencies_ms, 99), 2),
+        "max_ms": round(max(latencies_ms), 2),
+    }
@@ -0,0 +1,209 @@
+"""Condition-based waits for the TestSprite scenarios.
+
+The generated scripts slept a fixed ``page.wait_for_timeout(3000)`` before
+every action and ``asyncio.sleep(3..5)`` after navigations. ``Steps`` waits
+on real readiness signals instead:
+
+* the element is actionable (Playwright's own auto-wait on click/fill),
+* no Supabase REST/Auth/Storage request is in flight for a short quiet window,
+* a realtime ``postgres_changes`` message has arrived.
+
+Each step also records its target, start offset, duration and the fixed
+wait it replaces, so the suite runner can report how much wall time every
+scenario saved and keep step timelines in the history store.
+"""
+
+import asyncio
+import contextlib
+import json
+import re
+import time
+
+import harness
+
+ACTION_TIMEOUT_MS = 5000
+LEGACY_ACTION_WAIT_MS = 3000
+LEGACY_SETTLE_MS = 3000
+LEGACY_FINISH_MS = 5000
+
+SUPABASE_PATHS = ("/rest/v1/", "/auth/v1/", "/storage/v1/")
+REALTIME_PATH = "/realtime/v1/websocket"
+
+
+def is_supabase_request(url):
+    return any(path in url for path in SUPABASE_PATHS)
+
+
+def realtime_event(frame):
+    """Return the Phoenix event name of a realtime frame, if it has one."""
+    if isinstance(frame, bytes):
+        return None
+    try:
+        message = json.loads(frame)
+    except ValueError:
+        return None
+    # realtime-js speaks either the object (1.0.0) or array (2.0.0) format
+    if isinstance(message, dict):
+        return message.get("event")
+    if isinstance(message, list) and len(message) == 5:
+        return message[3]
+    return None
+
+
+def describe(locator):
+    """Return the selector a Playwright locator was built from."""
+    match = re.search(r"selector='(.*)'>?$", repr(locator))
+    return match.group(1) if match else repr(locator)
+
+
+class Steps:
+    """Wait helpers bound to one browser context."""
+
+    def __init__(self, context, quiet_ms=250, idle_timeout_ms=10000):
+        self.context = context
+        self.quiet_ms = quiet_ms
+        self.idle_timeout_ms = idle_timeout_ms
+        self.records = []
+
+        self._created = time.perf_counter()
+        self._navigations = {}
+        self._inflight = set()
+        self._last_activity = time.perf_counter()
+        self._realtime_count = 0
+        self._realtime_changed = asyncio.Event()
+
+        context.on("request", self._on_request)
+        context.on("requestfinished", self._on_request_done)
+        context.on("requestfailed", self._on_request_done)
+        context.on("page", self._watch_page)
+        for page in context.pages:
+            self._watch_page(page)
+
+        harness.attach("steps", self)
+
+    # --- Event tracking ---
+
+    def _on_request(self, request):
+        if is_supabase_request(request.url):
+            self._inflight.add(request)
+            self._last_activity = time.perf_counter()
+
+    def _on_request_done(self, request):
+        if request in self._inflight:
+            self._inflight.discard(request)
+            self._last_activity = time.perf_counter()
+
+    def _watch_page(self, page):
+        page.on("websocket", self._watch_websocket)
+        page.on("framenavigated", self._on_navigated)
+        page.on("load", self._on_load)
+
+    def _on_navigated(self, frame):
+        if frame.parent_frame is None:
+            self._navigations[frame.page] = (frame.url, time.perf_counter())
+
+    def _on_load(self, page):
+        url, started = self._navigations.pop(page, (page.url, None))
+        if started is not None:
+            self._record("navigate", 0, started, target=url)
+
+    def _watch_websocket(self, websocket):
+        if REALTIME_PATH in websocket.url:
+            websocket.on("framereceived", self._on_realtime_frame)
+
+    def _on_realtime_frame(self, frame):
+        if realtime_event(frame) == "postgres_changes":
+            self._realtime_count += 1
+            self._realtime_changed.set()
+
+    # --- Readiness signals ---
+
+    async def supabase_idle(self, quiet_ms=None, timeout_ms=None):
+        """Wait until no Supabase request has been in flight for ``quiet_ms``.
+
+        Returns False instead of raising when ``timeout_ms`` elapses, so a
+        long-polling request degrades to the old fixed wait rather than
+        failing the scenario.
+        """
+        quiet = (self.quiet_ms if quiet_ms is None else quiet_ms) / 1000
+        deadline = time.perf_counter() + (self.idle_timeout_ms if timeout_ms is None else timeout_ms) / 1000
+
+        while time.perf_counter() < deadline:
+            if not self._inflight and time.perf_counter() - self._last_activity >= quiet:
+                return True
+            await asyncio.sleep(0.05)
+        return False
+
+    def realtime_mark(self):
+        """Snapshot the realtime counter to wait for messages after this point."""
+        return self._realtime_count
+
+    async def realtime_message(self, since=None, timeout_ms=ACTION_TIMEOUT_MS):
+        """Wait for a ``postgres_changes`` message newer than ``since``."""
+        since = self._realtime_count if since is None else since
+        async with self._step("realtime", 0):
+            deadline = time.perf_counter() + timeout_ms / 1000
+            while self._realtime_count <= since:
+                self._realtime_changed.clear()
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise AssertionError(f"No realtime message received within {timeout_ms}ms")
+                try:
+                    await asyncio.wait_for(self._realtime_changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+    # --- Actions ---
+
+    async def click(self, locator, timeout=ACTION_TIMEOUT_MS):
+        async with self._step("click", LEGACY_ACTION_WAIT_MS, describe(locator)):
+            await locator.click(timeout=timeout)
+            await self.supabase_idle()
+
+    async def fill(self, locator, value, timeout=ACTION_TIMEOUT_MS):
+        async with self._step("fill", LEGACY_ACTION_WAIT_MS, describe(locator)):
+            await locator.fill(value, timeout=timeout)
+
+    async def settle(self, legacy_ms=LEGACY_SETTLE_MS):
+        """Replace a fixed sleep after a navigation with a network-idle wait."""
+        async with self._step("settle", legacy_ms):
+            await self.supabase_idle()
+
+    async def finish(self):
+        """Let pending Supabase calls drain before the context closes."""
+        async with self._step("finish", LEGACY_FINISH_MS):
+            await self.supabase_idle()
+
+    # --- Reporting ---
+
+    @contextlib.asynccontextmanager
+    async def _step(self, kind, legacy_ms, target=None):
+        started = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self._record(kind, legacy_ms, started, target, ok=False)
+            raise
+        self._record(kind, legacy_ms, started, target)
+
+    def _record(self, kind, legacy_ms, started, target=None, ok=True):
+        self.records.append({
+            "step": kind,
+            "target": target,
+            "offset_ms": round((started - self._created) * 1000, 1),
+            "legacy_wait_ms": legacy_ms,
+            "waited_ms": round((time.perf_counter() - started) * 1000, 1),
+            "ok": ok,
+        })
+
+    def summary(self):
+        # Page loads are timeline entries, not waits the scenario chose.
+        waits = [r for r in self.records if r["step"] != "navigate"]
+        legacy = sum(r["legacy_wait_ms"] for r in waits)
+        waited = sum(r["waited_ms"] for r in waits)
+        return {
+            "steps": len(waits),
+            "legacy_wait_ms": legacy,
+            "waited_ms": round(waited, 1),
+            "saved_ms": round(legacy - waited, 1),
+        }
@@ -16,15 +16,72 @@ export interface CartItem extends Product {
   quantity: number;
 }
 
+// Línea de un pedido (tabla order_items): nombre y precio congelados al comprar
+export interface OrderItem {
+  product_id: string | null; // null si el producto se borró después
+  name: string;
+  price: number;
+  quantity: number;
+}
+
 export interface Order {
   id: string;
   customer_name: string;
   customer_phone: string;
   address: string;
-  items: CartItem[];
+  items: OrderItem[];
   total: number;
   status: OrderStatus;
   created_at: string;
+  updated_at?: string; // Lo mantiene un trigger en la base
+}
+
+// Lo que manda el checkout: precios, disponibilidad y total los resuelve place_order en la base
+export interface NewOrder extends Pick<Order, 'customer_name' | 'customer_phone' | 'address'> {
+  items: CartItem[];
+}
+
+export interface PlacedOrder {
+  id: string;
+  total: number;
+}
+
+export interface OrderItemSummary {
+  name: string;
+  quantity: number;
+}
+
+// Fila de orders tal como llega por Realtime: las líneas viven en order_items
+export type OrderRow = Omit<Order, 'items'>;
+
+export interface OrderSummary extends OrderRow {
+  items: OrderItemSummary[];
+}
+
+// Menú publicado en Storage (ver supabase/migrations): productos activos por categoría
+export interface MenuCategory {
+  name: string;
+  products: Product[];
+}
+
+export interface PublishedMenu {
+  version: number | null; // La de catalog_versions al publicar
+  published_at: string;
+  categories: MenuCategory[];
+}
+
+// Fila de la tabla de productos; la descripción se carga al editar
+export type ProductSummary = Pick<Product, 'id' | 'name' | 'price' | 'category' | 'image_url'>;
+
+// Posición de la última fila de una página: (created_at, id) desempata pedidos del mismo instante
+export interface OrderCursor {
+  created_at: string;
+  id: string;
+}
+
+export interface OrderPage {
+  orders: OrderSummary[];
+  nextCursor: OrderCursor | null; // null cuando no quedan pedidos más antiguos
 }
 
 export interface UserProfile {
@@ -37,4 +94,31 @@ export interface AuthState {
   user: UserProfile | null;
   loading: boolean;
   isAuthenticated: boolean;
-}
\ No newline at end of file
+}
+// Reportes: lo arma sales_report a partir de las tablas resumen (ver supabase/migrations)
+export interface DailySales {
+  day: string; // YYYY-MM-DD
+  orders: number;
+  revenue: number;
+}
+
+export interface HourlySales {
+  hour: number; // 0-23, sumando todos los días del período
+  orders: number;
+  revenue: number;
+}
+
+export interface ProductSales {
+  name: string;
+  units: number;
+  revenue: number;
+}
+
+export interface SalesReport {
+  from: string;
+  to: string;
+  timezone: string; // public.sales_timezone(): días y horas son locales a esta zona
+  daily: DailySales[]; // Solo los días con ventas
+  hourly: HourlySales[];
+  products: ProductSales[]; // Los más vendidos primero
+}